@@ -1,14 +1,23 @@
+import hashlib
 import json
 import logging
 import os
 import re
-import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 import requests
 from dotenv import load_dotenv
 
+from filters.lexical_news_ranker import LexicalNewsRanker
 from models.news_article import NewsArticle
+from utils.cassette_player import CassettePlayer
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.enums.cassette_mode import CassetteMode
+from utils.enums.data_kind import DataKind
+from utils.pooled_session import PooledSession
+from utils.rate_limiter import RateLimiter
+from utils.response_cache import ResponseCache
 from utils.singleton_meta import SingletonMeta
 
 load_dotenv()
@@ -20,21 +29,73 @@ class AiService(metaclass=SingletonMeta):
     """Class responsible for communicating with external AI API.
 
     Chosen AI API is: GROQ, free model llama-3.1-8b-instant.
+    When the CassettePlayer replays, requests go to its StandInServer and no API key is needed.
+    Rankings are kept in the ResponseCache, so rerunning a report for the same news asks the model nothing.
+
+    Requests go through a PooledSession that keeps as many connections alive as batches are sent at once.
+    GROQ_BASE_URL environment variable points the service at any other OpenAI compatible server, for example
+    a local one for benchmarking, which needs no API key. GROQ_CONNECT_TIMEOUT and GROQ_READ_TIMEOUT
+    override the timeouts of every request, in seconds.
     """
 
-    GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
+    GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+    CHAT_PATH = "/chat/completions"
+    GROQ_API_URL = GROQ_BASE_URL + CHAT_PATH
     MODEL = "llama-3.1-8b-instant"
+    PROMPT_VERSION = 3
 
-    BATCH_SIZE = 50
+    TOKEN_BUDGET = 3000
     MAX_RETRIES = 3
+    CHARS_PER_TOKEN = 4
+    CONNECT_TIMEOUT = 5.0
+    READ_TIMEOUT = 20.0
 
     def __init__(self):
         logger.debug("AI Service initialized.")
         self.__api_key = os.getenv("GROQ_API_KEY")
-
-        if not self.__api_key:
+        self.__player = CassettePlayer.get_instance()
+        base_url = (os.getenv("GROQ_BASE_URL") or self.GROQ_BASE_URL).rstrip("/")
+        self.__api_url = base_url + self.CHAT_PATH
+        self.__host = urlsplit(self.__api_url).hostname or RateLimiter.GROQ_HOST
+
+        if (
+            not self.__api_key
+            and self.__player.mode is not CassetteMode.REPLAY
+            and self.__api_url == self.GROQ_API_URL
+        ):
             logger.error("GROQ_API_KEY not found in environment")
             raise RuntimeError("GROQ_API_KEY not found in environment")
+        self.__rate_limiter = RateLimiter.get_instance()
+        self.__circuit_breaker = CircuitBreaker.get_instance()
+        self.__response_cache = ResponseCache.get_instance()
+        self.__lexical_ranker = LexicalNewsRanker()
+        self.__session = PooledSession(
+            pool_size=self.__rate_limiter.capacity(self.__host),
+            timeout=(
+                self.__timeout_of("GROQ_CONNECT_TIMEOUT", self.CONNECT_TIMEOUT),
+                self.__timeout_of("GROQ_READ_TIMEOUT", self.READ_TIMEOUT),
+            ),
+        )
+
+    @property
+    def api_url(self) -> str:
+        return self.__api_url
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return self.__session.timeout
+
+    def latency_statistics(self) -> dict[str, tuple[float, float]]:
+        """Return mean and maximum seconds of connecting, time to first byte and total time of AI requests.
+
+        Returns:
+            dict[str, tuple[float, float]]: Keys are "connect", "ttfb" and "total", empty if nothing was sent yet.
+        """
+        return self.__session.statistics()
+
+    def reset_statistics(self):
+        """Forget latencies of all AI requests sent so far."""
+        self.__session.reset_statistics()
 
     def filter_news(
         self, news: list[NewsArticle], top_k: int = 10
@@ -53,36 +114,158 @@ class AiService(metaclass=SingletonMeta):
         if len(news) <= top_k:
             return news
 
-        summary_map = {n.url: n.summary for n in news}
         try:
-            if len(news) <= self.BATCH_SIZE:
-                prompt = self.__build_prompt(news, top_k)
-                response = self.__call_groq(prompt)
-                return self.__parse_response(response, summary_map)
+            batches = self.__pack(news, top_k)
+            if len(batches) == 1:
+                return self.__rank(news, top_k, reuse_scores=False)
 
             logger.debug("Entering batch processing mode for AI filtering.")
-            finalists = []
-            for i in range(0, len(news), self.BATCH_SIZE):
-                batch = news[i : i + self.BATCH_SIZE]
-                prompt = self.__build_prompt(batch, top_k)
-                response = self.__call_groq(prompt)
-                parsed = self.__parse_response(response, summary_map)
-                finalists.extend(parsed)
-                time.sleep(20)
-
-            time.sleep(20)
-            prompt = self.__build_prompt(finalists, top_k)
-            response = self.__call_groq(prompt)
-
-            return self.__parse_response(response, summary_map)
+            return self.__tournament(batches, top_k)
 
         except Exception as e:
             logger.warning(f"AI filtering failed: {e}")
             return self.__fallback(news, top_k)
 
+        finally:
+            self.__log_latency()
+
+    def __tournament(
+        self, batches: list[list[NewsArticle]], top_k: int
+    ) -> list[NewsArticle]:
+        """Rank news in rounds of parallel batches, until the finalists fit in one last batch.
+
+        Every batch keeps at most {top_k} of its articles, so each round shrinks the candidates, and the
+        number of rounds grows only with the logarithm of the number of batches. Batches of a round are
+        sent at the same time, as many as the RateLimiter lets through at once for GROQ. Batches of the
+        first round may be ranked by stored article scores, finalists are always compared by the model itself.
+
+        Args:
+            batches (list[list[NewsArticle]]): All news articles to filter, packed into batches.
+            top_k (int): Number of news that are left after filtering.
+
+        Returns:
+            list[NewsArticle]: List of articles most likely to affect the market.
+        """
+        workers = self.__rate_limiter.capacity(self.__host)
+        reuse_scores = True
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai") as pool:
+            while len(batches) > 1:
+                logger.debug(f"Ranking news in {len(batches)} parallel batches.")
+                rounds = pool.map(
+                    lambda batch, reuse=reuse_scores: self.__rank(batch, top_k, reuse)[
+                        :top_k
+                    ],
+                    batches,
+                )
+                candidates = [article for ranked in rounds for article in ranked]
+                batches = self.__pack(candidates, top_k)
+                reuse_scores = False
+        return self.__rank(batches[0] if batches else [], top_k, reuse_scores=False)
+
+    def __pack(self, news: list[NewsArticle], top_k: int) -> list[list[NewsArticle]]:
+        """Split news into batches whose prompts fit into TOKEN_BUDGET tokens, keeping their order.
+
+        A batch that isn't the last one always gets at least 2 * {top_k} articles, even over the budget,
+        so every round of the tournament keeps shrinking.
+        """
+        budget = self.TOKEN_BUDGET - self.__estimate_tokens(
+            self.__build_prompt([], top_k)
+        )
+        batches: list[list[NewsArticle]] = []
+        batch: list[NewsArticle] = []
+        used = 0
+        for article in news:
+            tokens = self.__estimate_tokens(self.__encode(len(batch), article)) + 1
+            if batch and used + tokens > budget and len(batch) >= 2 * top_k:
+                batches.append(batch)
+                batch, used = [], 0
+            batch.append(article)
+            used += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def __rank(
+        self, news: list[NewsArticle], top_k: int, reuse_scores: bool
+    ) -> list[NewsArticle]:
+        """Return the {top_k} most important articles of a single batch.
+
+        A batch ranked before is read from the ResponseCache. With reuse_scores, a batch whose articles all
+        got an impact score in earlier rankings is ranked by those scores. Only other batches are sent to
+        the AI model, and the scores of their articles are stored for later batches that overlap with them.
+        """
+        key = self.__ranking_key(news, top_k)
+        found, ranked = self.__response_cache.get(DataKind.AI_RANKING, key)
+        if found:
+            return ranked
+
+        ranked = self.__rank_by_scores(news, top_k) if reuse_scores else None
+        if ranked is None:
+            prompt = self.__build_prompt(news, top_k)
+            response = self.__call_groq(prompt)
+            ranked = self.__parse_response(response, news)
+            self.__store_scores(news, self.__extract_json(response))
+        self.__response_cache.put(DataKind.AI_RANKING, key, ranked)
+        return ranked
+
+    def __rank_by_scores(
+        self, news: list[NewsArticle], top_k: int
+    ) -> list[NewsArticle] | None:
+        """Return the {top_k} articles with the highest stored scores, or None if any article has no score."""
+        scores = []
+        for article in news:
+            found, score = self.__response_cache.get(
+                DataKind.AI_SCORE, self.__score_key(article.url)
+            )
+            if not found:
+                return None
+            scores.append(score)
+        order = sorted(range(len(news)), key=lambda i: scores[i], reverse=True)
+        return [news[i] for i in order[:top_k]]
+
+    def __store_scores(self, news: list[NewsArticle], picked: list | None):
+        """Store an impact score for every article of a ranked batch.
+
+        Picked articles get the impact the model gave them. Articles that weren't picked ranked below all
+        picked ones, so they get one point less than the lowest picked impact. Nothing is stored if the
+        model left out any impact, since scores have to be comparable between batches.
+        """
+        impacts = {}
+        for item in picked or []:
+            article = self.__article_of(item, news)
+            if article is None:
+                continue
+            impact = item.get("impact") if isinstance(item, dict) else None
+            if not isinstance(impact, (int, float)) or isinstance(impact, bool):
+                return
+            impacts[article.url] = float(impact)
+        if not impacts:
+            return
+        not_picked = max(0.0, min(impacts.values()) - 1)
+        for article in news:
+            self.__response_cache.put(
+                DataKind.AI_SCORE,
+                self.__score_key(article.url),
+                impacts.get(article.url, not_picked),
+            )
+
+    def __ranking_key(self, news: list[NewsArticle], top_k: int) -> str:
+        """Return a key identifying a ranking by the model, prompt version, top_k and the set of article URLs."""
+        content = json.dumps(
+            [self.MODEL, self.PROMPT_VERSION, top_k, sorted(a.url for a in news)]
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def __score_key(self, url: str) -> str:
+        """Return a key identifying the impact score of an article given by the model and prompt version."""
+        return json.dumps([self.MODEL, self.PROMPT_VERSION, url])
+
     def __build_prompt(self, news: list[NewsArticle], top_k: int) -> str:
         """Builds the prompt sent to the AI model.
 
+        Articles are listed one per line with a short ID, and the model answers only with IDs and
+        impacts, so neither URLs nor timestamps are sent back and forth.
+
         Args:
             news (list[NewsArticle]): List of news articles to filter.
             top_k (int): Number of news that are left after filtering.
@@ -91,42 +274,46 @@ class AiService(metaclass=SingletonMeta):
             str: Prompt string.
         """
         logger.debug("Building prompt for AI model.")
-        news_dicts = []
-
-        for article in news:
-            news_dicts.append(
-                {
-                    "pubTime": article.pub_time.isoformat(),
-                    "title": article.title,
-                    "url": article.url,
-                    "ticker": article.ticker,
-                }
-            )
+        lines = "\n".join(self.__encode(i, article) for i, article in enumerate(news))
 
         prompt = f"""
 You are a financial markets AI.
 
 Select the {top_k} news articles MOST likely to impact stock prices.
-Return ONLY valid JSON array in the same format that is given to you.
-
-Each object must contain exactly:
-- pubTime
-- title
-- url
-- ticker
+Articles are given one per line as: id|ticker|date|title.
+Return ONLY a valid JSON array of objects, most important first, each with exactly:
+- id (the id of the article)
+- impact (number from 0 to 100, how strongly the news could move the stock price)
 
 Return exactly {top_k} articles if {top_k} are available.
 If fewer than {top_k} articles are provided, return all of them.
 
 Articles:
-{json.dumps(news_dicts)}
+{lines}
 """.strip()
 
         return prompt
 
+    @staticmethod
+    def __encode(article_id: int, article: NewsArticle) -> str:
+        """Return the prompt line of an article."""
+        title = " ".join(article.title.split())
+        return f"{article_id}|{article.ticker}|{article.pub_time:%Y-%m-%d}|{title}"
+
+    def __estimate_tokens(self, text: str) -> int:
+        """Return a rough number of tokens the text takes in a prompt."""
+        return len(text) // self.CHARS_PER_TOKEN + 1
+
     def __call_groq(self, prompt: str) -> str:
         """Send a request to an AI model.
 
+        Requests are sent through the PooledSession, so they reuse kept alive connections.
+        Requests are paced by the RateLimiter. A failed request lowers the allowed rate, so a retry
+        waits for the limiter instead of a fixed sleep, and a 429 answer waits for its Retry-After.
+        Rate limit headers of every answer are passed to the limiter, so once GROQ says its requests or
+        tokens are used up, later requests wait until they reset instead of being throttled.
+        While the CircuitBreaker of GROQ is open, no request is sent and the call fails right away.
+
         Args:
             prompt (str): Prompt to be sent.
 
@@ -151,25 +338,91 @@ Articles:
             "Content-Type": "application/json",
         }
 
+        url = self.__player.replay_url(self.__api_url)
         for attempt in range(self.MAX_RETRIES):
-            try:
-                response = requests.post(
-                    self.GROQ_API_URL,
-                    json=payload,
-                    headers=headers,
-                    timeout=(5, 20),
+            if not self.__circuit_breaker.allow(self.__host):
+                raise CircuitOpenError(
+                    "Too many GROQ requests failed, skipping request."
                 )
+            self.__rate_limiter.acquire(self.__host)
+            try:
+                response = self.__session.post(url, json=payload, headers=headers)
 
                 response.raise_for_status()
                 content = response.json()["choices"][0]["message"]["content"]
+                self.__player.store_http(
+                    "POST",
+                    url,
+                    None,
+                    payload,
+                    response.status_code,
+                    response.headers.get("Content-Type"),
+                    response.content,
+                )
+                self.__rate_limiter.report_success(self.__host)
+                self.__circuit_breaker.report_success(self.__host)
+                self.__report_remaining(response.headers, prompt)
                 return content
 
             except requests.RequestException as e:
                 logger.warning(f"GROQ call failed attempt {attempt+1}: {e}")
+                retry_after = None
+                if e.response is not None and e.response.status_code == 429:
+                    retry_after = RateLimiter.parse_retry_after(
+                        e.response.headers.get("retry-after")
+                    )
+                self.__rate_limiter.report_throttled(self.__host, retry_after)
+                self.__circuit_breaker.report_failure(self.__host)
                 if attempt == self.MAX_RETRIES - 1:
                     raise
 
-                time.sleep(2 ** (attempt + 1))
+    def __report_remaining(self, headers, prompt: str):
+        """Pass remaining GROQ requests and tokens from the answer headers to the RateLimiter.
+
+        A next request is expected to need about as many tokens as the prompt that was just sent.
+        """
+        self.__rate_limiter.report_remaining(
+            self.__host,
+            self.__header_number(headers, "x-ratelimit-remaining-requests"),
+            RateLimiter.parse_duration(headers.get("x-ratelimit-reset-requests")),
+        )
+        self.__rate_limiter.report_remaining(
+            self.__host,
+            self.__header_number(headers, "x-ratelimit-remaining-tokens"),
+            RateLimiter.parse_duration(headers.get("x-ratelimit-reset-tokens")),
+            needed=self.__estimate_tokens(prompt),
+        )
+
+    def __log_latency(self):
+        """Log how long AI requests of the session took on average, split into their parts."""
+        statistics = self.__session.statistics()
+        if not statistics:
+            return
+        parts = ", ".join(
+            f"{part} {mean * 1000:.0f}ms (max {maximum * 1000:.0f}ms)"
+            for part, (mean, maximum) in statistics.items()
+        )
+        logger.info(f"AI latency of {self.__session.sent} requests: {parts}.")
+
+    @staticmethod
+    def __timeout_of(name: str, default: float) -> float:
+        """Return a positive timeout in seconds from an environment variable, or default if it isn't set or valid."""
+        value = os.getenv(name)
+        try:
+            timeout = float(value) if value else default
+        except ValueError:
+            logger.warning(f"Invalid {name} {value!r}, using {default}s.")
+            return default
+        return timeout if timeout > 0 else default
+
+    @staticmethod
+    def __header_number(headers, name: str) -> float | None:
+        """Return a numeric header, or None if it is missing or not a number."""
+        value = headers.get(name)
+        try:
+            return float(value) if isinstance(value, str) else None
+        except ValueError:
+            return None
 
     def __extract_json(self, text: str):
         """Extract JSON from the response from AI.
@@ -197,15 +450,17 @@ Articles:
 
         return None
 
-    def __parse_response(self, response: str, summary_map: dict) -> list[NewsArticle]:
-        """Parse the response to a list of NewsArticles, since AI doesn't know about internal data classes.
+    def __parse_response(
+        self, response: str, news: list[NewsArticle]
+    ) -> list[NewsArticle]:
+        """Parse the response to a list of NewsArticles, by mapping IDs the model picked back to the articles.
 
         Args:
             response (str): Response string from the AI model.
-            summary_map (dict): Mapping of url -> summary to restore original summaries.
+            news (list[NewsArticle]): Articles of the batch, in the order their IDs were given.
 
         Returns:
-            list[NewsArticle]: List of NewsArticle objects parsed from the response.
+            list[NewsArticle]: Picked articles in the order of the response, unknown and repeated IDs are skipped.
         """
         data = self.__extract_json(response)
         if data is None:
@@ -213,36 +468,24 @@ Articles:
 
         articles: list[NewsArticle] = []
         for item in data:
-            if not isinstance(item, dict):
-                continue
-
-            url = item.get("url")
-
-            if url not in summary_map:
-                continue
-
-            pub_time = item.get("pubTime")
-
-            if isinstance(pub_time, str):
-                try:
-                    pub_time = datetime.fromisoformat(pub_time.replace("Z", "+00:00"))
-                except Exception:
-                    pub_time = None
-
-            articles.append(
-                NewsArticle(
-                    title=item.get("title", ""),
-                    summary=summary_map.get(url, ""),
-                    pub_time=pub_time,
-                    url=url,
-                    ticker=item.get("ticker", ""),
-                )
-            )
+            article = self.__article_of(item, news)
+            if article is not None and article not in articles:
+                articles.append(article)
 
         return articles
 
+    @staticmethod
+    def __article_of(item, news: list[NewsArticle]) -> NewsArticle | None:
+        """Return the article an item of the response points to, items are either IDs or objects with an id."""
+        article_id = item.get("id") if isinstance(item, dict) else item
+        if isinstance(article_id, str) and article_id.strip().isdigit():
+            article_id = int(article_id)
+        if not isinstance(article_id, int) or isinstance(article_id, bool):
+            return None
+        return news[article_id] if 0 <= article_id < len(news) else None
+
     def __fallback(self, news: list[NewsArticle], top_k: int) -> list[NewsArticle]:
-        """Return latest top_k articles if groq is not responding.
+        """Return top_k articles ranked locally by the LexicalNewsRanker if groq is not responding.
 
         This exists so the whole app doesn't crash when groq doesn't work.
 
@@ -251,7 +494,7 @@ Articles:
             top_k (int, optional): Number of news that are left after filtering. Defaults to 10.
 
         Returns:
-            list[NewsArticle]: First {top_k} articles from the input list, sorted by publish time descending.
+            list[NewsArticle]: {top_k} articles with the best keyword, recency and company size score.
         """
         logger.warning("Using fallback news selection")
-        return sorted(news, key=lambda x: x.pub_time, reverse=True)[:top_k]
+        return self.__lexical_ranker.rank(news, top_k)
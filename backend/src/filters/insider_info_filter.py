@@ -1,7 +1,10 @@
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta, timezone
+
+import pandas as pd
 
 from models.insider_information import InsiderInformation
+from utils.clock import Clock
 from utils.enums.trade_type import TradeType
 
 logger = logging.getLogger(__name__)
@@ -12,7 +15,9 @@ class InsiderInfoFilter:
 
     def __init__(self, days_behind: int):
         logger.debug("InsiderInfoFilter initialized.")
-        self.__cutoff = datetime.now(timezone.utc) - timedelta(days=days_behind)
+        self.__cutoff = Clock.get_instance().now(timezone.utc) - timedelta(
+            days=days_behind
+        )
 
     def filter_insider_info(
         self, raw_insider_info: list[InsiderInformation]
@@ -29,6 +34,23 @@ class InsiderInfoFilter:
         non_gift_insider_info = self.__filter_by_only_non_gifts(recent_insider_info)
         return non_gift_insider_info
 
+    def filter_insider_transactions(self, transactions: pd.DataFrame) -> pd.DataFrame:
+        """Filter a table of insider trades by leaving out old trades and gifts, in one vectorized pass.
+
+        Args:
+            transactions (pd.DataFrame): Unfiltered trades, with columns "ticker", "value", "type" and "date".
+
+        Returns:
+            pd.DataFrame: Filtered trades with the same columns.
+        """
+        logger.debug("Filtering insider transactions by recency and gifts.")
+        keep = (
+            (transactions["date"] >= pd.Timestamp(self.__cutoff))
+            & (transactions["type"] != TradeType.GIFT.value)
+            & (transactions["value"] != 0)
+        )
+        return transactions[keep]
+
     def __filter_by_recency(
         self, raw_insider_info: list[InsiderInformation]
     ) -> list[InsiderInformation]:
@@ -0,0 +1,123 @@
+import logging
+from datetime import timedelta
+
+import numpy as np
+
+from models.news_article import NewsArticle
+from utils import constants
+from utils.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+
+class LexicalNewsRanker:
+    """Class that ranks news articles locally by their words, without calling any AI model.
+
+    Every keyword from the constants is a term with the weight of its category. Terms found in titles and
+    summaries form a sparse article-term matrix, kept as coordinate arrays, and all scores are computed from
+    it in one vectorized pass:
+
+        score = (1 + title term weights + SUMMARY_WEIGHT * summary term weights) * recency * company size
+
+    Recency halves every RECENCY_HALF_LIFE counted back from the newest article, so scores don't depend on
+    the current time. Company size is taken from the position of the ticker in TICKERS_SP_100, which is
+    ordered by market cap, and adds up to CAP_WEIGHT for the largest company. Rankings are deterministic.
+    """
+
+    CATEGORY_WEIGHTS = (
+        (constants.HARD_EVENT_KEYWORDS, 3.0),
+        (constants.MANAGEMENT_KEYWORDS, 2.5),
+        (constants.FINANCIAL_KEYWORDS, 2.0),
+        (constants.PRODUCT_KEYWORDS, 1.5),
+    )
+    SUMMARY_WEIGHT = 0.5
+    RECENCY_HALF_LIFE = timedelta(days=1)
+    CAP_WEIGHT = 0.5
+
+    def __init__(self):
+        weights: dict[str, float] = {}
+        for keywords, weight in self.CATEGORY_WEIGHTS:
+            for keyword in keywords:
+                weights[keyword] = max(weights.get(keyword, 0.0), weight)
+        terms = list(weights)
+        self.__term_weights = np.array([weights[term] for term in terms])
+        self.__matcher = KeywordMatcher(
+            (term.lower(), i) for i, term in enumerate(terms)
+        )
+        tickers = constants.TICKERS_SP_100
+        self.__cap_weights = {
+            ticker: 1.0 + self.CAP_WEIGHT * (1.0 - rank / len(tickers))
+            for rank, ticker in enumerate(tickers)
+        }
+
+    def score(self, news: list[NewsArticle]) -> np.ndarray:
+        """Return the score of every article, higher is more likely to move stock prices.
+
+        Args:
+            news (list[NewsArticle]): Articles to score.
+
+        Returns:
+            np.ndarray: One score per article, in the order of the articles.
+        """
+        if not news:
+            return np.empty(0)
+        rows, terms, weights = [], [], []
+        for row, article in enumerate(news):
+            for text, weight in (
+                (article.title, 1.0),
+                (article.summary, self.SUMMARY_WEIGHT),
+            ):
+                for term in self.__matcher.find((text or "").lower()):
+                    rows.append(row)
+                    terms.append(term)
+                    weights.append(weight)
+        term_scores = np.bincount(
+            np.asarray(rows, dtype=np.intp),
+            weights=self.__term_weights[np.asarray(terms, dtype=np.intp)]
+            * np.asarray(weights),
+            minlength=len(news),
+        )
+
+        published = np.array([self.__timestamp(article) for article in news])
+        newest = np.nanmax(published) if not np.isnan(published).all() else 0.0
+        ages = np.nan_to_num(newest - published, nan=np.inf)
+        recency = 0.5 ** (ages / self.RECENCY_HALF_LIFE.total_seconds())
+        caps = np.array([self.__cap_weights.get(a.ticker, 1.0) for a in news])
+        return (1.0 + term_scores) * recency * caps
+
+    def rank(self, news: list[NewsArticle], top_k: int) -> list[NewsArticle]:
+        """Return the {top_k} articles with the highest scores, highest first, equal scores in input order.
+
+        Args:
+            news (list[NewsArticle]): Articles to rank.
+            top_k (int): Number of articles to return.
+
+        Returns:
+            list[NewsArticle]: Best scored articles.
+        """
+        order = np.argsort(-self.score(news), kind="stable")[: max(top_k, 0)]
+        return [news[i] for i in order]
+
+    def prune(self, news: list[NewsArticle], keep: int) -> list[NewsArticle]:
+        """Return only the {keep} best scored articles, in their original order.
+
+        Args:
+            news (list[NewsArticle]): Articles to prune.
+            keep (int): Number of articles to keep.
+
+        Returns:
+            list[NewsArticle]: Kept articles.
+        """
+        if len(news) <= keep:
+            return news
+        kept = np.sort(np.argsort(-self.score(news), kind="stable")[: max(keep, 0)])
+        logger.debug(f"Pruned {len(news) - len(kept)} low scored news.")
+        return [news[i] for i in kept]
+
+    @staticmethod
+    def __timestamp(article: NewsArticle) -> float:
+        """Return the publish time in seconds, or NaN if the article has none."""
+        try:
+            return article.pub_time.timestamp()
+        except (AttributeError, OverflowError, OSError, ValueError):
+            return float("nan")
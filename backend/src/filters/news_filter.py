@@ -2,8 +2,13 @@ import logging
 from datetime import datetime, timedelta, timezone
 
 from api.ai_service import AiService
+from filters.lexical_news_ranker import LexicalNewsRanker
 from models.news_article import NewsArticle
 from utils import constants
+from utils.clock import Clock
+from utils.keyword_matcher import KeywordMatcher
+from utils.news_index import NewsIndex
+from utils.sim_hash_index import SimHashIndex
 
 logger = logging.getLogger(__name__)
 
@@ -11,9 +16,14 @@ logger = logging.getLogger(__name__)
 class NewsFilter:
     """Class responsible for filtering all provided news articles."""
 
+    HARD_EVENT = "hard event"
+    AI_CANDIDATES_PER_PICK = 5
+
     def __init__(self):
         logger.debug("NewsFilter initialized.")
-        self.__seen_urls = set()
+        self.__news_index = NewsIndex.get_instance()
+        self.__matcher = self.__build_matcher()
+        self.__lexical_ranker = LexicalNewsRanker()
         self.__ai_service: AiService = AiService.get_instance()
 
     def filter_news(
@@ -21,6 +31,10 @@ class NewsFilter:
     ) -> list[NewsArticle]:
         """Main method that filters all news articles on various criteria.
 
+        Only the AI_CANDIDATES_PER_PICK * top_k articles best scored by the LexicalNewsRanker are sent
+        to the AI, usually few enough for a single request. Returned articles are recorded in the NewsIndex,
+        so later reports don't repeat them.
+
         Args:
             raw_news (list[NewsArticle]): All provided news articles.
             top_k (int): Number of articles to return.
@@ -31,10 +45,14 @@ class NewsFilter:
         """
         logger.debug("Starting news filtering process.")
         no_old_news = self.__filter_by_pub_date(raw_news, days_behind)
-        no_seen_urls = self.__filter_by_seen_urls(no_old_news)
-        with_keywords = self.__filter_by_keywords(no_seen_urls)
-        with_ticker_in_title = self.__filter_by_ticker_in_title(with_keywords)
-        ai_filtered_dicts = self.__ai_service.filter_news(with_ticker_in_title, top_k)
+        not_reported = self.__filter_by_seen(no_old_news)
+        relevant = self.__filter_by_title(not_reported)
+        distinct = self.__filter_near_duplicates(relevant)
+        candidates = self.__lexical_ranker.prune(
+            distinct, self.AI_CANDIDATES_PER_PICK * top_k
+        )
+        ai_filtered_dicts = self.__ai_service.filter_news(candidates, top_k)
+        self.__news_index.record(ai_filtered_dicts)
         return ai_filtered_dicts
 
     def __filter_by_pub_date(
@@ -45,40 +63,62 @@ class NewsFilter:
         cutoff = self.__time_cutoff(days_behind)
         return [article for article in raw_news if article.pub_time >= cutoff]
 
-    def __filter_by_seen_urls(self, raw_news: list[NewsArticle]) -> list[NewsArticle]:
-        """Filter out news articles with same URLs."""
-        logger.debug("Filtering news by seen URLs.")
+    def __filter_by_seen(self, raw_news: list[NewsArticle]) -> list[NewsArticle]:
+        """Filter out news articles with the same URL or title as an earlier one, or already reported before."""
+        logger.debug("Filtering news by seen URLs and titles.")
+        seen_keys = set()
         filtered_news = []
         for article in raw_news:
-            if article.url not in self.__seen_urls:
-                filtered_news.append(article)
-                self.__seen_urls.add(article.url)
+            keys = NewsIndex.keys(article)
+            if seen_keys.intersection(keys) or self.__news_index.is_reported(article):
+                continue
+            filtered_news.append(article)
+            seen_keys.update(keys)
         return filtered_news
 
-    def __filter_by_keywords(self, raw_news: list[NewsArticle]) -> list[NewsArticle]:
-        """Filter out news articles that do not contain hard event keywords."""
-        logger.debug("Filtering news by hard event keywords.")
+    def __filter_by_title(self, raw_news: list[NewsArticle]) -> list[NewsArticle]:
+        """Filter out news articles without a hard event keyword, or without their ticker or company name in title.
+
+        Both are found in one scan of every title by the KeywordMatcher.
+        """
+        logger.debug(
+            "Filtering news by hard event keywords and ticker/company name in title."
+        )
         filtered_news = []
         for article in raw_news:
-            title_l = article.title.lower()
-            if any(keyword in title_l for keyword in constants.HARD_EVENT_KEYWORDS):
+            found = self.__matcher.find(article.title.lower())
+            if self.HARD_EVENT in found and article.ticker in found:
                 filtered_news.append(article)
         return filtered_news
 
-    def __filter_by_ticker_in_title(
+    def __filter_near_duplicates(
         self, raw_news: list[NewsArticle]
     ) -> list[NewsArticle]:
-        """Filter out news articles that do not mention ticker or company name in title."""
-        logger.debug("Filtering news by ticker/company name in title.")
-        filtered_news = []
-        for article in raw_news:
-            ticker_l = article.ticker.lower()
-            company_name_l = constants.TICKER_TO_COMPANY[article.ticker]
-            title_l = article.title.lower()
-            if ticker_l in title_l or company_name_l in title_l:
-                filtered_news.append(article)
+        """Keep only the first article of every group of nearly identical ones, like a story syndicated under more tickers."""
+        logger.debug("Filtering out near-duplicate news.")
+        index = SimHashIndex()
+        filtered_news = [
+            article
+            for article in raw_news
+            if index.add_if_new(f"{article.title} {article.summary or ''}")
+        ]
+        if len(filtered_news) < len(raw_news):
+            logger.debug(
+                f"Collapsed {len(raw_news) - len(filtered_news)} near-duplicate news."
+            )
         return filtered_news
 
+    @classmethod
+    def __build_matcher(cls) -> KeywordMatcher[str]:
+        """Build a matcher that labels hard event keywords with HARD_EVENT, and tickers and company names with the ticker."""
+        keywords = [
+            (keyword, cls.HARD_EVENT) for keyword in constants.HARD_EVENT_KEYWORDS
+        ]
+        for ticker, company_name in constants.TICKER_TO_COMPANY.items():
+            keywords.append((ticker.lower(), ticker))
+            keywords.append((company_name.lower(), ticker))
+        return KeywordMatcher(keywords)
+
     def __time_cutoff(self, days_behind) -> datetime:
         """Return datetime object representing cutoff date."""
-        return datetime.now(timezone.utc) - timedelta(days=days_behind)
+        return Clock.get_instance().now(timezone.utc) - timedelta(days=days_behind)
@@ -19,9 +19,12 @@ class Jinance(metaclass=SingletonMeta):
         logger.debug("Jinance instance created.")
         self._report_builder = ReportBuilderDirector(Language.ENGLISH)
 
-    def generate_report(self) -> str:
+    def generate_report(self, use_cache: bool = True) -> str:
         """Generates a report about all relevant information about the market.
 
+        Args:
+            use_cache (bool): Whether responses stored by earlier runs can be reused. Defaults to True.
+
         Returns:
             str: path to a pdf file that represents generated report.
         """
@@ -29,6 +32,6 @@ class Jinance(metaclass=SingletonMeta):
         path_to_json_file: Path = Path(__file__).parent.joinpath("jinance_config.json")
 
         section_data: list[SectionData] = JsonDecoder.decode(path_to_json_file)
-        pdf_path = self._report_builder.create_pdf_report(section_data)
+        pdf_path = self._report_builder.create_pdf_report(section_data, use_cache)
 
         return pdf_path
@@ -1,13 +1,68 @@
+import argparse
 import logging
+import time
+from contextlib import ExitStack, closing
+from pathlib import Path
 
 from jinance import Jinance
+from utils.cassette import Cassette
+from utils.cassette_player import CassettePlayer
+from utils.stand_in_server import StandInServer
 
 logger = logging.getLogger(__name__)
 
 
 def main():
-    pdf_path = Jinance.get_instance().generate_report()
-    logger.info(f"PDF report written to: {pdf_path}")
+    parser = argparse.ArgumentParser(description="Generate a market report.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="refetch all data instead of reusing responses cached by earlier runs",
+    )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record",
+        type=Path,
+        metavar="CASSETTE",
+        help="store every upstream response in CASSETTE, for replaying the report offline",
+    )
+    cassette.add_argument(
+        "--replay",
+        type=Path,
+        metavar="CASSETTE",
+        help="serve upstream responses from CASSETTE through a local stand-in server",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="delay of every replayed response, defaults to 0",
+    )
+    args = parser.parse_args()
+
+    jinance = Jinance.get_instance()
+    player = CassettePlayer.get_instance()
+    with ExitStack() as stack:
+        if args.record:
+            cassette_file = stack.enter_context(closing(Cassette(args.record)))
+            player.record(cassette_file)
+        elif args.replay:
+            if not args.replay.exists():
+                parser.error(f"cassette {args.replay} doesn't exist")
+            cassette_file = stack.enter_context(closing(Cassette(args.replay)))
+            server = stack.enter_context(StandInServer(cassette_file, args.latency))
+            player.replay(server.url, cassette_file.recorded_at)
+        stack.callback(player.stop)
+
+        started = time.perf_counter()
+        # Recorded and replayed reports must request whole windows, not whatever the local stores miss.
+        pdf_path = jinance.generate_report(
+            use_cache=not (args.no_cache or args.record or args.replay)
+        )
+        logger.info(
+            f"PDF report written to: {pdf_path} in {time.perf_counter() - started:.2f}s"
+        )
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ from models.analyst_recommendation import AnalystRecommendation
 from providers.yahoo.yahoo_analyst_provider import YahooAnalystProvider
 from utils import constants
 from utils.enums.provider_type import ProviderType
+from utils.top_selection import TopSelection
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,9 @@ class AnalystManager:
     ) -> Dict[str, list[AnalystRecommendation]]:
         """Return list with {number_of_companies} top recommendations for buying and selling.
 
+        Recommendations are ranked while they are being fetched, keeping only the best and the worst ones.
+        Equal indexes are ranked in order of the tickers.
+
         Args:
             number_of_companies (int): Number of best and worst companies by analyst index to return.
 
@@ -48,12 +52,11 @@ class AnalystManager:
             f"Fetching analyst recommendations for {number_of_companies} companies."
         )
 
-        recommendations = self.__provider.fetch_analyst_recommendations(self.__tickers)
-        sorted_recommendations = sorted(
-            recommendations, key=lambda x: x.index, reverse=True
+        positions = {ticker: i for i, ticker in enumerate(self.__tickers)}
+        selection = TopSelection(
+            number_of_companies,
+            key=lambda r: (r.index, -positions.get(r.ticker, len(positions))),
         )
+        selection.extend(self.__provider.iter_analyst_recommendations(self.__tickers))
 
-        return {
-            "buy": sorted_recommendations[:number_of_companies],
-            "sell": sorted_recommendations[-number_of_companies:],
-        }
+        return {"buy": selection.largest(), "sell": selection.smallest()}
@@ -1,10 +1,11 @@
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 import utils.constants as constants
 from models.earnings_information import EarningsInformation
 from providers.earnings_provider import EarningsProvider
 from providers.yahoo.yahoo_earnings_provider import YahooEarningsProvider
+from utils.clock import Clock
 from utils.enums.provider_type import ProviderType
 
 logger = logging.getLogger(__name__)
@@ -35,6 +36,9 @@ class EarningsManager:
     ) -> list[EarningsInformation]:
         """Returns specified number of latest upcoming earnings reports.
 
+        Only earnings dates are fetched for all tickers. Full earnings information is then fetched for the
+        soonest {number_of_companies} companies, and for the next ones only if some of those fail.
+
         Args:
             number_of_companies (int): Number of earnings to return.
 
@@ -44,8 +48,18 @@ class EarningsManager:
         logger.debug(
             f"Fetching latest upcoming earnings for {number_of_companies} companies."
         )
-        cutoff = datetime.today().date() + timedelta(days=self.__days_ahead)
-        earnings = self.__provider.fetch_earnings(self.__tickers, cutoff=cutoff)
-        earnings = [e for e in earnings if e is not None and e.date is not None]
+        cutoff = Clock.get_instance().today() + timedelta(days=self.__days_ahead)
+        earnings_dates = self.__provider.fetch_earnings_dates(
+            self.__tickers, cutoff=cutoff
+        )
+        candidates = sorted(earnings_dates, key=earnings_dates.get)
+
+        earnings: list[EarningsInformation] = []
+        while candidates and len(earnings) < number_of_companies:
+            missing = number_of_companies - len(earnings)
+            batch, candidates = candidates[:missing], candidates[missing:]
+            enriched = self.__provider.fetch_earnings(batch, cutoff=cutoff)
+            earnings.extend(e for e in enriched if e is not None and e.date is not None)
+
         earnings.sort(key=lambda e: e.date)
         return earnings[:number_of_companies]
@@ -1,12 +1,15 @@
 import logging
 from typing import Dict
 
+import pandas as pd
+
 from filters.insider_info_filter import InsiderInfoFilter
 from models.aggregated_insider_info import AggregatedInsiderInfo
 from providers.yahoo.yahoo_insider_provider import YahooInsiderProvider
 from utils import constants
 from utils.enums.provider_type import ProviderType
 from utils.enums.trade_type import TradeType
+from utils.top_selection import TopSelection
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +39,9 @@ class InsiderManager:
     ) -> Dict[str, list[AggregatedInsiderInfo]]:
         """Return list of biggest buyers and sellers for a specified number of companies.
 
+        Trades of every ticker are filtered and totalled as soon as they are fetched, and only the biggest
+        buyers and sellers are kept. Equal totals are ranked in order of the tickers.
+
         Args:
             number_of_companies (int): Number of buyers and sellers to return.
 
@@ -50,30 +56,45 @@ class InsiderManager:
         logger.debug(
             f"Fetching insider trading data for {number_of_companies} companies."
         )
-        insider_trades = self.__provider.fetch_insider_trades(self.__tickers)
-        filtered_insider_trades = self.__filter.filter_insider_info(insider_trades)
+        positions = {ticker: i for i, ticker in enumerate(self.__tickers)}
+        buyers = TopSelection(
+            number_of_companies,
+            key=lambda t: (t[1], -positions.get(t[0], len(positions))),
+        )
+        sellers = TopSelection(
+            number_of_companies,
+            key=lambda t: (t[2], -positions.get(t[0], len(positions))),
+        )
+        for transactions in self.__provider.iter_insider_transactions(self.__tickers):
+            filtered = self.__filter.filter_insider_transactions(transactions)
+            for totals in self.__aggregate(filtered).itertuples(name=None):
+                buyers.push(totals)
+                sellers.push(totals)
 
-        ticker_aggregation: Dict[str, Dict[str, int]] = {}
-        for trade in filtered_insider_trades:
-            if trade.ticker not in ticker_aggregation:
-                ticker_aggregation[trade.ticker] = {"bought": 0, "sold": 0}
+        return {
+            "buyers": [self.__to_info(totals) for totals in buyers.largest()],
+            "sellers": [self.__to_info(totals) for totals in sellers.largest()],
+        }
 
-            if trade.type == TradeType.BUY:
-                ticker_aggregation[trade.ticker]["bought"] += trade.value
-            elif trade.type == TradeType.SELL:
-                ticker_aggregation[trade.ticker]["sold"] += trade.value
-        filtered_info_list = [
-            AggregatedInsiderInfo(
-                ticker=ticker, bought=values["bought"], sold=values["sold"]
+    def __aggregate(self, transactions: pd.DataFrame) -> pd.DataFrame:
+        """Return bought and sold totals per ticker, tickers are kept in order of their first trade."""
+        is_buy = transactions["type"] == TradeType.BUY.value
+        is_sell = transactions["type"] == TradeType.SELL.value
+        values = transactions["value"].astype(float)
+        return (
+            pd.DataFrame(
+                {
+                    "ticker": transactions["ticker"],
+                    "bought": values.where(is_buy, 0.0),
+                    "sold": values.where(is_sell, 0.0),
+                }
             )
-            for ticker, values in ticker_aggregation.items()
-        ]
+            .groupby("ticker", sort=False)
+            .sum()
+        )
 
-        return {
-            "buyers": sorted(filtered_info_list, key=lambda x: x.bought, reverse=True)[
-                :number_of_companies
-            ],
-            "sellers": sorted(filtered_info_list, key=lambda x: x.sold, reverse=True)[
-                :number_of_companies
-            ],
-        }
+    @staticmethod
+    def __to_info(totals: tuple[str, float, float]) -> AggregatedInsiderInfo:
+        """Create AggregatedInsiderInfo from a (ticker, bought, sold) tuple, only done for returned companies."""
+        ticker, bought, sold = totals
+        return AggregatedInsiderInfo(ticker=ticker, bought=bought, sold=sold)
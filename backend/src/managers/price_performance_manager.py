@@ -48,12 +48,7 @@ class PricePerformanceManager:
         logger.debug(
             f"Fetching best and worst price performance for {number_of_companies} companies."
         )
-        performances = self.__provider.fetch_price_performance(
-            self.__tickers, self.__days_behind
-        )
-        performances.sort(key=lambda p: p.percent_change, reverse=True)
+        matrix = self.__provider.fetch_price_matrix(self.__tickers, self.__days_behind)
+        winners, losers = matrix.best_worst(number_of_companies)
 
-        return {
-            "winners": performances[:number_of_companies],
-            "losers": performances[-number_of_companies:],
-        }
+        return {"winners": winners, "losers": losers}
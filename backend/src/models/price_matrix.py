@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+
+from models.price_performance_information import PricePerformanceInformation
+
+
+class PriceMatrix:
+    """Class that represents closing prices of a whole universe of tickers as one dense tickers x days array.
+
+    A row holds prices of one ticker, with NaN before its first price, so tickers with a shorter history
+    are aligned on their latest price. Percent changes and the ranking of all tickers are calculated in
+    a single vectorized pass, and PricePerformanceInformation objects are only created for the tickers
+    that are shown, as views into their rows.
+
+    Fields:
+        tickers (list[str]): Tickers in the order of the rows.
+        days (pd.DatetimeIndex): Days in the order of the columns.
+        values (np.ndarray): Closing prices, shape (len(tickers), len(days)).
+    """
+
+    def __init__(self, tickers: list[str], days: pd.DatetimeIndex, values: np.ndarray):
+        if values.shape != (len(tickers), len(days)):
+            raise ValueError(
+                f"Prices of shape {values.shape} don't match {len(tickers)} tickers and {len(days)} days."
+            )
+        self.__tickers = list(tickers)
+        self.__days = pd.DatetimeIndex(days)
+        self.__values = values
+        self.__first: np.ndarray | None = None
+        self.__percent_changes: np.ndarray | None = None
+
+    @property
+    def tickers(self) -> list[str]:
+        """Getter for the tickers."""
+        return self.__tickers
+
+    @property
+    def days(self) -> pd.DatetimeIndex:
+        """Getter for the days."""
+        return self.__days
+
+    @property
+    def values(self) -> np.ndarray:
+        """Getter for the closing prices."""
+        return self.__values
+
+    def __len__(self) -> int:
+        return len(self.__tickers)
+
+    @classmethod
+    def from_frame(cls, closes: pd.DataFrame) -> "PriceMatrix":
+        """Create a matrix from a frame of closing prices with tickers as the index and days as columns.
+
+        A ticker missing a day between its prices (a trading halt) keeps its previous price that day.
+
+        Args:
+            closes (pd.DataFrame): Closing prices, NaN where a ticker has no price.
+
+        Returns:
+            PriceMatrix: Matrix with the tickers and days of the frame.
+        """
+        filled = closes.ffill(axis=1)
+        values = np.ascontiguousarray(filled.to_numpy(dtype=float))
+        return cls(list(closes.index), pd.DatetimeIndex(closes.columns), values)
+
+    def round(self, decimals: int) -> "PriceMatrix":
+        """Return a new matrix with prices rounded to {decimals} decimals."""
+        return PriceMatrix(
+            self.__tickers, self.__days, np.round(self.__values, decimals)
+        )
+
+    def percent_changes(self) -> np.ndarray:
+        """Return the percent change from the first to the last price of every ticker, rounded to 2 decimals.
+
+        Tickers with less than two prices, or starting at zero, have no change.
+        """
+        if self.__percent_changes is None:
+            rows, days = self.__values.shape
+            if not days:
+                self.__percent_changes = np.zeros(rows)
+                return self.__percent_changes
+            first = self.__first_columns()
+            start = self.__values[np.arange(rows), np.minimum(first, days - 1)]
+            end = self.__values[:, -1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                changes = np.round((end - start) / start * 100, 2)
+            valid = (first < days - 1) & (start != 0) & ~np.isnan(changes)
+            self.__percent_changes = np.where(valid, changes, 0.0)
+        return self.__percent_changes
+
+    def row(self, index: int) -> PricePerformanceInformation:
+        """Return price performance of the ticker in a row, its prices are a view into the matrix."""
+        return PricePerformanceInformation(
+            self.__tickers[index],
+            self.__values[index, self.__first_columns()[index] :],
+            float(self.percent_changes()[index]),
+        )
+
+    def rows(self) -> list[PricePerformanceInformation]:
+        """Return price performance of every ticker that has at least one price, in the order of the rows."""
+        return [self.row(i) for i in np.flatnonzero(self.has_prices())]
+
+    def best_worst(
+        self, number_of_companies: int
+    ) -> tuple[list[PricePerformanceInformation], list[PricePerformanceInformation]]:
+        """Return the best and the worst performing tickers.
+
+        Tickers are ranked by percent change, highest first, tickers with equal change keep the order of
+        their rows. Winners are the first {number_of_companies} of the ranking, losers the last ones. Only
+        the ends of the ranking are sorted, so picking a few tickers out of many doesn't sort all of them.
+
+        Args:
+            number_of_companies (int): Number of winners and losers to return.
+
+        Returns:
+            tuple[list[PricePerformanceInformation], list[PricePerformanceInformation]]: Winners and losers.
+        """
+        candidates = np.flatnonzero(self.has_prices())
+        ranks = -self.percent_changes()[candidates]
+        winners = candidates[self.__first_ranked(ranks, number_of_companies)]
+        last = self.__first_ranked(-ranks[::-1], number_of_companies)
+        losers = candidates[len(candidates) - 1 - last[::-1]]
+        return [self.row(i) for i in winners], [self.row(i) for i in losers]
+
+    @staticmethod
+    def __first_ranked(ranks: np.ndarray, n: int) -> np.ndarray:
+        """Return positions of the {n} smallest ranks in ascending order, equal ranks in order of their positions.
+
+        Only ranks up to the n-th smallest are sorted, the rest is just partitioned away.
+        """
+        if n <= 0:
+            return np.empty(0, dtype=np.intp)
+        if n >= len(ranks):
+            return np.argsort(ranks, kind="stable")
+        threshold = np.partition(ranks, n - 1)[n - 1]
+        if np.isnan(threshold):
+            return np.argsort(ranks, kind="stable")[:n]
+        selected = np.flatnonzero(ranks <= threshold)
+        return selected[np.argsort(ranks[selected], kind="stable")][:n]
+
+    def has_prices(self) -> np.ndarray:
+        """Return a boolean array telling which rows have at least one price."""
+        return self.__first_columns() < self.__values.shape[1]
+
+    def __first_columns(self) -> np.ndarray:
+        """Return the column of the first price of every row, the number of columns for rows without prices."""
+        if self.__first is None:
+            rows, days = self.__values.shape
+            if not days:
+                self.__first = np.zeros(rows, dtype=int)
+                return self.__first
+            valid = ~np.isnan(self.__values)
+            self.__first = np.where(valid.any(axis=1), valid.argmax(axis=1), days)
+        return self.__first
@@ -1,14 +1,26 @@
+import numpy as np
+
+
 class PricePerformanceInformation:
     """Class that represents price performance information for a given ticker.
 
+    Prices are kept as a numpy array, when the object comes from a PriceMatrix it is a view into
+    its row, so no prices are copied until they are read through `prices`.
+
     Fields:
         ticker (str): Ticker of the company the price performance is about.
         price (list[float]): List of prices in the last {number_of_days} days.
     """
 
-    def __init__(self, ticker: str, prices: list[float]):
+    def __init__(
+        self,
+        ticker: str,
+        prices: list[float] | np.ndarray,
+        percent_change: float | None = None,
+    ):
         self.__ticker = ticker
-        self.__prices = prices
+        self.__prices = np.asarray(prices, dtype=float)
+        self.__percent_change = percent_change
 
     @property
     def ticker(self) -> str:
@@ -18,21 +30,31 @@ class PricePerformanceInformation:
     @property
     def prices(self) -> list[float]:
         """Getter for the list of prices."""
+        return self.__prices.tolist()
+
+    @property
+    def values(self) -> np.ndarray:
+        """Getter for the prices as a numpy array, without copying them."""
         return self.__prices
 
     @property
     def percent_change(self) -> float:
-        """Calculate the percent change from the first to the last price, so the difference from beginning to end."""
-        if not self.__prices or len(self.__prices) < 2:
-            return 0.0
-        return round(
-            ((self.__prices[-1] - self.__prices[0]) / self.__prices[0]) * 100, 2
-        )
+        """Calculate the percent change from the first to the last price, so the difference from beginning to end.
+
+        It is calculated only once, a PriceMatrix passes it in already calculated for all tickers together.
+        """
+        if self.__percent_change is None:
+            if len(self.__prices) < 2 or not self.__prices[0]:
+                self.__percent_change = 0.0
+            else:
+                first, last = float(self.__prices[0]), float(self.__prices[-1])
+                self.__percent_change = round(((last - first) / first) * 100, 2)
+        return self.__percent_change
 
     def to_dict(self) -> dict:
         """Convert PricePerformanceInformation object to a dictionary."""
         return {
             "ticker": self.__ticker,
-            "prices": self.__prices,
+            "prices": self.prices,
             "percent_change": self.percent_change,
         }
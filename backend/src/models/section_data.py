@@ -1,5 +1,6 @@
 from typing import Any, Optional
 
+from utils.enums.chart_engine import ChartEngine
 from utils.enums.language import Language
 from utils.enums.provider_type import ProviderType
 from utils.enums.section_type import SectionType
@@ -16,6 +17,7 @@ class SectionData:
         days_ahead (Optional[int]): How far into the future the manager should look. Optional since some managers don't have this.
         days_behind (Optional[int]): How far into the past the manager should look. Optional since some managers don't have this.
         number_of_companies (int): Number of companies/articles that should be shown in that part of the report.
+        chart_engine (ChartEngine): How graphs of that part of the report are drawn. Defaults to PNG images.
     """
 
     def __init__(
@@ -27,6 +29,7 @@ class SectionData:
         days_ahead: Optional[int],
         days_behind: Optional[int],
         number_of_companies: int,
+        chart_engine: ChartEngine = ChartEngine.PNG,
     ):
         self.__type: SectionType = type
         self.__language: Language = language
@@ -35,6 +38,7 @@ class SectionData:
         self.__days_ahead: Optional[int] = days_ahead
         self.__days_behind: Optional[int] = days_behind
         self.__number_of_companies: int = number_of_companies
+        self.__chart_engine: ChartEngine = chart_engine
 
     @property
     def type(self) -> SectionType:
@@ -71,6 +75,11 @@ class SectionData:
         """Getter for number_of_companies"""
         return self.__number_of_companies
 
+    @property
+    def chart_engine(self) -> ChartEngine:
+        """Getter for chart_engine"""
+        return self.__chart_engine
+
     def to_dict(self) -> dict[str, Any]:
         """Get SectionData class object in dict format."""
         return {
@@ -81,4 +90,5 @@ class SectionData:
             "days_ahead": self.days_ahead,
             "days_behind": self.days_behind,
             "number_of_companies": self.number_of_companies,
+            "chart_engine": self.chart_engine.value,
         }
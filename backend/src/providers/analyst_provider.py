@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from models.analyst_recommendation import AnalystRecommendation
 
@@ -18,3 +19,16 @@ class AnalystProvider(ABC):
         Returns:
             list[AnalystRecommendation]: List of analyst recommendations for the given tickers.
         """
+
+    def iter_analyst_recommendations(
+        self, tickers: list[str]
+    ) -> Iterator[AnalystRecommendation]:
+        """Yield analyst recommendations for given tickers, providers that fetch tickers one by one yield each when it is done.
+
+        Args:
+            tickers (list[str]): List of tickers for which to retrieve analyst recommendations.
+
+        Returns:
+            Iterator[AnalystRecommendation]: Analyst recommendations for the given tickers, in no particular order.
+        """
+        yield from self.fetch_analyst_recommendations(tickers)
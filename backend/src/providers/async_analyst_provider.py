@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+from models.analyst_recommendation import AnalystRecommendation
+
+
+class AsyncAnalystProvider(ABC):
+    """Interface used by all classes that provide Analyst recommendation data on an asyncio event loop."""
+
+    @abstractmethod
+    async def fetch_analyst_recommendations(
+        self, tickers: list[str]
+    ) -> list[AnalystRecommendation]:
+        """Return analyst recommendations for given tickers.
+
+        Args:
+            tickers (list[str]): List of tickers for which to retrieve analyst recommendations.
+
+        Returns:
+            list[AnalystRecommendation]: List of analyst recommendations for the given tickers.
+        """
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+
+from models.earnings_information import EarningsInformation
+
+
+class AsyncEarningsProvider(ABC):
+    """Interface used by all classes that provide Earnings data on an asyncio event loop."""
+
+    @abstractmethod
+    async def fetch_earnings_dates(
+        self, tickers: list[str], cutoff: datetime
+    ) -> dict[str, date]:
+        """Return dates of upcoming earnings reports, without any other earnings data.
+
+        Args:
+            tickers (list[str]): List of tickers for which to check if there is an upcoming earnings report.
+            cutoff (datetime): Cutoff time for how away a report can be.
+
+        Returns:
+            dict[str, date]: Keys are tickers with an upcoming report before cutoff, values are report dates.
+        """
+
+    @abstractmethod
+    async def fetch_earnings(
+        self, tickers: list[str], cutoff: datetime
+    ) -> list[EarningsInformation]:
+        """Return relevant future earnings data.
+
+        Args:
+            tickers (list[str]): List of tickers for which to check if there is an upcoming earnings report.
+            cutoff (datetime): Cutoff time for how away a report can be.
+
+        Returns:
+            list[EarningsInformation]: List of relevant Earnings information.
+        """
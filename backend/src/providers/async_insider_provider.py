@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+from models.insider_information import InsiderInformation
+
+
+class AsyncInsiderProvider(ABC):
+    """Interface used by all classes that provide Insider data on an asyncio event loop."""
+
+    @abstractmethod
+    async def fetch_insider_trades(
+        self, tickers: list[str]
+    ) -> list[InsiderInformation]:
+        """Return relevant insider trading data.
+
+        Args:
+            tickers (list[str]): List of tickers for which to check if there are any recent insider trades.
+
+        Returns:
+            list[InsiderInformation]: List of relevant insider trading information.
+        """
+
+    @abstractmethod
+    async def fetch_insider_transactions(self, tickers: list[str]) -> pd.DataFrame:
+        """Return relevant insider trading data as one table, without creating an object per trade.
+
+        Args:
+            tickers (list[str]): List of tickers for which to check if there are any recent insider trades.
+
+        Returns:
+            pd.DataFrame: One row per trade, with columns "ticker", "value", "type" and "date".
+                "type" holds TradeType values and "date" holds UTC timestamps.
+        """
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
+
+import pandas as pd
 
 from models.insider_information import InsiderInformation
 
@@ -6,6 +9,8 @@ from models.insider_information import InsiderInformation
 class InsiderProvider(ABC):
     """Interface used by all classes that provide Insider data."""
 
+    TRANSACTION_COLUMNS = ["ticker", "value", "type", "date"]
+
     @abstractmethod
     def fetch_insider_trades(self, tickers: list[str]) -> list[InsiderInformation]:
         """Return relevant insider trading data.
@@ -16,3 +21,28 @@ class InsiderProvider(ABC):
         Returns:
             list[InsiderInformation]: List of relevant insider trading information.
         """
+
+    @abstractmethod
+    def fetch_insider_transactions(self, tickers: list[str]) -> pd.DataFrame:
+        """Return relevant insider trading data as one table, without creating an object per trade.
+
+        Args:
+            tickers (list[str]): List of tickers for which to check if there are any recent insider trades.
+
+        Returns:
+            pd.DataFrame: One row per trade, with columns "ticker", "value", "type" and "date".
+                "type" holds TradeType values and "date" holds UTC timestamps.
+        """
+
+    def iter_insider_transactions(self, tickers: list[str]) -> Iterator[pd.DataFrame]:
+        """Yield tables of insider trades, providers that fetch tickers one by one yield each when it is done.
+
+        All trades of a ticker are in the same table.
+
+        Args:
+            tickers (list[str]): List of tickers for which to check if there are any recent insider trades.
+
+        Returns:
+            Iterator[pd.DataFrame]: Tables with the same columns as fetch_insider_transactions, in no particular order.
+        """
+        yield self.fetch_insider_transactions(tickers)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from models.price_matrix import PriceMatrix
 from models.price_performance_information import PricePerformanceInformation
 
 
@@ -19,3 +20,15 @@ class PricePerformanceProvider(ABC):
         Returns:
             list[PricePerformanceInformation]: List of price performances for all tickers.
         """
+
+    @abstractmethod
+    def fetch_price_matrix(self, tickers: list[str], days_behind: int) -> PriceMatrix:
+        """Get prices for all tickers in a given time period as one matrix.
+
+        Args:
+            tickers (list[str]): List of tickers for which to get prices, in the order of the rows.
+            days_behind (int): How many days behind to get prices for.
+
+        Returns:
+            PriceMatrix: Prices of all tickers, tickers without prices have empty rows.
+        """
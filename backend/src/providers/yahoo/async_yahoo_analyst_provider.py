@@ -0,0 +1,45 @@
+import asyncio
+import logging
+
+from models.analyst_recommendation import AnalystRecommendation
+from providers.async_analyst_provider import AsyncAnalystProvider
+from providers.yahoo.async_yahoo_client import AsyncYahooClient
+from providers.yahoo.yahoo_analyst_provider import YahooAnalystProvider
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncYahooAnalystProvider(AsyncAnalystProvider):
+    """Class that retrieves analyst recommendations with yahoo finance API on an asyncio event loop."""
+
+    def __init__(self, client: AsyncYahooClient):
+        self.__client = client
+
+    async def fetch_analyst_recommendations(
+        self, tickers: list[str]
+    ) -> list[AnalystRecommendation]:
+        """Return analyst recommendations for given tickers by using yahoo finance API.
+
+        Args:
+            tickers (list[str]): List of tickers for which to retrieve analyst recommendations.
+
+        Returns:
+            list[AnalystRecommendation]: List of analyst recommendations for the given tickers.
+        """
+        logger.debug(
+            "Fetching all analyst recommendations by using async Yahoo Finance API."
+        )
+        recommendations = await asyncio.gather(
+            *(self.__fetch_ticker(ticker) for ticker in tickers)
+        )
+        return [r for r in recommendations if r is not None]
+
+    async def __fetch_ticker(self, ticker: str) -> AnalystRecommendation | None:
+        """Return analyst recommendation for a single ticker, or None if it is unavailable."""
+        try:
+            info = await self.__client.get_info(ticker)
+            mean = info.get("recommendationMean", -1.0)
+            return YahooAnalystProvider.parse_recommendation(ticker, mean)
+        except Exception as e:
+            logger.warning(f"Error fetching analyst recommendations: {e}")
+            return None
@@ -0,0 +1,279 @@
+import asyncio
+import logging
+from datetime import date, datetime, time
+from io import StringIO
+
+import pandas as pd
+from curl_cffi.requests import AsyncSession
+
+from utils import constants
+from utils.cassette_player import CassettePlayer
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncYahooClient:
+    """Class that requests yahoo finance API on an asyncio event loop, through curl_cffi AsyncSession.
+
+    All requests of a client share one session, so hundreds of tickers are multiplexed on a single
+    event loop instead of using a thread per request. Returned data has the same shape as the data
+    returned by yfinance, so the asynchronous providers can reuse the parsing of the synchronous ones.
+
+    All URLs can point to a StandInServer, which replays responses the CassettePlayer recorded.
+    The session belongs to the event loop it was first used on, close the client before the loop ends.
+    """
+
+    BASE_URL = "https://query2.finance.yahoo.com"
+    ROOT_URL = "https://finance.yahoo.com"
+    COOKIE_URL = "https://fc.yahoo.com"
+    TIMEOUT = 30
+
+    def __init__(
+        self,
+        session: AsyncSession | None = None,
+        max_concurrency: int = constants.MAX_ASYNC_REQUESTS,
+        base_url: str = BASE_URL,
+        root_url: str = ROOT_URL,
+        cookie_url: str = COOKIE_URL,
+    ):
+        logger.debug("AsyncYahooClient initialized.")
+        self.__session = session
+        self.__semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self.__crumb_lock = asyncio.Lock()
+        self.__crumb: str | None = None
+        self.__base_url = base_url.rstrip("/")
+        self.__root_url = root_url.rstrip("/")
+        self.__cookie_url = cookie_url
+        self.__rate_limiter = RateLimiter.get_instance()
+        self.__player = CassettePlayer.get_instance()
+        self.__circuit_breaker = CircuitBreaker.get_instance()
+
+    async def __aenter__(self) -> "AsyncYahooClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying session."""
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    async def get_info(self, ticker: str) -> dict:
+        """Return information about a company, with the keys used from yfinance `info`."""
+        result = await self.__quote_summary(
+            ticker, ["price", "summaryDetail", "financialData"]
+        )
+        info: dict = {}
+        for module in result.values():
+            if isinstance(module, dict):
+                info.update({key: self.__raw(value) for key, value in module.items()})
+        return info
+
+    async def get_calendar(self, ticker: str) -> dict:
+        """Return the calendar of upcoming events of a company, shaped like yfinance `calendar`."""
+        result = await self.__quote_summary(ticker, ["calendarEvents"])
+        earnings = result.get("calendarEvents", {}).get("earnings")
+        if earnings is None:
+            return {}
+        return {
+            "Earnings Date": [
+                datetime.fromtimestamp(self.__raw(d)).date()
+                for d in earnings.get("earningsDate", [])
+            ],
+            "Earnings High": self.__raw(earnings.get("earningsHigh")),
+            "Earnings Low": self.__raw(earnings.get("earningsLow")),
+            "Earnings Average": self.__raw(earnings.get("earningsAverage")),
+            "Revenue High": self.__raw(earnings.get("revenueHigh")),
+            "Revenue Low": self.__raw(earnings.get("revenueLow")),
+            "Revenue Average": self.__raw(earnings.get("revenueAverage")),
+        }
+
+    async def get_earnings_dates(self, ticker: str) -> pd.DataFrame | None:
+        """Return the latest earnings reports of a company, shaped like yfinance `get_earnings_dates`."""
+        response = await self.__request(
+            "GET",
+            f"{self.__root_url}/calendar/earnings",
+            params={"symbol": ticker, "offset": 0, "size": 25},
+            crumb=False,
+        )
+        if "<table" not in response.text:
+            return None
+        df = pd.read_html(StringIO(response.text), na_values=["-"])[0]
+        df = df.drop(columns=["Symbol", "Company"], errors="ignore")
+        df = df.dropna(subset="Earnings Date")
+        parts = (
+            df["Earnings Date"]
+            .str.replace("EDT", "America/New_York")
+            .str.replace("EST", "America/New_York")
+            .str.rsplit(" ", n=1, expand=True)
+        )
+        dates = pd.to_datetime(parts[0], format="%B %d, %Y at %I %p")
+        df.index = pd.DatetimeIndex(
+            [d.tz_localize(tz) for d, tz in zip(dates, parts[1], strict=True)],
+            name="Earnings Date",
+        )
+        return df.drop(columns=["Earnings Date"])
+
+    async def get_history(self, ticker: str, start: date, end: date) -> pd.DataFrame:
+        """Return daily closing prices of a company between start and end, in a "Close" column."""
+        data = await self.__get_json(
+            f"{self.__base_url}/v8/finance/chart/{ticker}",
+            params={
+                "period1": int(datetime.combine(start, time()).timestamp()),
+                "period2": int(datetime.combine(end, time()).timestamp()),
+                "interval": "1d",
+                "events": "div,splits",
+            },
+        )
+        result = data["chart"]["result"][0]
+        timestamps = result.get("timestamp", [])
+        closes = result["indicators"]["quote"][0].get("close", [])
+        index = pd.to_datetime(timestamps, unit="s", utc=True)
+        timezone = result.get("meta", {}).get("exchangeTimezoneName")
+        if timezone:
+            index = index.tz_convert(timezone)
+        return pd.DataFrame({"Close": closes}, index=index, dtype=float).dropna()
+
+    async def get_insider_transactions(self, ticker: str) -> pd.DataFrame:
+        """Return insider transactions of a company, shaped like yfinance `get_insider_transactions`."""
+        result = await self.__quote_summary(ticker, ["insiderTransactions"])
+        transactions = [
+            {key: self.__raw(value) for key, value in row.items() if key != "maxAge"}
+            for row in result.get("insiderTransactions", {}).get("transactions", [])
+        ]
+        df = pd.DataFrame(transactions)
+        if df.empty:
+            return df
+        df["startDate"] = pd.to_datetime(df["startDate"], unit="s")
+        return df.rename(
+            columns={
+                "startDate": "Start Date",
+                "filerName": "Insider",
+                "filerRelation": "Position",
+                "filerUrl": "URL",
+                "moneyText": "Transaction",
+                "transactionText": "Text",
+                "shares": "Shares",
+                "value": "Value",
+                "ownership": "Ownership",
+            }
+        )
+
+    async def get_news(self, ticker: str, count: int, tab: str) -> list[dict]:
+        """Return up to {count} raw news articles of a company, shaped like yfinance `get_news`."""
+        query_refs = {
+            "all": "newsAll",
+            "news": "latestNews",
+            "press releases": "pressRelease",
+        }
+        response = await self.__request(
+            "POST",
+            f"{self.__root_url}/xhr/ncp",
+            params={"queryRef": query_refs[tab.lower()], "serviceKey": "ncp_fin"},
+            json={"serviceConfig": {"snippetCount": count, "s": [ticker]}},
+        )
+        stream = (
+            response.json().get("data", {}).get("tickerStream", {}).get("stream", [])
+        )
+        return [article for article in stream if not article.get("ad", [])]
+
+    async def __quote_summary(self, ticker: str, modules: list[str]) -> dict:
+        """Return the requested quoteSummary modules of a company."""
+        data = await self.__get_json(
+            f"{self.__base_url}/v10/finance/quoteSummary/{ticker}",
+            params={
+                "modules": ",".join(modules),
+                "corsDomain": "finance.yahoo.com",
+                "formatted": "false",
+                "symbol": ticker,
+            },
+        )
+        results = (data.get("quoteSummary") or {}).get("result") or []
+        if not results:
+            raise ValueError(f"No quote summary data for {ticker}.")
+        return results[0]
+
+    async def __get_json(self, url: str, params: dict) -> dict:
+        response = await self.__request("GET", url, params=params)
+        return response.json()
+
+    async def __request(
+        self,
+        method: str,
+        url: str,
+        params: dict,
+        json: dict | None = None,
+        crumb: bool = True,
+    ):
+        """Send a request, at most {max_concurrency} at the same time and paced by the RateLimiter.
+
+        Raises for an error status, a 429 status also slows down all later yahoo requests. Network errors,
+        429 and server errors count towards opening the CircuitBreaker of yahoo, while it is open requests
+        fail right away. Successful responses are recorded by the CassettePlayer, if it is recording.
+        """
+        if crumb:
+            params = {**params, "crumb": await self.__get_crumb()}
+        if not self.__circuit_breaker.allow(RateLimiter.YAHOO_HOST):
+            raise CircuitOpenError("Too many yahoo requests failed, skipping request.")
+        async with self.__semaphore:
+            await self.__rate_limiter.acquire_async(RateLimiter.YAHOO_HOST)
+            try:
+                response = await self.__get_session().request(
+                    method, url, params=params, json=json, timeout=self.TIMEOUT
+                )
+            except OSError:
+                self.__circuit_breaker.report_failure(RateLimiter.YAHOO_HOST)
+                raise
+        if response.status_code == 429 or response.status_code >= 500:
+            self.__circuit_breaker.report_failure(RateLimiter.YAHOO_HOST)
+        else:
+            self.__circuit_breaker.report_success(RateLimiter.YAHOO_HOST)
+        if response.status_code == 429:
+            self.__rate_limiter.report_throttled(
+                RateLimiter.YAHOO_HOST,
+                RateLimiter.parse_retry_after(response.headers.get("Retry-After")),
+            )
+        elif response.status_code < 400:
+            self.__rate_limiter.report_success(RateLimiter.YAHOO_HOST)
+            self.__player.store_http(
+                method,
+                url,
+                params,
+                json,
+                response.status_code,
+                response.headers.get("Content-Type"),
+                response.content,
+            )
+        response.raise_for_status()
+        return response
+
+    async def __get_crumb(self) -> str:
+        """Return the crumb yahoo requires next to its cookie, requesting both only once per client."""
+        async with self.__crumb_lock:
+            if self.__crumb is None:
+                session = self.__get_session()
+                await session.get(self.__cookie_url, timeout=self.TIMEOUT)
+                response = await session.get(
+                    f"{self.__base_url}/v1/test/getcrumb", timeout=self.TIMEOUT
+                )
+                crumb = response.text.strip()
+                if not crumb or "<html>" in crumb or "Too Many Requests" in crumb:
+                    raise ValueError("Couldn't get crumb from yahoo finance API.")
+                self.__crumb = crumb
+            return self.__crumb
+
+    def __get_session(self) -> AsyncSession:
+        if self.__session is None:
+            self.__session = AsyncSession(impersonate="chrome")
+        return self.__session
+
+    @staticmethod
+    def __raw(value):
+        """Return the raw value of a field that yahoo may send as {"raw": ..., "fmt": ...}."""
+        if isinstance(value, dict) and "raw" in value:
+            return value["raw"]
+        return value
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+from datetime import date, datetime
+
+import pandas as pd
+
+from models.earnings_information import EarningsInformation
+from providers.async_earnings_provider import AsyncEarningsProvider
+from providers.yahoo.async_yahoo_client import AsyncYahooClient
+from providers.yahoo.yahoo_earnings_parser import YahooEarningsParser
+from utils.price_store import PriceStore
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncYahooEarningsProvider(AsyncEarningsProvider):
+    """Class that provides Earnings information by using yahoo finance API on an asyncio event loop."""
+
+    def __init__(self, client: AsyncYahooClient):
+        self.__client = client
+        self.__parser = YahooEarningsParser()
+        self.__price_store = PriceStore.get_instance()
+
+    async def fetch_earnings_dates(
+        self, tickers: list[str], cutoff: datetime
+    ) -> dict[str, date]:
+        """Return dates of upcoming earnings reports by reading only the calendars from yahoo finance API.
+
+        Args:
+            tickers (list[str]): List of tickers for which to check if there is an upcoming earnings report.
+            cutoff (datetime): How far into the future a report can't be to be included.
+
+        Returns:
+            dict[str, date]: Keys are tickers with an upcoming report before cutoff, values are report dates.
+        """
+        logger.debug(
+            f"Fetching all earnings dates until the {cutoff} using async Yahoo Finance API."
+        )
+        dates = await asyncio.gather(
+            *(self.__fetch_earnings_date(ticker, cutoff) for ticker in tickers)
+        )
+        return {
+            ticker: earnings_date
+            for ticker, earnings_date in zip(tickers, dates, strict=True)
+            if earnings_date is not None
+        }
+
+    async def fetch_earnings(
+        self, tickers: list[str], cutoff: datetime
+    ) -> list[EarningsInformation]:
+        """Return relevant Earnings report information for given companies by using yahoo finance API.
+
+        Args:
+            tickers (list[str]): List of tickers for which to check if there is an upcoming earnings report.
+            cutoff (datetime): How far into the future a report can't be to be included.
+
+        Returns:
+            list[EarningsInformation]: List of relevant earnings report information for given companies.
+        """
+        logger.debug(
+            f"Fetching all earnings information until the {cutoff} using async Yahoo Finance API."
+        )
+        earnings = await asyncio.gather(
+            *(self.__fetch_ticker(ticker, cutoff) for ticker in tickers)
+        )
+        return [e for e in earnings if e is not None]
+
+    async def __fetch_earnings_date(self, ticker: str, cutoff: datetime) -> date | None:
+        """Return the upcoming earnings date of a single ticker, or None if it has no relevant upcoming report."""
+        try:
+            calendar = await self.__client.get_calendar(ticker)
+            if not calendar:
+                return None
+            return self.__parser.get_earnings_date(calendar, cutoff)
+        except Exception as e:
+            logger.warning(f"Error fetching earnings date for {ticker}: {e}")
+            return None
+
+    async def __fetch_ticker(
+        self, ticker: str, cutoff: datetime
+    ) -> EarningsInformation | None:
+        """Return earnings information for a single ticker, or None if it has no relevant upcoming report.
+
+        Company info and earnings history are requested at the same time, the price history follows
+        once the dates of past reports tell how long it has to be.
+        """
+        try:
+            calendar = await self.__client.get_calendar(ticker)
+            if not calendar:
+                return None
+
+            earnings_date = self.__parser.get_earnings_date(calendar, cutoff)
+            if earnings_date is None:
+                return None
+
+            info, earnings_history = await asyncio.gather(
+                self.__get_info(ticker), self.__get_earnings_history(ticker)
+            )
+            past_earnings = self.__parser.get_past_earnings(earnings_history)
+            return self.__parser.build(
+                ticker=ticker,
+                earnings_date=earnings_date,
+                calendar=calendar,
+                info=info,
+                past_earnings=past_earnings,
+                history=await self.__get_history(ticker, past_earnings),
+            )
+        except Exception as e:
+            logger.warning(f"Error fetching earnings for {ticker}: {e}")
+            return None
+
+    async def __get_info(self, ticker: str) -> dict:
+        """Returns information about the company, used for its name and market cap."""
+        try:
+            return await self.__client.get_info(ticker)
+        except Exception as e:
+            logger.warning(f"Error fetching company information: {e}")
+            return {}
+
+    async def __get_earnings_history(self, ticker: str) -> pd.DataFrame | None:
+        """Returns the latest earnings reports of a company."""
+        try:
+            return await self.__client.get_earnings_dates(ticker)
+        except Exception as e:
+            logger.warning(f"Error fetching previous earnings information: {e}")
+            return None
+
+    async def __get_history(
+        self, ticker: str, past_earnings: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Returns price history of a company covering the window the parser needs.
+
+        Only days missing in the PriceStore are requested, the rest is read from it on a worker thread.
+        """
+        start, end = self.__parser.get_history_window(past_earnings)
+        try:
+            if not await self.__update_store(ticker, start, end):
+                await self.__update_store(ticker, start, end)
+            closes = await asyncio.to_thread(self.__price_store.get, ticker, start, end)
+            return pd.DataFrame({"Close": closes})
+        except Exception as e:
+            logger.warning(f"Error fetching price history: {e}")
+            return pd.DataFrame()
+
+    async def __update_store(self, ticker: str, start: date, end: date) -> bool:
+        """Request days of a company missing in the PriceStore and merge them in.
+
+        Returns False if stored prices were adjusted since they were stored, and have to be requested again.
+        """
+        missing = await asyncio.to_thread(
+            self.__price_store.missing, [ticker], start, end
+        )
+        for range_start, range_end in missing:
+            history = await self.__client.get_history(ticker, range_start, range_end)
+            if history.empty:
+                continue
+            if not await asyncio.to_thread(
+                self.__price_store.merge,
+                ticker,
+                history["Close"],
+                range_start,
+                range_end,
+            ):
+                return False
+        return True
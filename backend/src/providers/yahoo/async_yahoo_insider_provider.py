@@ -0,0 +1,59 @@
+import asyncio
+import logging
+
+import pandas as pd
+
+from models.insider_information import InsiderInformation
+from providers.async_insider_provider import AsyncInsiderProvider
+from providers.yahoo.async_yahoo_client import AsyncYahooClient
+from providers.yahoo.yahoo_insider_provider import YahooInsiderProvider
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncYahooInsiderProvider(AsyncInsiderProvider):
+    """Class that provides data about insider trading by using yahoo finance API on an asyncio event loop."""
+
+    def __init__(self, client: AsyncYahooClient):
+        self.__client = client
+
+    async def fetch_insider_trades(
+        self, tickers: list[str]
+    ) -> list[InsiderInformation]:
+        """Get all insider trades posted on yahoo finance.
+
+        Args:
+            tickers (list[str]): Tickers for which to check insider trades.
+
+        Returns:
+            list[InsiderInformation]: List of relevant insider trading information.
+        """
+        transactions = await self.fetch_insider_transactions(tickers)
+        return YahooInsiderProvider.to_insider_information(transactions)
+
+    async def fetch_insider_transactions(self, tickers: list[str]) -> pd.DataFrame:
+        """Get all insider trades posted on yahoo finance as one table.
+
+        Args:
+            tickers (list[str]): Tickers for which to check insider trades.
+
+        Returns:
+            pd.DataFrame: One row per trade, with columns "ticker", "value", "type" and "date".
+        """
+        logger.debug(
+            "Fetching all insider information by using async Yahoo Finance API."
+        )
+
+        per_ticker = await asyncio.gather(
+            *(self.__fetch_ticker(ticker) for ticker in tickers)
+        )
+        return YahooInsiderProvider.concat_transactions(per_ticker)
+
+    async def __fetch_ticker(self, ticker: str) -> pd.DataFrame | None:
+        """Return classified insider trades of a single ticker, or None if they are unavailable."""
+        try:
+            transactions = await self.__client.get_insider_transactions(ticker)
+            return YahooInsiderProvider.classify_transactions(ticker, transactions)
+        except Exception as e:
+            logger.warning(f"Error fetching insider trades for {ticker}: {e}")
+            return None
@@ -0,0 +1,58 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from models.news_article import NewsArticle
+from providers.async_news_provider import AsyncNewsProvider
+from providers.yahoo.async_yahoo_client import AsyncYahooClient
+from providers.yahoo.yahoo_news_provider import YahooNewsProvider
+from utils.clock import Clock
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncYahooNewsProvider(AsyncNewsProvider):
+    """Class that provides data about news articles by using yahoo finance API on an asyncio event loop."""
+
+    def __init__(self, client: AsyncYahooClient):
+        self.__client = client
+
+    async def fetch_news(
+        self, tickers: list[str], days_behind: int
+    ) -> list[NewsArticle]:
+        """Get all news articles posted on yahoo finance in the last {days_behind} days.
+
+        Args:
+            tickers (list[str]): Tickers for which to check news articles.
+            days_behind (int): How old can an article be to be included.
+
+        Returns:
+            list[NewsArticle]: List of articles that have been posted in the last {days_behind} days.
+        """
+        logger.debug(
+            f"Fetching all news in the last {days_behind} days using async Yahoo Finance API."
+        )
+        cutoff = Clock.get_instance().now(timezone.utc) - timedelta(days=days_behind)
+
+        per_ticker = await asyncio.gather(
+            *(self.__fetch_ticker(ticker, cutoff) for ticker in tickers)
+        )
+        return [article for articles in per_ticker for article in articles]
+
+    async def __fetch_ticker(self, ticker: str, cutoff: datetime) -> list[NewsArticle]:
+        """Return news articles of a single ticker, reaching at least back to cutoff if yahoo has them.
+
+        A ticker whose news can't be fetched has no articles instead of failing the whole section.
+        """
+        try:
+            count: int | None = YahooNewsProvider.PAGE_SIZE
+            while count is not None:
+                news = await self.__client.get_news(ticker, count, "all")
+                articles = YahooNewsProvider.parse_articles(ticker, news)
+                count = YahooNewsProvider.next_page_size(
+                    articles, len(news), count, cutoff
+                )
+            return articles
+        except Exception as e:
+            logger.warning(f"Error fetching news for {ticker}: {e}")
+            return []
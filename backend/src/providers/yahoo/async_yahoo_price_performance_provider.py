@@ -0,0 +1,115 @@
+import asyncio
+import logging
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from models.price_matrix import PriceMatrix
+from models.price_performance_information import PricePerformanceInformation
+from providers.async_price_performance_provider import AsyncPricePerformanceProvider
+from providers.yahoo.async_yahoo_client import AsyncYahooClient
+from utils.clock import Clock
+from utils.price_store import PriceStore
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncYahooPricePerformanceProvider(AsyncPricePerformanceProvider):
+    """Class that provides prices of stocks in a given period by using yahoo finance API on an asyncio event loop."""
+
+    def __init__(self, client: AsyncYahooClient):
+        self.__client = client
+        self.__price_store = PriceStore.get_instance()
+
+    async def fetch_price_performance(
+        self, tickers: list[str], days_behind: int
+    ) -> list[PricePerformanceInformation]:
+        """Get prices for all tickers in a given time period with yahoo API.
+
+        Args:
+            tickers (list[str]): List of tickers for which to get prices.
+            days_behind (int): How many days behind to get prices for.
+
+        Returns:
+            list[PricePerformanceInformation]: List of price performances for all tickers.
+        """
+        return (await self.fetch_price_matrix(tickers, days_behind)).rows()
+
+    async def fetch_price_matrix(
+        self, tickers: list[str], days_behind: int
+    ) -> PriceMatrix:
+        """Get prices for all tickers in a given time period with yahoo API, as one matrix.
+
+        Prices are kept in the PriceStore, so only days that aren't stored yet are requested, usually just
+        the last one. Every missing range is a separate chart request, all of them multiplexed on the
+        client's session. The PriceStore is read and written on worker threads, so its SQLite calls
+        never block the event loop.
+
+        Args:
+            tickers (list[str]): List of tickers for which to get prices, in the order of the rows.
+            days_behind (int): How many days behind to get prices for.
+
+        Returns:
+            PriceMatrix: Prices of all tickers rounded to 2 decimals, tickers without prices have empty rows.
+        """
+        logger.debug(
+            f"Fetching all price performance data in the last {days_behind} days using async Yahoo Finance API."
+        )
+        end = Clock.get_instance().today() + timedelta(days=1)
+        start = end - timedelta(days=days_behind)
+        adjusted = await self.__update_store(tickers, start, end)
+        if adjusted:
+            await self.__update_store(adjusted, start, end)
+
+        try:
+            matrix = (
+                await asyncio.to_thread(self.__price_store.matrix, tickers, start, end)
+            ).round(2)
+        except Exception as e:
+            logger.warning(f"Error reading price performance from price store: {e}")
+            return PriceMatrix(
+                tickers, pd.DatetimeIndex([]), np.empty((len(tickers), 0))
+            )
+        for ticker, has_prices in zip(tickers, matrix.has_prices(), strict=True):
+            if not has_prices:
+                logger.warning(f"No price performance data for {ticker}.")
+        return matrix
+
+    async def __update_store(
+        self, tickers: list[str], start: date, end: date
+    ) -> list[str]:
+        """Request days missing in the PriceStore and merge them in.
+
+        Returns tickers whose stored prices were adjusted since they were stored, and have to be requested again.
+        """
+        missing = await asyncio.to_thread(
+            self.__price_store.missing, tickers, start, end
+        )
+        ranges = [
+            (ticker, range_start, range_end)
+            for (range_start, range_end), range_tickers in missing.items()
+            for ticker in range_tickers
+        ]
+        merged = await asyncio.gather(
+            *(self.__fetch_range(*request) for request in ranges)
+        )
+        return [
+            ticker
+            for (ticker, _, _), fresh in zip(ranges, merged, strict=True)
+            if not fresh
+        ]
+
+    async def __fetch_range(self, ticker: str, start: date, end: date) -> bool:
+        """Request prices of a single ticker in a range and merge them in the PriceStore.
+
+        Returns False only if the stored prices of the ticker were adjusted, a failed request is just logged.
+        """
+        try:
+            history = await self.__client.get_history(ticker, start, end)
+            return await asyncio.to_thread(
+                self.__price_store.merge, ticker, history["Close"], start, end
+            )
+        except Exception as e:
+            logger.warning(f"Error fetching price performance for {ticker}: {e}")
+            return True
@@ -1,9 +1,10 @@
 import logging
-
-import yfinance as yf
+from typing import Iterator
 
 from models.analyst_recommendation import AnalystRecommendation
 from providers.analyst_provider import AnalystProvider
+from providers.yahoo.yahoo_data_hub import YahooDataHub
+from utils.ticker_executor import TickerExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +12,10 @@ logger = logging.getLogger(__name__)
 class YahooAnalystProvider(AnalystProvider):
     """Class that retrieves analyst recommendations for ticker with yahoo finance API."""
 
+    def __init__(self):
+        self.__executor = TickerExecutor.get_instance()
+        self.__data_hub = YahooDataHub.get_instance()
+
     def fetch_analyst_recommendations(
         self, tickers: list[str]
     ) -> list[AnalystRecommendation]:
@@ -24,30 +29,60 @@ class YahooAnalystProvider(AnalystProvider):
         """
         logger.debug("Fetching all analyst recommendations by using Yahoo Finance API.")
 
-        analyst_recommendations: list[AnalystRecommendation] = []
-
-        for ticker in tickers:
-            try:
-                stock = yf.Ticker(ticker)
-                mean = stock.info.get("recommendationMean", -1.0)
-                if mean < 1 or mean > 5:
-                    logger.warning(
-                        f"Invalid mean value for ticker {ticker}: {mean}. Skipping."
-                    )
-                    continue
-
-                analyst_recommendations.append(
-                    AnalystRecommendation(
-                        ticker=ticker, index=self.__mean_to_index(mean)
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Error fetching analyst recommendations: {e}")
-                continue
-
-        return analyst_recommendations
-
-    def __mean_to_index(self, mean: float) -> float:
+        recommendations = self.__executor.map(self.__fetch_ticker, tickers)
+        return [r for r in recommendations if r is not None]
+
+    def iter_analyst_recommendations(
+        self, tickers: list[str]
+    ) -> Iterator[AnalystRecommendation]:
+        """Yield analyst recommendations for given tickers as soon as each of them is fetched from yahoo finance API.
+
+        Args:
+            tickers (list[str]): List of tickers for which to retrieve analyst recommendations.
+
+        Returns:
+            Iterator[AnalystRecommendation]: Analyst recommendations in order of completion.
+        """
+        logger.debug(
+            "Streaming all analyst recommendations by using Yahoo Finance API."
+        )
+
+        for recommendation in self.__executor.map_unordered(
+            self.__fetch_ticker, tickers
+        ):
+            if recommendation is not None:
+                yield recommendation
+
+    def __fetch_ticker(self, ticker: str) -> AnalystRecommendation | None:
+        """Return analyst recommendation for a single ticker, or None if it is unavailable."""
+        try:
+            mean = self.__data_hub.get_info(ticker).get("recommendationMean", -1.0)
+            return self.parse_recommendation(ticker, mean)
+        except Exception as e:
+            logger.warning(f"Error fetching analyst recommendations: {e}")
+            return None
+
+    @staticmethod
+    def parse_recommendation(ticker: str, mean: float) -> AnalystRecommendation | None:
+        """Convert the recommendation mean from yahoo finance API to AnalystRecommendation.
+
+        Args:
+            ticker (str): Ticker the mean belongs to.
+            mean (float): Mean that is retrieved from yahoo finance API.
+
+        Returns:
+            AnalystRecommendation | None: Analyst recommendation, or None if the mean is invalid.
+        """
+        if mean < 1 or mean > 5:
+            logger.warning(f"Invalid mean value for ticker {ticker}: {mean}. Skipping.")
+            return None
+
+        return AnalystRecommendation(
+            ticker=ticker, index=YahooAnalystProvider.__mean_to_index(mean)
+        )
+
+    @staticmethod
+    def __mean_to_index(mean: float) -> float:
         """Convert mean retrieved from api to index used in jinance.
 
         Mean in yfinance is between 1 and 5, where 1 is a strong buy and 5 is a strong sell.
@@ -0,0 +1,199 @@
+import logging
+import threading
+from typing import Any, Callable, TypeVar
+
+import pandas as pd
+import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
+
+from utils.cassette_player import CassettePlayer
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.enums.cassette_mode import CassetteMode
+from utils.enums.data_kind import DataKind
+from utils.negative_cache import KnownFailureError, NegativeCache
+from utils.rate_limiter import RateLimiter
+from utils.response_cache import ResponseCache
+from utils.singleton_meta import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class YahooDataHub(metaclass=SingletonMeta):
+    """Class that memoizes data fetched from yahoo finance API for the lifetime of one report.
+
+    All yahoo providers read through the hub, so data that more sections need (for example `info` used
+    by both earnings and analyst sections) is requested only once per ticker. ReportBuilderDirector
+    clears the hub before and after every report. Responses are also kept in the ResponseCache, so a later
+    report reuses them for as long as their data kind allows. The CassettePlayer can record every response,
+    or replay recorded responses from a local StandInServer instead of calling yahoo finance API.
+
+    Data of a ticker that failed recently is skipped while it is in the NegativeCache, and no requests
+    are sent at all while the CircuitBreaker of yahoo is open. Both raise right away, so a failure storm
+    makes a report shorter instead of longer.
+
+    Returned objects are shared between callers and must not be modified. Failed requests are not memoized.
+    """
+
+    # yfinance swallows most errors and returns empty data instead, an empty response of these kinds is a failure.
+    FAILED_WHEN_EMPTY = (
+        DataKind.INFO,
+        DataKind.CALENDAR,
+        DataKind.EARNINGS_DATES,
+        DataKind.HISTORY,
+        DataKind.INSIDER_TRANSACTIONS,
+    )
+
+    def __init__(self):
+        logger.debug("YahooDataHub initialized.")
+        self.__lock = threading.Lock()
+        self.__key_locks: dict[tuple, threading.Lock] = {}
+        self.__cache: dict[tuple, Any] = {}
+        self.__response_cache = ResponseCache.get_instance()
+        self.__rate_limiter = RateLimiter.get_instance()
+        self.__player = CassettePlayer.get_instance()
+        self.__negative_cache = NegativeCache.get_instance()
+        self.__circuit_breaker = CircuitBreaker.get_instance()
+
+    def get_info(self, ticker: str) -> dict:
+        """Return the `info` dictionary of a ticker."""
+        return self.__memoize(
+            (DataKind.INFO, ticker), lambda: self.__stock(ticker).info
+        )
+
+    def get_calendar(self, ticker: str) -> dict:
+        """Return the calendar of upcoming events of a ticker."""
+        return self.__memoize(
+            (DataKind.CALENDAR, ticker), lambda: self.__stock(ticker).calendar
+        )
+
+    def get_earnings_dates(self, ticker: str) -> pd.DataFrame | None:
+        """Return the latest earnings reports of a ticker, with estimated and reported EPS."""
+        return self.__memoize(
+            (DataKind.EARNINGS_DATES, ticker),
+            lambda: self.__stock(ticker).get_earnings_dates(),
+        )
+
+    def get_history(self, ticker: str, **kwargs) -> pd.DataFrame:
+        """Return price history of a ticker, kwargs are passed to yf.Ticker.history."""
+        return self.__memoize(
+            (DataKind.HISTORY, ticker, *sorted(kwargs.items())),
+            lambda: self.__stock(ticker).history(**kwargs),
+        )
+
+    def get_insider_transactions(self, ticker: str) -> pd.DataFrame:
+        """Return insider transactions of a ticker."""
+        return self.__memoize(
+            (DataKind.INSIDER_TRANSACTIONS, ticker),
+            lambda: self.__stock(ticker).get_insider_transactions(),
+        )
+
+    def get_news(self, ticker: str, count: int, tab: str) -> list[dict]:
+        """Return up to {count} raw news articles of a ticker.
+
+        yf.Ticker keeps the first news it fetched and returns them for any later count,
+        so every count is requested through a new yf.Ticker object.
+        """
+        return self.__memoize(
+            (DataKind.NEWS, ticker, count, tab),
+            lambda: yf.Ticker(ticker).get_news(count, tab),
+        )
+
+    def download(self, tickers: list[str], **kwargs) -> pd.DataFrame | None:
+        """Return price history of multiple tickers in one request, kwargs are passed to yf.download."""
+        return self.__memoize(
+            (DataKind.DOWNLOAD, tuple(tickers), *sorted(kwargs.items())),
+            lambda: yf.download(tickers, **kwargs),
+        )
+
+    def __stock(self, ticker: str) -> yf.Ticker:
+        """Return the memoized yf.Ticker object of a ticker, it is never stored in the ResponseCache."""
+        return self.__memoize(("ticker", ticker), lambda: yf.Ticker(ticker))
+
+    def __memoize(self, key: tuple, load: Callable[[], T]) -> T:
+        """Return value stored under key, loading it first if it isn't stored yet.
+
+        Concurrent callers asking for the same key wait for a single load instead of all requesting it.
+        Keys starting with a DataKind are looked up in the ResponseCache before loading, and stored in it after.
+        """
+        with self.__lock:
+            key_lock = self.__key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self.__cache:
+                self.__cache[key] = self.__load(key, load)
+            return self.__cache[key]
+
+    def __load(self, key: tuple, load: Callable[[], T]) -> T:
+        """Return a response from the ResponseCache, or load it and store it there.
+
+        When replaying, the response is requested from the StandInServer instead, and when recording,
+        it is stored in the cassette wherever it came from.
+        """
+        kind = key[0]
+        if not isinstance(kind, DataKind):
+            return load()
+
+        cache_key = repr(key[1:])
+        if self.__player.mode is CassetteMode.REPLAY:
+            return self.__player.fetch(kind.value, cache_key)
+
+        ticker = key[1] if isinstance(key[1], str) else None
+        if ticker is not None and self.__negative_cache.is_known_failure(kind, ticker):
+            raise KnownFailureError(
+                f"{kind.value} of {ticker} failed recently, skipping it."
+            )
+
+        found, value = self.__response_cache.get(kind, cache_key)
+        if not found:
+            value = self.__request(load, kind, ticker)
+            if not self.__is_empty(kind, value):
+                self.__response_cache.put(kind, cache_key, value)
+        self.__player.store(kind.value, cache_key, value)
+        return value
+
+    def __request(self, load: Callable[[], T], kind: DataKind, ticker: str | None) -> T:
+        """Call yahoo finance API once the CircuitBreaker and the RateLimiter allow it, and report how the call went.
+
+        Network errors and throttling are failures of yahoo, they count towards opening its circuit.
+        Any other error means yahoo answered, but without usable data of the ticker, it goes to the NegativeCache,
+        and so does an empty response of a kind that always has data.
+        """
+        if not self.__circuit_breaker.allow(RateLimiter.YAHOO_HOST):
+            raise CircuitOpenError("Too many yahoo requests failed, skipping request.")
+        self.__rate_limiter.acquire(RateLimiter.YAHOO_HOST)
+        try:
+            value = load()
+        except YFRateLimitError:
+            self.__rate_limiter.report_throttled(RateLimiter.YAHOO_HOST)
+            self.__circuit_breaker.report_failure(RateLimiter.YAHOO_HOST)
+            raise
+        except OSError:
+            self.__circuit_breaker.report_failure(RateLimiter.YAHOO_HOST)
+            raise
+        except Exception:
+            self.__circuit_breaker.report_success(RateLimiter.YAHOO_HOST)
+            if ticker is not None:
+                self.__negative_cache.record_failure(kind, ticker)
+            raise
+        self.__rate_limiter.report_success(RateLimiter.YAHOO_HOST)
+        self.__circuit_breaker.report_success(RateLimiter.YAHOO_HOST)
+        if ticker is None:
+            return value
+        if self.__is_empty(kind, value):
+            logger.warning(f"Yahoo returned no {kind.value} of {ticker}.")
+            self.__negative_cache.record_failure(kind, ticker)
+        else:
+            self.__negative_cache.record_success(kind, ticker)
+        return value
+
+    @classmethod
+    def __is_empty(cls, kind: DataKind, value: Any) -> bool:
+        """Return whether a response of a kind that always has data came back empty."""
+        if kind not in cls.FAILED_WHEN_EMPTY:
+            return False
+        if value is None:
+            return True
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return value.empty
+        return isinstance(value, dict) and not value
@@ -0,0 +1,211 @@
+import logging
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from models.earnings_information import EarningsInformation
+from models.eps_information import EpsInformation
+from models.previous_earnings_information import PreviousEarningsInformation
+from utils.clock import Clock
+
+logger = logging.getLogger(__name__)
+
+
+class YahooEarningsParser:
+    """Class that turns raw yahoo finance earnings data into EarningsInformation.
+
+    It does no requests itself, so the synchronous and the asynchronous yahoo earnings providers
+    fetch the data in their own way and share the parsing.
+    """
+
+    PRICE_DAYS = 15
+    REACTION_DAYS_BEFORE = 5
+    REACTION_DAYS_AFTER = 6
+
+    def get_earnings_date(self, calendar: dict, cutoff: datetime) -> date | None:
+        """Get the date of the first upcoming earnings report for a company.
+
+        Returns a date only if it is sooner that cutoff time."""
+        try:
+            earnings_date = calendar.get("Earnings Date", None)[0]
+            if earnings_date is None or not (
+                Clock.get_instance().today() <= earnings_date <= cutoff
+            ):
+                return None
+            return earnings_date
+        except Exception as e:
+            logger.warning(f"Error fetching earnings date from calendar: {e}")
+            return None
+
+    def get_past_earnings(self, earnings_history: pd.DataFrame | None) -> pd.DataFrame:
+        """Returns the already published reports among the latest 5 earnings reports."""
+        try:
+            if earnings_history is None or earnings_history.empty:
+                return pd.DataFrame()
+            last_5 = earnings_history.head(5)
+            today = Clock.get_instance().today()
+            published = [edate.date() <= today for edate in last_5.index]
+            return last_5[published]
+        except Exception as e:
+            logger.warning(f"Error fetching previous earnings information: {e}")
+            return pd.DataFrame()
+
+    def get_history_window(self, past_earnings: pd.DataFrame) -> tuple[date, date]:
+        """Returns start and end of the price history needed for a company.
+
+        One history window covers both the last 15 trading days and the price reaction around every past
+        earnings report, so a company costs a single history request instead of one per report.
+        """
+        today = Clock.get_instance().today()
+        start = today - timedelta(days=2 * self.PRICE_DAYS)
+        if not past_earnings.empty:
+            oldest_report = min(edate.date() for edate in past_earnings.index)
+            start = min(
+                start, oldest_report - timedelta(days=self.REACTION_DAYS_BEFORE)
+            )
+        return start, today + timedelta(days=1)
+
+    def build(
+        self,
+        ticker: str,
+        earnings_date: date,
+        calendar: dict,
+        info: dict,
+        past_earnings: pd.DataFrame,
+        history: pd.DataFrame,
+    ) -> EarningsInformation:
+        """Put together earnings information of a company from its already fetched data.
+
+        Args:
+            ticker (str): Ticker of the company.
+            earnings_date (date): Date of the upcoming earnings report.
+            calendar (dict): Calendar of upcoming events of the company.
+            info (dict): Information about the company, empty if unavailable.
+            past_earnings (pd.DataFrame): Already published reports, see get_past_earnings.
+            history (pd.DataFrame): Price history covering get_history_window, empty if unavailable.
+
+        Returns:
+            EarningsInformation: Earnings information of the company.
+        """
+        closes = self.__get_closing_prices(history)
+        return EarningsInformation(
+            ticker=ticker,
+            name=self.__get_company_name(info),
+            date=earnings_date,
+            market_cap=self.__get_market_cap(info),
+            eps=self.__get_eps(calendar),
+            revenue=self.__get_revenue(calendar),
+            value_last_15_days=self.__get_price_last_15_days(closes),
+            previous_earnings=self.__get_previous_earnings(past_earnings, closes),
+        )
+
+    def __get_company_name(self, info: dict) -> str:
+        """Returns a name of the company based on ticker."""
+        try:
+            company_name = info.get("shortName", "")
+            return company_name
+        except Exception as e:
+            logger.warning(f"Error fetching company name: {e}")
+            return ""
+
+    def __get_market_cap(self, info: dict) -> int:
+        """Returns the market cap of a company."""
+        try:
+            market_cap = info.get("marketCap", 0)
+            return market_cap
+        except Exception as e:
+            logger.warning(f"Error fetching market cap: {e}")
+            return 0
+
+    def __get_eps(self, calendar: dict) -> EpsInformation | None:
+        """Returns EPS estimates for the next upcoming earnings report."""
+        try:
+            eps_avg = calendar.get("Earnings Average", None)
+            eps_low = calendar.get("Earnings Low", None)
+            eps_high = calendar.get("Earnings High", None)
+
+            if eps_avg is not None and eps_low is not None and eps_high is not None:
+                eps_info = EpsInformation(round(eps_avg, 2), eps_low, eps_high)
+                return eps_info
+            return None
+        except Exception as e:
+            logger.warning(f"Error fetching EPS information: {e}")
+            return None
+
+    def __get_revenue(self, calendar: dict) -> int:
+        """Returns the revenue of the company."""
+        try:
+            revenue = calendar.get("Revenue Average", 0)
+            return revenue
+        except Exception as e:
+            logger.warning(f"Error fetching revenue information: {e}")
+            return 0
+
+    def __get_closing_prices(self, hist: pd.DataFrame) -> pd.Series:
+        """Returns daily closing prices of a stock, indexed by timezone naive dates."""
+        try:
+            if hist.empty:
+                return pd.Series(dtype=float)
+            index = pd.DatetimeIndex(hist.index)
+            if index.tz is not None:
+                index = index.tz_localize(None)
+            return pd.Series(hist["Close"].to_numpy(dtype=float), index=index)
+        except Exception as e:
+            logger.warning(f"Error fetching price history: {e}")
+            return pd.Series(dtype=float)
+
+    def __get_price_last_15_days(self, closes: pd.Series) -> list[float]:
+        """Returns the Closing price of a stock of the last 15 days."""
+        return closes.tail(self.PRICE_DAYS).round(2).tolist()
+
+    def __get_previous_earnings(
+        self, past_earnings: pd.DataFrame, closes: pd.Series
+    ) -> list[PreviousEarningsInformation]:
+        """Returns EPS information about the last 4 earnings.
+
+        Price reaction is the change between the first close on or after 5 days before the report,
+        and the last close before 6 days after it, both looked up in the already fetched closing prices.
+        """
+        prev_earnings: list[PreviousEarningsInformation] = []
+        try:
+            if past_earnings.empty:
+                return prev_earnings
+
+            report_dates = pd.DatetimeIndex(
+                [edate.date() for edate in past_earnings.index]
+            )
+            first = closes.index.searchsorted(
+                report_dates - pd.Timedelta(days=self.REACTION_DAYS_BEFORE), side="left"
+            )
+            last = (
+                closes.index.searchsorted(
+                    report_dates + pd.Timedelta(days=self.REACTION_DAYS_AFTER),
+                    side="left",
+                )
+                - 1
+            )
+            price_diffs = np.zeros(len(report_dates))
+            has_prices = first <= last
+            if has_prices.any():
+                prices = closes.to_numpy()
+                price_before = prices[first[has_prices]]
+                price_after = prices[last[has_prices]]
+                price_diffs[has_prices] = (
+                    (price_after - price_before) / price_before * 100
+                )
+
+            for (_, row), price_diff in zip(
+                past_earnings.iterrows(), price_diffs, strict=True
+            ):
+                prev_earnings.append(
+                    PreviousEarningsInformation(
+                        expected_eps=float(row.get("EPS Estimate", 0.0)),
+                        actual_eps=float(row.get("Reported EPS", 0.0)),
+                        price_diff=float(price_diff),
+                    )
+                )
+            return prev_earnings
+        except Exception as e:
+            logger.warning(f"Error fetching previous earnings information: {e}")
+            return prev_earnings
@@ -1,12 +1,14 @@
 import logging
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 
-import yfinance as yf
+import pandas as pd
 
 from models.earnings_information import EarningsInformation
-from models.eps_information import EpsInformation
-from models.previous_earnings_information import PreviousEarningsInformation
 from providers.earnings_provider import EarningsProvider
+from providers.yahoo.yahoo_data_hub import YahooDataHub
+from providers.yahoo.yahoo_earnings_parser import YahooEarningsParser
+from utils.price_store import PriceStore
+from utils.ticker_executor import TickerExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,38 @@ logger = logging.getLogger(__name__)
 class YahooEarningsProvider(EarningsProvider):
     """Class that is responsible for providing Earnings information by using yahoo finance API."""
 
+    def __init__(self):
+        self.__executor = TickerExecutor.get_instance()
+        self.__data_hub = YahooDataHub.get_instance()
+        self.__parser = YahooEarningsParser()
+        self.__price_store = PriceStore.get_instance()
+
+    def fetch_earnings_dates(
+        self, tickers: list[str], cutoff: datetime
+    ) -> dict[str, date]:
+        """Return dates of upcoming earnings reports by reading only the calendars from yahoo finance API.
+
+        Calendars stay in the YahooDataHub, so enriching the same tickers with fetch_earnings doesn't request them again.
+
+        Args:
+            tickers (list[str]): List of tickers for which to check if there is an upcoming earnings report.
+            cutoff (datetime): How far into the future a report can't be to be included.
+
+        Returns:
+            dict[str, date]: Keys are tickers with an upcoming report before cutoff, values are report dates.
+        """
+        logger.debug(
+            f"Fetching all earnings dates until the {cutoff} using Yahoo Finance API."
+        )
+        dates = self.__executor.map(
+            lambda ticker: self.__fetch_earnings_date(ticker, cutoff), tickers
+        )
+        return {
+            ticker: earnings_date
+            for ticker, earnings_date in zip(tickers, dates, strict=True)
+            if earnings_date is not None
+        }
+
     def fetch_earnings(
         self, tickers: list[str], cutoff: datetime
     ) -> list[EarningsInformation]:
@@ -29,154 +63,104 @@ class YahooEarningsProvider(EarningsProvider):
         logger.debug(
             f"Fetching all earnings information until the {cutoff} using Yahoo Finance API."
         )
-        result: list[EarningsInformation] = []
-        for ticker in tickers:
-            try:
-                stock = yf.Ticker(ticker)
-
-                calendar = self.__get_stock_calendar(stock)
-                if not calendar:
-                    continue
-
-                earnings_date = self.__get_earnings_date(calendar, cutoff)
-                if earnings_date is None:
-                    continue
-
-                company_name = self.__get_company_name(stock)
-                market_cap = self.__get_market_cap(stock)
-                eps = self.__get_eps(calendar)
-                revenue = self.__get_revenue(calendar)
-                price_last_15_days = self.__get_price_last_15_days(stock)
-                prev_earnings = self.__get_previous_earnings(stock)
-
-                result.append(
-                    EarningsInformation(
-                        ticker=ticker,
-                        name=company_name,
-                        date=earnings_date,
-                        market_cap=market_cap,
-                        eps=eps,
-                        revenue=revenue,
-                        value_last_15_days=price_last_15_days,
-                        previous_earnings=prev_earnings,
-                    )
-                )
-
-            except Exception as e:
-                logger.warning(f"Error fetching earnings for {ticker}: {e}")
-                continue
-        return result
+        earnings = self.__executor.map(
+            lambda ticker: self.__fetch_ticker(ticker, cutoff), tickers
+        )
+        return [e for e in earnings if e is not None]
 
-    def __get_stock_calendar(self, stock: yf.Ticker) -> dict | None:
-        """Get the stock calendar that contains all useful information."""
+    def __fetch_earnings_date(self, ticker: str, cutoff: datetime) -> date | None:
+        """Return the upcoming earnings date of a single ticker, or None if it has no relevant upcoming report."""
         try:
-            calendar = stock.calendar
-            return calendar
+            calendar = self.__get_stock_calendar(ticker)
+            if not calendar:
+                return None
+            return self.__parser.get_earnings_date(calendar, cutoff)
         except Exception as e:
-            logger.warning(f"Error fetching calendar for stock: {e}")
+            logger.warning(f"Error fetching earnings date for {ticker}: {e}")
             return None
 
-    def __get_earnings_date(self, calendar: dict, cutoff: datetime) -> datetime | None:
-        """Get the date of the first upcoming earnings report for a company.
-
-        Returns a date only if it is sooner that cutoff time."""
+    def __fetch_ticker(
+        self, ticker: str, cutoff: datetime
+    ) -> EarningsInformation | None:
+        """Return earnings information for a single ticker, or None if it has no relevant upcoming report."""
         try:
-            earnings_date = calendar.get("Earnings Date", None)[0]
-            if earnings_date is None or not (
-                datetime.today().date() <= earnings_date <= cutoff
-            ):
+            calendar = self.__get_stock_calendar(ticker)
+            if not calendar:
                 return None
-            return earnings_date
+
+            earnings_date = self.__parser.get_earnings_date(calendar, cutoff)
+            if earnings_date is None:
+                return None
+
+            past_earnings = self.__parser.get_past_earnings(
+                self.__get_earnings_history(ticker)
+            )
+            return self.__parser.build(
+                ticker=ticker,
+                earnings_date=earnings_date,
+                calendar=calendar,
+                info=self.__get_info(ticker),
+                past_earnings=past_earnings,
+                history=self.__get_history(ticker, past_earnings),
+            )
+
         except Exception as e:
-            logger.warning(f"Error fetching earnings date from calendar: {e}")
+            logger.warning(f"Error fetching earnings for {ticker}: {e}")
             return None
 
-    def __get_company_name(self, stock: yf.Ticker) -> str:
-        """Returns a name of the company based on ticker."""
+    def __get_stock_calendar(self, ticker: str) -> dict | None:
+        """Get the stock calendar that contains all useful information."""
         try:
-            info = stock.info or {}
-            company_name = info.get("shortName", "")
-            return company_name
+            calendar = self.__data_hub.get_calendar(ticker)
+            return calendar
         except Exception as e:
-            logger.warning(f"Error fetching company name: {e}")
-            return ""
+            logger.warning(f"Error fetching calendar for stock: {e}")
+            return None
 
-    def __get_market_cap(self, stock: yf.Ticker) -> int:
-        """Returns the market cap of a company."""
+    def __get_info(self, ticker: str) -> dict:
+        """Returns information about the company, used for its name and market cap."""
         try:
-            info = stock.info or {}
-            market_cap = info.get("marketCap", 0)
-            return market_cap
+            return self.__data_hub.get_info(ticker) or {}
         except Exception as e:
-            logger.warning(f"Error fetching market cap: {e}")
-            return 0
+            logger.warning(f"Error fetching company information: {e}")
+            return {}
 
-    def __get_eps(self, calendar: dict) -> EpsInformation | None:
-        """Returns EPS estimates for the next upcoming earnings report."""
+    def __get_earnings_history(self, ticker: str) -> pd.DataFrame | None:
+        """Returns the latest earnings reports of a company."""
         try:
-            eps_avg = calendar.get("Earnings Average", None)
-            eps_low = calendar.get("Earnings Low", None)
-            eps_high = calendar.get("Earnings High", None)
-
-            if eps_avg is not None and eps_low is not None and eps_high is not None:
-                eps_info = EpsInformation(round(eps_avg, 2), eps_low, eps_high)
-                return eps_info
-            return None
+            return self.__data_hub.get_earnings_dates(ticker)
         except Exception as e:
-            logger.warning(f"Error fetching EPS information: {e}")
+            logger.warning(f"Error fetching previous earnings information: {e}")
             return None
 
-    def __get_revenue(self, calendar: dict) -> int:
-        """Returns the revenue of the company."""
-        try:
-            revenue = calendar.get("Revenue Average", 0)
-            return revenue
-        except Exception as e:
-            logger.warning(f"Error fetching revenue information: {e}")
-            return 0
+    def __get_history(self, ticker: str, past_earnings: pd.DataFrame) -> pd.DataFrame:
+        """Returns price history of a company covering the window the parser needs.
 
-    def __get_price_last_15_days(self, stock: yf.Ticker) -> list[float]:
-        """Returns the Closing price of a stock of the last 15 days."""
+        Only days missing in the PriceStore are requested, the rest is read from it.
+        """
+        start, end = self.__parser.get_history_window(past_earnings)
         try:
-            hist = stock.history(period="15d")
-            if not hist.empty:
-                return hist["Close"].round(2).tolist()
-            return []
+            if not self.__update_store(ticker, start, end):
+                self.__update_store(ticker, start, end)
+            return pd.DataFrame({"Close": self.__price_store.get(ticker, start, end)})
         except Exception as e:
             logger.warning(f"Error fetching price history: {e}")
-            return []
+            return pd.DataFrame()
 
-    def __get_previous_earnings(
-        self, stock: yf.Ticker
-    ) -> list[PreviousEarningsInformation]:
-        """Returns EPS information about the last 4 earnings."""
-        prev_earnings: list[PreviousEarningsInformation] = []
-        try:
-            earnings_history = stock.get_earnings_dates()
-            if earnings_history is not None and not earnings_history.empty:
-                last_5 = earnings_history.head(5)
-                for edate, row in last_5.iterrows():
-                    earnings_date = edate.date()
-                    if earnings_date > date.today():
-                        continue
-                    hist = stock.history(
-                        start=earnings_date - timedelta(days=5),
-                        end=earnings_date + timedelta(days=6),
-                    )
-                    if not hist.empty:
-                        price_before = hist.iloc[0]["Close"]
-                        price_after = hist.iloc[-1]["Close"]
-                        price_diff = (price_after - price_before) / price_before * 100
-                    else:
-                        price_diff = 0
-                    prev_earnings.append(
-                        PreviousEarningsInformation(
-                            expected_eps=float(row.get("EPS Estimate", 0.0)),
-                            actual_eps=float(row.get("Reported EPS", 0.0)),
-                            price_diff=float(price_diff),
-                        )
-                    )
-            return prev_earnings
-        except Exception as e:
-            logger.warning(f"Error fetching previous earnings information: {e}")
-            return prev_earnings
+    def __update_store(self, ticker: str, start: date, end: date) -> bool:
+        """Request days of a company missing in the PriceStore and merge them in.
+
+        Returns False if stored prices were adjusted since they were stored, and have to be requested again.
+        """
+        missing = self.__price_store.missing([ticker], start, end)
+        for range_start, range_end in missing:
+            history = self.__data_hub.get_history(
+                ticker, start=range_start, end=range_end
+            )
+            if history is None or history.empty:
+                continue
+            if not self.__price_store.merge(
+                ticker, history["Close"], range_start, range_end
+            ):
+                return False
+        return True
@@ -1,10 +1,14 @@
 import logging
+from typing import Iterator
 
-import yfinance as yf
+import numpy as np
+import pandas as pd
 
 from models.insider_information import InsiderInformation
 from providers.insider_provider import InsiderProvider
+from providers.yahoo.yahoo_data_hub import YahooDataHub
 from utils.enums.trade_type import TradeType
+from utils.ticker_executor import TickerExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +16,10 @@ logger = logging.getLogger(__name__)
 class YahooInsiderProvider(InsiderProvider):
     """Class that provides data about insider trading by using yahoo finance API."""
 
+    def __init__(self):
+        self.__executor = TickerExecutor.get_instance()
+        self.__data_hub = YahooDataHub.get_instance()
+
     def fetch_insider_trades(self, tickers: list[str]) -> list[InsiderInformation]:
         """Get all insider trades posted on yahoo finance.
 
@@ -21,35 +29,103 @@ class YahooInsiderProvider(InsiderProvider):
         Returns:
             list[InsiderInformation]: List of relevant insider trading information.
         """
+        return self.to_insider_information(self.fetch_insider_transactions(tickers))
+
+    def fetch_insider_transactions(self, tickers: list[str]) -> pd.DataFrame:
+        """Get all insider trades posted on yahoo finance as one table.
+
+        Args:
+            tickers (list[str]): Tickers for which to check insider trades.
+
+        Returns:
+            pd.DataFrame: One row per trade, with columns "ticker", "value", "type" and "date".
+        """
         logger.debug("Fetching all insider information by using Yahoo Finance API.")
 
-        insider_info: list[InsiderInformation] = []
-        for ticker in tickers:
-            try:
-                stock = yf.Ticker(ticker)
-                all_insider_info = stock.get_insider_transactions().to_dict(
-                    orient="records"
-                )
-                for row in all_insider_info:
-                    if not row["Text"]:
-                        continue
-                    insider_info.append(
-                        InsiderInformation(
-                            ticker=ticker,
-                            value=row["Value"],
-                            type=(
-                                TradeType.GIFT
-                                if row["Value"] == 0
-                                else (
-                                    TradeType.BUY
-                                    if "Purchase" in row["Text"]
-                                    else TradeType.SELL
-                                )
-                            ),
-                            date=row["Start Date"],
-                        )
-                    )
-            except Exception as e:
-                logger.warning(f"Error fetching previous earnings information: {e}")
-                continue
-        return insider_info
+        per_ticker = self.__executor.map(self.__fetch_ticker, tickers)
+        return self.concat_transactions(per_ticker)
+
+    def iter_insider_transactions(self, tickers: list[str]) -> Iterator[pd.DataFrame]:
+        """Yield a table of insider trades for every ticker as soon as it is fetched from yahoo finance API.
+
+        Args:
+            tickers (list[str]): Tickers for which to check insider trades.
+
+        Returns:
+            Iterator[pd.DataFrame]: One table per ticker with trades, in order of completion.
+        """
+        logger.debug("Streaming all insider information by using Yahoo Finance API.")
+
+        for transactions in self.__executor.map_unordered(self.__fetch_ticker, tickers):
+            if transactions is not None and not transactions.empty:
+                yield transactions
+
+    def __fetch_ticker(self, ticker: str) -> pd.DataFrame | None:
+        """Return classified insider trades of a single ticker, or None if they are unavailable."""
+        try:
+            transactions = self.__data_hub.get_insider_transactions(ticker)
+            return self.classify_transactions(ticker, transactions)
+        except Exception as e:
+            logger.warning(f"Error fetching insider trades for {ticker}: {e}")
+            return None
+
+    @staticmethod
+    def classify_transactions(ticker: str, transactions: pd.DataFrame) -> pd.DataFrame:
+        """Convert insider transactions from yahoo finance API to the provider table, for all rows at once.
+
+        Rows without a transaction text are dropped. A trade with zero value is a gift, a trade whose
+        text mentions a purchase is a buy, and everything else is a sell.
+
+        Args:
+            ticker (str): Ticker the transactions belong to.
+            transactions (pd.DataFrame): Insider transactions as returned by yahoo finance API.
+
+        Returns:
+            pd.DataFrame: One row per trade, with columns "ticker", "value", "type" and "date".
+        """
+        if transactions is None or transactions.empty:
+            return pd.DataFrame(columns=InsiderProvider.TRANSACTION_COLUMNS)
+
+        text = transactions["Text"].fillna("").astype(str)
+        value = pd.to_numeric(transactions["Value"], errors="coerce").fillna(0.0)
+        trade_type = np.where(
+            value == 0,
+            TradeType.GIFT.value,
+            np.where(
+                text.str.contains("Purchase", regex=False),
+                TradeType.BUY.value,
+                TradeType.SELL.value,
+            ),
+        )
+        classified = pd.DataFrame(
+            {
+                "ticker": ticker,
+                "value": value.clip(lower=0).to_numpy(dtype=float),
+                "type": trade_type,
+                "date": pd.to_datetime(transactions["Start Date"], utc=True),
+            }
+        )
+        return classified[(text != "").to_numpy()].reset_index(drop=True)
+
+    @staticmethod
+    def concat_transactions(per_ticker: list[pd.DataFrame | None]) -> pd.DataFrame:
+        """Join tables of separate tickers into one, skipping tickers without data."""
+        frames = [
+            frame for frame in per_ticker if frame is not None and not frame.empty
+        ]
+        if not frames:
+            return pd.DataFrame(columns=InsiderProvider.TRANSACTION_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def to_insider_information(transactions: pd.DataFrame) -> list[InsiderInformation]:
+        """Create an InsiderInformation object for every row of the provider table."""
+        return [
+            InsiderInformation(
+                ticker=row.ticker,
+                value=row.value,
+                type=TradeType(row.type),
+                date=row.date.to_pydatetime(),
+            )
+            for row in transactions.itertuples(index=False)
+        ]
@@ -1,10 +1,12 @@
 import logging
-from datetime import datetime
-
-import yfinance as yf
+import math
+from datetime import datetime, timedelta, timezone
 
 from models.news_article import NewsArticle
 from providers.news_provider import NewsProvider
+from providers.yahoo.yahoo_data_hub import YahooDataHub
+from utils.clock import Clock
+from utils.ticker_executor import TickerExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -12,9 +14,18 @@ logger = logging.getLogger(__name__)
 class YahooNewsProvider(NewsProvider):
     """Class that provides data about news articles by using yahoo finance API."""
 
+    PAGE_SIZE = 25
+    MAX_ARTICLES = 1000
+
+    def __init__(self):
+        self.__executor = TickerExecutor.get_instance()
+        self.__data_hub = YahooDataHub.get_instance()
+
     def fetch_news(self, tickers: list[str], days_behind: int) -> list[NewsArticle]:
         """Get all news articles posted on yahoo finance in the last {days_behind} days.
 
+        Articles are requested in growing pages, until a page reaches past the cutoff date.
+
         Args:
             tickers (list[str]): Tickers for which to check news articles.
             days_behind (int): How old can an article be to be included.
@@ -25,31 +36,82 @@ class YahooNewsProvider(NewsProvider):
         logger.debug(
             f"Fetching all news in the last {days_behind} days using Yahoo Finance API."
         )
+        cutoff = Clock.get_instance().now(timezone.utc) - timedelta(days=days_behind)
+
+        per_ticker = self.__executor.map(
+            lambda ticker: self.__fetch_ticker(ticker, cutoff), tickers
+        )
+        return [article for articles in per_ticker for article in articles]
+
+    def __fetch_ticker(self, ticker: str, cutoff: datetime) -> list[NewsArticle]:
+        """Return news articles of a single ticker, reaching at least back to cutoff if yahoo has them.
+
+        A ticker whose news can't be fetched, for example while its news failed recently or the circuit
+        of yahoo is open, has no articles instead of failing the whole section.
+        """
+        try:
+            count: int | None = self.PAGE_SIZE
+            while count is not None:
+                news = self.__data_hub.get_news(ticker, count, "all")
+                articles = self.parse_articles(ticker, news)
+                count = self.next_page_size(articles, len(news), count, cutoff)
+            return articles
+        except Exception as e:
+            logger.warning(f"Error fetching news for {ticker}: {e}")
+            return []
+
+    @classmethod
+    def next_page_size(
+        cls, articles: list[NewsArticle], received: int, count: int, cutoff: datetime
+    ) -> int | None:
+        """Return how many articles to request next, or None if the received ones are enough.
+
+        More articles are needed only when yahoo filled the whole page and even the oldest article
+        is newer than cutoff. The next page is at least twice as big, or as big as the publication
+        rate seen so far suggests the window needs.
+
+        Args:
+            articles (list[NewsArticle]): Articles parsed from the received page.
+            received (int): Number of raw articles in the received page.
+            count (int): Number of articles that was requested.
+            cutoff (datetime): Oldest publication date that is still needed.
+
+        Returns:
+            int | None: Number of articles to request next, or None to stop.
+        """
+        if received < count or count >= cls.MAX_ARTICLES or not articles:
+            return None
+        oldest = min(article.pub_time for article in articles)
+        if oldest < cutoff:
+            return None
+
+        now = Clock.get_instance().now(timezone.utc)
+        covered = max((now - oldest).total_seconds(), 1.0)
+        needed = (now - cutoff).total_seconds()
+        estimate = math.ceil(count * needed / covered * 1.25)
+        return min(cls.MAX_ARTICLES, max(2 * count, estimate))
+
+    @staticmethod
+    def parse_articles(ticker: str, news: list[dict]) -> list[NewsArticle]:
+        """Convert raw news articles from yahoo finance API to NewsArticle objects.
+
+        Args:
+            ticker (str): Ticker the articles were requested for.
+            news (list[dict]): Raw articles as returned by yahoo finance API.
+
+        Returns:
+            list[NewsArticle]: Converted articles, articles without content are skipped.
+        """
         result: list[NewsArticle] = []
-        limit = self.__news_limit(days_behind)
-
-        for ticker in tickers:
-            stock = yf.Ticker(ticker)
-            news = stock.get_news(limit, "all")
-
-            for article in news:
-                content = article.get("content", {})
-                if not content:
-                    continue
-                title = content.get("title", "")
-                summary = content.get("summary", "")
-                pub_date_str = content.get("pubDate", "1970-01-01T00:00:00Z")
-                pub_date = datetime.fromisoformat(pub_date_str.replace("Z", "+00:00"))
-                url = content.get("canonicalUrl", {}).get("url", "")
-                result.append(NewsArticle(title, summary, pub_date, url, ticker))
+        for article in news:
+            content = article.get("content", {})
+            if not content:
+                continue
+            title = content.get("title", "")
+            summary = content.get("summary", "")
+            pub_date_str = content.get("pubDate", "1970-01-01T00:00:00Z")
+            pub_date = datetime.fromisoformat(pub_date_str.replace("Z", "+00:00"))
+            url = content.get("canonicalUrl", {}).get("url", "")
+            result.append(NewsArticle(title, summary, pub_date, url, ticker))
 
         return result
-
-    def __news_limit(self, days_behind: int) -> int:
-        """Yahoo finance API for fetching news doesn't takes an argument limit which says how many articles it should return.
-        This method returns estimated limit based on days_behind parameter."""
-        if days_behind == 1:
-            return 150
-        if days_behind == 2:
-            return 300
-        return 1000
@@ -1,9 +1,16 @@
 import logging
+from datetime import date, timedelta
 
-import yfinance as yf
+import numpy as np
+import pandas as pd
 
+from models.price_matrix import PriceMatrix
 from models.price_performance_information import PricePerformanceInformation
 from providers.price_performance_provider import PricePerformanceProvider
+from providers.yahoo.yahoo_data_hub import YahooDataHub
+from utils.clock import Clock
+from utils.price_store import PriceStore
+from utils.ticker_executor import TickerExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +18,13 @@ logger = logging.getLogger(__name__)
 class YahooPricePerformanceProvider(PricePerformanceProvider):
     """Class that provides prices of stocks in a given period by using yahoo finance API."""
 
+    CHUNK_SIZE = 100
+
+    def __init__(self):
+        self.__executor = TickerExecutor.get_instance()
+        self.__data_hub = YahooDataHub.get_instance()
+        self.__price_store = PriceStore.get_instance()
+
     def fetch_price_performance(
         self, tickers: list[str], days_behind: int
     ) -> list[PricePerformanceInformation]:
@@ -23,21 +37,87 @@ class YahooPricePerformanceProvider(PricePerformanceProvider):
         Returns:
             list[PricePerformanceInformation]: List of price performances for all tickers.
         """
+        return self.fetch_price_matrix(tickers, days_behind).rows()
+
+    def fetch_price_matrix(self, tickers: list[str], days_behind: int) -> PriceMatrix:
+        """Get prices for all tickers in a given time period with yahoo API, as one matrix.
+
+        Prices are kept in the PriceStore, so only days that aren't stored yet are downloaded, usually just
+        the last one. Tickers missing the same days are downloaded in bulk, CHUNK_SIZE symbols per request.
+        Chunks are downloaded one after another, since yf.download keeps its results in module level state,
+        but each download fetches its symbols on as many threads as the shared TickerExecutor allows.
+
+        Args:
+            tickers (list[str]): List of tickers for which to get prices, in the order of the rows.
+            days_behind (int): How many days behind to get prices for.
+
+        Returns:
+            PriceMatrix: Prices of all tickers rounded to 2 decimals, tickers without prices have empty rows.
+        """
         logger.debug(
             f"Fetching all price performance data in the last {days_behind} days using Yahoo Finance API."
         )
-        result: list[PricePerformanceInformation] = []
-        for ticker in tickers:
-            try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period=f"{days_behind}d")
-                if not hist.empty:
-                    result.append(
-                        PricePerformanceInformation(
-                            ticker, hist["Close"].round(2).tolist()
-                        )
-                    )
-            except Exception as e:
-                logger.warning(f"Error fetching price performance for {ticker}: {e}")
-                continue
-        return result
+        end = Clock.get_instance().today() + timedelta(days=1)
+        start = end - timedelta(days=days_behind)
+        adjusted = self.__update_store(tickers, start, end)
+        if adjusted:
+            self.__update_store(adjusted, start, end)
+
+        try:
+            matrix = self.__price_store.matrix(tickers, start, end).round(2)
+        except Exception as e:
+            logger.warning(f"Error reading price performance from price store: {e}")
+            return PriceMatrix(
+                tickers, pd.DatetimeIndex([]), np.empty((len(tickers), 0))
+            )
+        for ticker, has_prices in zip(tickers, matrix.has_prices(), strict=True):
+            if not has_prices:
+                logger.warning(f"No price performance data for {ticker}.")
+        return matrix
+
+    def __update_store(self, tickers: list[str], start: date, end: date) -> list[str]:
+        """Download days missing in the PriceStore and merge them in.
+
+        Returns tickers whose stored prices were adjusted since they were stored, and have to be downloaded again.
+        """
+        adjusted: list[str] = []
+        missing = self.__price_store.missing(tickers, start, end)
+        for (range_start, range_end), range_tickers in missing.items():
+            for i in range(0, len(range_tickers), self.CHUNK_SIZE):
+                chunk = range_tickers[i : i + self.CHUNK_SIZE]
+                closes = self.__download_closes(chunk, range_start, range_end)
+                for ticker in chunk:
+                    if ticker not in closes.columns:
+                        continue
+                    try:
+                        if not self.__price_store.merge(
+                            ticker, closes[ticker], range_start, range_end
+                        ):
+                            adjusted.append(ticker)
+                    except Exception as e:
+                        logger.warning(f"Error storing prices of {ticker}: {e}")
+        return adjusted
+
+    def __download_closes(
+        self, tickers: list[str], start: date, end: date
+    ) -> pd.DataFrame:
+        """Download closing prices for multiple tickers in one request.
+
+        Returns a wide DataFrame with one column per ticker, or an empty DataFrame if the download failed.
+        """
+        try:
+            data = self.__data_hub.download(
+                tickers,
+                start=start,
+                end=end,
+                group_by="ticker",
+                threads=self.__executor.max_workers,
+                progress=False,
+                multi_level_index=True,
+            )
+            if data is None or data.empty:
+                return pd.DataFrame()
+            return data.xs("Close", axis=1, level=1)
+        except Exception as e:
+            logger.warning(f"Error downloading price performance for {tickers}: {e}")
+            return pd.DataFrame()
@@ -3,6 +3,8 @@ import logging
 from models.earnings_information import EarningsInformation
 from report_building.graph_builder import GraphBuilder
 from report_building.report_builder import ReportBuilder
+from report_building.svg_graph_builder import SvgGraphBuilder
+from utils.enums.chart_engine import ChartEngine
 from utils.localization import Localization
 
 logger = logging.getLogger(__name__)
@@ -11,9 +13,16 @@ logger = logging.getLogger(__name__)
 class EarningsBuilder(ReportBuilder):
     """Class responsible for creating a part of the report that includes Earnings information in .md format."""
 
-    def __init__(self, localization: Localization):
+    def __init__(
+        self, localization: Localization, chart_engine: ChartEngine = ChartEngine.PNG
+    ):
         logger.debug("EarningsBuilder initialized.")
-        self.__graph_builder = GraphBuilder(localization)
+        self.__chart_engine = chart_engine
+        self.__graph_builder = (
+            SvgGraphBuilder(localization)
+            if chart_engine is ChartEngine.SVG
+            else GraphBuilder(localization)
+        )
         super().__init__(localization)
 
     def build_markdown(self, earnings_data: list[EarningsInformation]) -> str:
@@ -29,11 +38,10 @@ class EarningsBuilder(ReportBuilder):
         md = []
         md.append(f"## {self._localization.translate("earnings_title")}\n")
         md.append(f"{self._localization.translate("earnings_intro")}\n")
-        for earning in earnings_data:
-            graph_path = self.__graph_builder.build_price_graph(
-                earning.value_last_15_days, earning.ticker
-            )
-
+        graph_paths = self.__graph_builder.build_price_graphs(
+            [(earning.value_last_15_days, earning.ticker) for earning in earnings_data]
+        )
+        for earning, graph_path in zip(earnings_data, graph_paths, strict=True):
             md.append(f"### {earning.name} - {earning.ticker}")
             md.append(
                 f"- **{self._localization.translate("earnings_date")}** {earning.date.strftime('%d.%m.%Y')}"
@@ -103,7 +111,9 @@ class EarningsBuilder(ReportBuilder):
                 md.append(
                     f"\n**{self._localization.translate("earnings_price_chart")}**\n"
                 )
-                md.append(f"![Price chart]({graph_path})")
+                md.append(
+                    self._graph_markdown(graph_path, "Price chart", self.__chart_engine)
+                )
 
             md.append('<div class="page-break"></div>')
 
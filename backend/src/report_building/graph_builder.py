@@ -1,18 +1,80 @@
 import logging
 import os
 import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
+from utils import constants
 from utils.localization import Localization
 from utils.singleton_meta import SingletonMeta
 
 logger = logging.getLogger(__name__)
 
 
+def _render_price_graph(
+    prices: list[float], path: str, x_label: str, y_label: str
+) -> str:
+    """Draw a price graph on its own Figure and Agg canvas and save it to path.
+
+    Nothing is shared with pyplot or other figures, so graphs can be drawn in many threads at once.
+    """
+    x = range(len(prices))
+    detailed = len(prices) <= 20
+
+    figure = Figure(figsize=(8, 4))
+    canvas = FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+
+    if detailed:
+        axes.plot(x, prices, marker="o")
+    else:
+        axes.plot(x, prices)
+
+    if detailed:
+        pct_changes = [
+            (prices[i] - prices[i - 1]) / prices[i - 1] * 100 if prices[i - 1] else 0.0
+            for i in range(1, len(prices))
+        ]
+
+        for i, price in enumerate(prices):
+            if i == 0:
+                continue
+            pct = pct_changes[i - 1]
+            axes.annotate(
+                f"{pct:+.2f}%",
+                (i, price),
+                xytext=(0, 8),
+                textcoords="offset points",
+                ha="center",
+                fontsize=8,
+                color="green" if pct > 0 else "red" if pct < 0 else "gray",
+            )
+
+    min_p, max_p = min(prices), max(prices)
+    margin = (max_p - min_p) * 0.1 or max(1.0, abs(max_p) * 0.01)
+    axes.set_ylim(min_p - margin, max_p + margin)
+
+    axes.set_xlabel(x_label)
+    axes.set_ylabel(y_label)
+    axes.grid(True)
+
+    figure.tight_layout()
+    canvas.print_png(path)
+
+    return path
+
+
 class GraphBuilder(metaclass=SingletonMeta):
-    """Class responsible for creating graphs that are represented in a report by using matplotlib library."""
+    """Class responsible for creating graphs that are represented in a report by using matplotlib library.
+
+    Every graph is drawn on its own Figure with an Agg canvas instead of the global pyplot state, so
+    graphs of a whole section can be rendered at the same time, in a pool of up to MAX_GRAPH_WORKERS threads.
+    Threads are used instead of processes, spawning a process pool costs more than rendering a section.
+    """
 
     def __init__(self, localization: Localization, output_dir="graphs"):
         logger.debug("GraphBuilder initialized.")
@@ -32,54 +94,50 @@ class GraphBuilder(metaclass=SingletonMeta):
         X axis is time [days].
         """
         logger.debug(f"Building price graph for {ticker}.")
-        x = range(len(prices))
-        detailed = len(prices) <= 20
-
-        plt.figure(figsize=(8, 4))
-
-        if detailed:
-            plt.plot(x, prices, marker="o")
-        else:
-            plt.plot(x, prices)
-
-        if detailed:
-            pct_changes = [
-                (
-                    (prices[i] - prices[i - 1]) / prices[i - 1] * 100
-                    if prices[i - 1]
-                    else 0.0
-                )
-                for i in range(1, len(prices))
-            ]
-
-            for i, price in enumerate(prices):
-                if i == 0:
-                    continue
-                pct = pct_changes[i - 1]
-                plt.annotate(
-                    f"{pct:+.2f}%",
-                    (i, price),
-                    xytext=(0, 8),
-                    textcoords="offset points",
-                    ha="center",
-                    fontsize=8,
-                    color="green" if pct > 0 else "red" if pct < 0 else "gray",
-                )
-
-        min_p, max_p = min(prices), max(prices)
-        margin = (max_p - min_p) * 0.1 or max(1.0, abs(max_p) * 0.01)
-        plt.ylim(min_p - margin, max_p + margin)
-
-        plt.xlabel(f"{self.__localization.translate("graph_days")}")
-        plt.ylabel(f"{self.__localization.translate("graph_price")}")
-        plt.grid(True)
-
-        path = os.path.join(
-            self.__output_dir, f"{ticker}_{datetime.now():%Y%m%d_%H%M%S}.png"
-        )
+        return _render_price_graph(prices, self.__path(ticker), *self.__labels())
+
+    def build_price_graphs(
+        self, charts: list[tuple[list[float], str]]
+    ) -> list[str | None]:
+        """Creates price graphs of many companies at once, rendered in a pool of threads.
 
-        plt.tight_layout()
-        plt.savefig(path)
-        plt.close()
+        Args:
+            charts (list[tuple[list[float], str]]): Prices and ticker of every graph.
 
-        return path
+        Returns:
+            list[str | None]: Paths of the graphs in the order of charts, None for graphs that couldn't be rendered.
+        """
+        logger.debug(f"Building {len(charts)} price graphs.")
+        jobs = [
+            (prices, self.__path(ticker), *self.__labels()) for prices, ticker in charts
+        ]
+        workers = min(len(jobs), os.cpu_count() or 1, constants.MAX_GRAPH_WORKERS)
+        if workers <= 1:
+            return [self.__render_safely(*job) for job in jobs]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda job: self.__render_safely(*job), jobs))
+
+    def __render_safely(
+        self, prices: list[float], path: str, x_label: str, y_label: str
+    ) -> str | None:
+        """Render a graph, returning None if it couldn't be rendered."""
+        try:
+            return _render_price_graph(prices, path, x_label, y_label)
+        except Exception as e:
+            logger.warning(f"Error rendering graph {path}: {e}")
+            return None
+
+    def __path(self, ticker: str) -> str:
+        """Return a new path a graph of ticker is saved to, unique even for graphs of the same ticker in the same second."""
+        return os.path.join(
+            self.__output_dir,
+            f"{ticker}_{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}.png",
+        )
+
+    def __labels(self) -> tuple[str, str]:
+        """Return translated labels of the x and y axis."""
+        return (
+            self.__localization.translate("graph_days"),
+            self.__localization.translate("graph_price"),
+        )
@@ -4,7 +4,9 @@ from typing import Dict
 from models.price_performance_information import PricePerformanceInformation
 from report_building.graph_builder import GraphBuilder
 from report_building.report_builder import ReportBuilder
+from report_building.svg_graph_builder import SvgGraphBuilder
 from utils import constants
+from utils.enums.chart_engine import ChartEngine
 from utils.localization import Localization
 
 logger = logging.getLogger(__name__)
@@ -13,9 +15,16 @@ logger = logging.getLogger(__name__)
 class PricePerformanceBuilder(ReportBuilder):
     """Class that create a part of the report that includes price performance information in .md format."""
 
-    def __init__(self, localization: Localization):
+    def __init__(
+        self, localization: Localization, chart_engine: ChartEngine = ChartEngine.PNG
+    ):
         logger.debug("PricePerformanceBuilder initialized.")
-        self.__graph_builder = GraphBuilder(localization)
+        self.__chart_engine = chart_engine
+        self.__graph_builder = (
+            SvgGraphBuilder(localization)
+            if chart_engine is ChartEngine.SVG
+            else GraphBuilder(localization)
+        )
         super().__init__(localization)
 
     def build_markdown(
@@ -33,13 +42,15 @@ class PricePerformanceBuilder(ReportBuilder):
         md = []
         md.append(f"## {self._localization.translate("price_perf_title")}\n")
         md.append(f"{self._localization.translate("price_perf_intro")}\n")
-        if price_perf_data["winners"]:
+        winners, losers = price_perf_data["winners"], price_perf_data["losers"]
+        graph_paths = self.__graph_builder.build_price_graphs(
+            [(perf.prices, perf.ticker) for perf in winners + losers]
+        )
+        if winners:
             md.append(f"### {self._localization.translate("price_perf_best")}\n")
-            for price_perf in price_perf_data["winners"]:
-                graph_path = self.__graph_builder.build_price_graph(
-                    price_perf.prices, price_perf.ticker
-                )
-
+            for price_perf, graph_path in zip(
+                winners, graph_paths[: len(winners)], strict=True
+            ):
                 md.append(
                     f"**{constants.TICKER_TO_COMPANY[price_perf.ticker]} - {price_perf.ticker}**"
                 )
@@ -52,15 +63,19 @@ class PricePerformanceBuilder(ReportBuilder):
                 md.append(
                     f"- {self._localization.translate("price_perf_change")} {price_perf.percent_change} %\n"
                 )
-                md.append(f"![Grafik performansi cene]({graph_path})\n")
+                if graph_path:
+                    md.append(
+                        self._graph_markdown(
+                            graph_path, "Grafik performansi cene", self.__chart_engine
+                        )
+                        + "\n"
+                    )
 
-        if price_perf_data["losers"]:
+        if losers:
             md.append(f"### {self._localization.translate("price_perf_worst")}\n")
-            for price_perf in price_perf_data["losers"]:
-                graph_path = self.__graph_builder.build_price_graph(
-                    price_perf.prices, price_perf.ticker
-                )
-
+            for price_perf, graph_path in zip(
+                losers, graph_paths[len(winners) :], strict=True
+            ):
                 md.append(
                     f"**{constants.TICKER_TO_COMPANY[price_perf.ticker]} - {price_perf.ticker}**"
                 )
@@ -73,7 +88,13 @@ class PricePerformanceBuilder(ReportBuilder):
                 md.append(
                     f"- {self._localization.translate("price_perf_change")} {price_perf.percent_change} %\n"
                 )
-                md.append(f"![Grafik performansi cene]({graph_path})\n")
+                if graph_path:
+                    md.append(
+                        self._graph_markdown(
+                            graph_path, "Grafik performansi cene", self.__chart_engine
+                        )
+                        + "\n"
+                    )
 
         md.append('<div class="page-break"></div>')
         return "\n".join(md)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from utils.enums.chart_engine import ChartEngine
 from utils.localization import Localization
 
 
@@ -16,3 +17,19 @@ class ReportBuilder(ABC):
         Returns:
             str: Contains a part of the report in .md format.
         """
+
+    @staticmethod
+    def _graph_markdown(graph: str, alt: str, chart_engine: ChartEngine) -> str:
+        """Return .md that shows a graph, an image of a PNG file or an inline SVG block.
+
+        Args:
+            graph (str): Path of a PNG graph, or markup of an SVG graph.
+            alt (str): Alternative text of a PNG graph.
+            chart_engine (ChartEngine): Engine the graph was drawn with.
+
+        Returns:
+            str: Markdown showing the graph.
+        """
+        if chart_engine is ChartEngine.SVG:
+            return f'\n<div class="chart">{graph}</div>\n'
+        return f"![{alt}]({graph})"
@@ -1,19 +1,24 @@
 import logging
 import os
-from datetime import date
 
 import markdown as md_pkg
 
 from models.section_data import SectionData
+from providers.yahoo.yahoo_data_hub import YahooDataHub
 from sections.analyst_section import AnalystSection
 from sections.earnings_section import EarningsSection
 from sections.insider_section import InsiderSection
 from sections.news_section import NewsSection
 from sections.price_performance_section import PricePerformanceSection
 from sections.report_section import ReportSection
+from utils.clock import Clock
 from utils.enums.language import Language
 from utils.enums.section_type import SectionType
 from utils.localization import Localization
+from utils.negative_cache import NegativeCache
+from utils.news_index import NewsIndex
+from utils.price_store import PriceStore
+from utils.response_cache import ResponseCache
 from utils.weasyprint_compat import HTML
 
 logger = logging.getLogger(__name__)
@@ -37,7 +42,7 @@ class ReportBuilderDirector:
     def __build_markdown(self, section_data: list[SectionData]) -> str:
         """Creates a whole report in .md format by calling all sections it contains."""
         logger.debug("Building markdown content for the report.")
-        today = date.today().strftime("%d.%m.%Y")
+        today = Clock.get_instance().today().strftime("%d.%m.%Y")
 
         md = []
 
@@ -49,18 +54,40 @@ class ReportBuilderDirector:
 
         return "\n".join(md)
 
-    def create_pdf_report(self, section_data: list[SectionData]) -> str:
+    def create_pdf_report(
+        self, section_data: list[SectionData], use_cache: bool = True
+    ) -> str:
         """Creates a pdf report that is a final produce of the whole application.
 
         Args:
             section_data (list[SectionData]): Information about sections that are supposed to be in the report.
+            use_cache (bool): Whether responses stored by earlier runs can be reused. Defaults to True.
 
         Returns:
             str: path to a pdf report that is created and saved.
         """
         logger.debug("Creating PDF report.")
-        md_content = self.__build_markdown(section_data)
-        today_str = date.today().strftime("%Y%m%d")
+        response_cache = ResponseCache.get_instance()
+        response_cache.set_bypass(not use_cache)
+        response_cache.reset_statistics()
+        PriceStore.get_instance().set_bypass(not use_cache)
+        negative_cache = NegativeCache.get_instance()
+        negative_cache.set_bypass(not use_cache)
+        negative_cache.reset_statistics()
+        news_index = NewsIndex.get_instance()
+        news_index.set_bypass(not use_cache)
+        news_index.reset_statistics()
+        YahooDataHub.clear()
+        try:
+            md_content = self.__build_markdown(section_data)
+        finally:
+            YahooDataHub.clear()
+        logger.info(
+            f"Response cache: {response_cache.hits} hits, {response_cache.misses} misses, "
+            f"{negative_cache.skipped} recently failed requests skipped, "
+            f"{news_index.dropped} already reported articles dropped."
+        )
+        today_str = Clock.get_instance().today().strftime("%Y%m%d")
 
         html_body = md_pkg.markdown(md_content, extensions=["extra", "nl2br"])
 
@@ -69,6 +96,7 @@ class ReportBuilderDirector:
             "<style>"
             "body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial; padding: 1rem; }"
             "img { max-width: 100% !important; height: auto !important; display: block; margin: 0 auto 1rem; }"
+            ".chart svg { width: 100%; height: auto; display: block; margin: 0 auto 1rem; }"
             "table { border-collapse: collapse; margin: 1rem 0; width: 100%; }"
             "th, td { border: 1px solid #333; padding: 6px 10px; text-align: center; }"
             "th { background-color: #f0f0f0; font-weight: bold; }"
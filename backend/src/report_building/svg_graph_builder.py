@@ -0,0 +1,158 @@
+import logging
+import math
+from xml.sax.saxutils import escape
+
+from utils.localization import Localization
+
+logger = logging.getLogger(__name__)
+
+
+class SvgGraphBuilder:
+    """Class responsible for creating graphs as inline SVG line charts, without matplotlib.
+
+    Graphs look like the ones of GraphBuilder: prices of up to 20 days get point markers and a percent
+    change above every point, and the y axis leaves a margin of a tenth of the price range. Each graph
+    is returned as a single line of SVG markup that is placed into the report as it is, so nothing is
+    rasterized or written to disk.
+    """
+
+    WIDTH = 800
+    HEIGHT = 400
+    LEFT = 70
+    RIGHT = 20
+    TOP = 20
+    BOTTOM = 50
+    X_PADDING = 0.05
+    DETAILED_POINTS = 20
+    MAX_TICKS = 6
+    COLOR = "#1f77b4"
+    GRID_COLOR = "#b0b0b0"
+
+    def __init__(self, localization: Localization):
+        logger.debug("SvgGraphBuilder initialized.")
+        self.__localization = localization
+
+    def build_price_graph(self, prices: list[float], ticker: str) -> str:
+        """Creates an SVG graph that represents the change of price of a given company.
+        Y axis is price [$].
+        X axis is time [days].
+        """
+        logger.debug(f"Building SVG price graph for {ticker}.")
+        if not prices:
+            raise ValueError(f"No prices to draw for {ticker}.")
+
+        count = len(prices)
+        x_span = max(count - 1, 1)
+        x_min = -x_span * self.X_PADDING
+        x_max = count - 1 + x_span * self.X_PADDING
+
+        min_p, max_p = min(prices), max(prices)
+        margin = (max_p - min_p) * 0.1 or max(1.0, abs(max_p) * 0.01)
+        y_min, y_max = min_p - margin, max_p + margin
+
+        plot_width = self.WIDTH - self.LEFT - self.RIGHT
+        plot_height = self.HEIGHT - self.TOP - self.BOTTOM
+
+        def to_x(value: float) -> float:
+            return self.LEFT + (value - x_min) / (x_max - x_min) * plot_width
+
+        def to_y(value: float) -> float:
+            return self.TOP + (y_max - value) / (y_max - y_min) * plot_height
+
+        bottom = self.TOP + plot_height
+        right = self.LEFT + plot_width
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {self.WIDTH} {self.HEIGHT}" '
+            f'width="{self.WIDTH}" height="{self.HEIGHT}" font-family="sans-serif" font-size="12">',
+            f"<title>{escape(ticker)}</title>",
+        ]
+
+        for tick in self.__ticks(x_min, x_max, integers=True):
+            x = to_x(tick)
+            parts.append(
+                f'<line x1="{x:.1f}" y1="{self.TOP}" x2="{x:.1f}" y2="{bottom}" stroke="{self.GRID_COLOR}" stroke-width="0.5"/>'
+                f'<text x="{x:.1f}" y="{bottom + 16}" text-anchor="middle">{tick:g}</text>'
+            )
+        for tick in self.__ticks(y_min, y_max):
+            y = to_y(tick)
+            parts.append(
+                f'<line x1="{self.LEFT}" y1="{y:.1f}" x2="{right}" y2="{y:.1f}" stroke="{self.GRID_COLOR}" stroke-width="0.5"/>'
+                f'<text x="{self.LEFT - 6}" y="{y + 4:.1f}" text-anchor="end">{tick:g}</text>'
+            )
+        parts.append(
+            f'<rect x="{self.LEFT}" y="{self.TOP}" width="{plot_width}" height="{plot_height}" fill="none" stroke="black"/>'
+        )
+
+        points = " ".join(
+            f"{to_x(i):.1f},{to_y(price):.1f}" for i, price in enumerate(prices)
+        )
+        parts.append(
+            f'<polyline points="{points}" fill="none" stroke="{self.COLOR}" stroke-width="1.5"/>'
+        )
+
+        if count <= self.DETAILED_POINTS:
+            for i, price in enumerate(prices):
+                x, y = to_x(i), to_y(price)
+                parts.append(
+                    f'<circle cx="{x:.1f}" cy="{y:.1f}" r="3" fill="{self.COLOR}"/>'
+                )
+                if i == 0:
+                    continue
+                pct = (
+                    (price - prices[i - 1]) / prices[i - 1] * 100
+                    if prices[i - 1]
+                    else 0.0
+                )
+                color = "green" if pct > 0 else "red" if pct < 0 else "gray"
+                parts.append(
+                    f'<text x="{x:.1f}" y="{y - 8:.1f}" text-anchor="middle" font-size="8" fill="{color}">{pct:+.2f}%</text>'
+                )
+
+        parts.append(
+            f'<text x="{self.LEFT + plot_width / 2:.1f}" y="{self.HEIGHT - 8}" text-anchor="middle">'
+            f'{escape(self.__localization.translate("graph_days"))}</text>'
+        )
+        parts.append(
+            f'<text x="16" y="{self.TOP + plot_height / 2:.1f}" text-anchor="middle" '
+            f'transform="rotate(-90 16 {self.TOP + plot_height / 2:.1f})">'
+            f'{escape(self.__localization.translate("graph_price"))}</text>'
+        )
+        parts.append("</svg>")
+        return "".join(parts)
+
+    def build_price_graphs(
+        self, charts: list[tuple[list[float], str]]
+    ) -> list[str | None]:
+        """Creates SVG price graphs of many companies.
+
+        Args:
+            charts (list[tuple[list[float], str]]): Prices and ticker of every graph.
+
+        Returns:
+            list[str | None]: SVG markup of the graphs in the order of charts, None for graphs that couldn't be drawn.
+        """
+        graphs: list[str | None] = []
+        for prices, ticker in charts:
+            try:
+                graphs.append(self.build_price_graph(prices, ticker))
+            except Exception as e:
+                logger.warning(f"Error drawing SVG graph of {ticker}: {e}")
+                graphs.append(None)
+        return graphs
+
+    def __ticks(self, low: float, high: float, integers: bool = False) -> list[float]:
+        """Return evenly spaced round values between low and high, at most MAX_TICKS of them."""
+        raw_step = (high - low) / self.MAX_TICKS
+        if raw_step <= 0:
+            return []
+        magnitude = 10 ** math.floor(math.log10(raw_step))
+        step = next(
+            factor * magnitude
+            for factor in (1, 2, 2.5, 5, 10)
+            if factor * magnitude >= raw_step
+        )
+        if integers:
+            step = max(1, round(step))
+        first = math.ceil(low / step)
+        last = math.floor(high / step)
+        return [round(i * step, 10) for i in range(first, last + 1)]
@@ -17,7 +17,9 @@ class EarningsSection(ReportSection):
         self.__manager = EarningsManager(
             section_data.provider, section_data.days_ahead, section_data.tickers
         )
-        self.__builder = EarningsBuilder(Localization(section_data.language))
+        self.__builder = EarningsBuilder(
+            Localization(section_data.language), section_data.chart_engine
+        )
         self.__number_of_companies = section_data.number_of_companies
 
     def generate(self) -> str:
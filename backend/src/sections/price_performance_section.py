@@ -17,7 +17,9 @@ class PricePerformanceSection(ReportSection):
         self.__manager = PricePerformanceManager(
             section_data.provider, section_data.days_behind, section_data.tickers
         )
-        self.__builder = PricePerformanceBuilder(Localization(section_data.language))
+        self.__builder = PricePerformanceBuilder(
+            Localization(section_data.language), section_data.chart_engine
+        )
         self.__number_of_companies = section_data.number_of_companies
 
     def generate(self) -> str:
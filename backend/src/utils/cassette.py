@@ -0,0 +1,133 @@
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class Cassette:
+    """Class that stores raw upstream responses in a SQLite file, so a report can be replayed offline.
+
+    Entries are grouped into channels. Responses read through the YahooDataHub are stored as the
+    python objects yfinance returned, under the channel of their data kind. Plain HTTP responses
+    (AsyncYahooClient, AiService) are stored under HTTP_CHANNEL as (status, content type, body),
+    keyed by http_key of the request.
+
+    Requests depend on the day they were sent, so the moment of recording is stored under META_CHANNEL,
+    and a replay pins the Clock to it.
+    """
+
+    HTTP_CHANNEL = "http"
+    META_CHANNEL = "meta"
+    RECORDED_AT_KEY = "recorded_at"
+    IGNORED_PARAMS = frozenset({"crumb"})
+
+    def __init__(self, path: Path):
+        self.__path = Path(path)
+        logger.debug(f"Cassette opened at {self.__path}.")
+        self.__lock = threading.Lock()
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        self.__connection = sqlite3.connect(self.__path, check_same_thread=False)
+        with self.__connection:
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "channel TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                "PRIMARY KEY (channel, key))"
+            )
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM entries").fetchone()[
+                0
+            ]
+
+    def get(self, channel: str, key: str) -> tuple[bool, Any]:
+        """Return a recorded response.
+
+        Args:
+            channel (str): Channel the response was recorded in.
+            key (str): Key identifying the request within its channel.
+
+        Returns:
+            tuple[bool, Any]: Whether the response was found, and the response itself (None when not found).
+        """
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT value FROM entries WHERE channel = ? AND key = ?",
+                (channel, key),
+            ).fetchone()
+        if row is None:
+            return False, None
+        return True, pickle.loads(row[0])
+
+    def put(self, channel: str, key: str, value: Any):
+        """Record a response, replacing an earlier recording of the same request.
+
+        Args:
+            channel (str): Channel to record the response in.
+            key (str): Key identifying the request within its channel.
+            value (Any): Response to record, it has to be picklable.
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO entries (channel, key, value) VALUES (?, ?, ?)",
+                (channel, key, blob),
+            )
+
+    @property
+    def recorded_at(self) -> datetime | None:
+        """Moment the cassette was recorded, None for cassettes recorded before it was stored."""
+        found, value = self.get(self.META_CHANNEL, self.RECORDED_AT_KEY)
+        return value if found else None
+
+    def set_recorded_at(self, moment: datetime):
+        """Store the moment the cassette is recorded.
+
+        Args:
+            moment (datetime): Time zone aware moment the recording started.
+        """
+        self.put(self.META_CHANNEL, self.RECORDED_AT_KEY, moment)
+
+    def close(self):
+        """Close the underlying database."""
+        with self.__lock:
+            self.__connection.close()
+
+    @classmethod
+    def http_key(
+        cls, method: str, url: str, params: dict | None = None, body: Any = None
+    ) -> str:
+        """Return the key of an HTTP request, independent of the host it was sent to.
+
+        Parameters are sorted and session parameters (the yahoo crumb) are left out, so the same
+        request recorded against the real API matches when it is sent to the StandInServer.
+
+        Args:
+            method (str): HTTP method of the request.
+            url (str): URL of the request, only its path is used.
+            params (dict | None): Query parameters of the request.
+            body (Any): JSON body of the request, None if it has no body.
+
+        Returns:
+            str: Key of the request.
+        """
+        query = urlencode(
+            sorted(
+                (name, str(value))
+                for name, value in (params or {}).items()
+                if name not in cls.IGNORED_PARAMS
+            )
+        )
+        payload = json.dumps(body, sort_keys=True) if body is not None else ""
+        return f"{method.upper()} {urlsplit(url).path}?{query} {payload}"
@@ -0,0 +1,204 @@
+import logging
+import pickle
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from utils.cassette import Cassette
+from utils.clock import Clock
+from utils.enums.cassette_mode import CassetteMode
+from utils.negative_cache import NegativeCache
+from utils.news_index import NewsIndex
+from utils.price_store import PriceStore
+from utils.rate_limiter import RateLimiter
+from utils.response_cache import ResponseCache
+from utils.singleton_meta import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+class CassettePlayer(metaclass=SingletonMeta):
+    """Class that switches all outbound requests between the real APIs, recording and replaying.
+
+    YahooDataHub, AsyncYahooClient and AiService ask the player what to do with every response. When
+    recording, responses are stored in a Cassette. When replaying, they are requested from a
+    StandInServer instead of the real APIs, and the RateLimiter is bypassed, because the stand-in
+    server has no limits to respect. While replaying, the Clock is pinned to the moment the cassette was
+    recorded, so date windows of requests are the same as when they were recorded.
+
+    Recorded and replayed runs must not leave anything behind for regular runs, so while a cassette is
+    active, the ResponseCache, PriceStore, NegativeCache and NewsIndex are swapped for empty ones in a
+    temporary directory, and the previous ones are put back when the player stops.
+    """
+
+    TIMEOUT = 30
+    STORES = (ResponseCache, PriceStore, NegativeCache, NewsIndex)
+
+    def __init__(self):
+        logger.debug("CassettePlayer initialized.")
+        self.__mode = CassetteMode.OFF
+        self.__cassette: Cassette | None = None
+        self.__server_url: str | None = None
+        self.__scratch: tempfile.TemporaryDirectory | None = None
+        self.__kept_stores: dict[type, Any] = {}
+
+    @property
+    def mode(self) -> CassetteMode:
+        return self.__mode
+
+    @property
+    def server_url(self) -> str | None:
+        return self.__server_url
+
+    def record(self, cassette: Cassette):
+        """Store every upstream response in cassette from now on.
+
+        Args:
+            cassette (Cassette): Cassette to record into.
+        """
+        logger.info(f"Recording upstream responses into {cassette.path}.")
+        cassette.set_recorded_at(Clock.get_instance().now(timezone.utc))
+        self.__isolate_stores()
+        self.__mode = CassetteMode.RECORD
+        self.__cassette = cassette
+        self.__server_url = None
+
+    def replay(self, server_url: str, recorded_at: datetime | None = None):
+        """Request every response from a StandInServer from now on.
+
+        Args:
+            server_url (str): Base URL of the running StandInServer.
+            recorded_at (datetime | None): Moment the replayed cassette was recorded, the Clock is pinned to it.
+                None leaves the clock running, then only requests of the current day are found.
+        """
+        logger.info(f"Replaying upstream responses from {server_url}.")
+        if recorded_at is not None:
+            Clock.get_instance().pin(recorded_at)
+        else:
+            logger.warning(
+                "Replayed cassette has no recording time, requests depending on the date may be missing."
+            )
+        self.__isolate_stores()
+        self.__mode = CassetteMode.REPLAY
+        self.__cassette = None
+        self.__server_url = server_url.rstrip("/")
+        RateLimiter.get_instance().set_bypass(True)
+
+    def stop(self):
+        """Go back to sending requests to the real APIs without recording them."""
+        if self.__mode is CassetteMode.REPLAY:
+            RateLimiter.get_instance().set_bypass(False)
+            Clock.get_instance().unpin()
+        self.__restore_stores()
+        self.__mode = CassetteMode.OFF
+        self.__cassette = None
+        self.__server_url = None
+
+    def replay_url(self, url: str) -> str:
+        """Return url pointed at the StandInServer when replaying, unchanged otherwise."""
+        if self.__mode is not CassetteMode.REPLAY:
+            return url
+        parts = urlsplit(url)
+        return f"{self.__server_url}{parts.path}" + (
+            f"?{parts.query}" if parts.query else ""
+        )
+
+    def store(self, channel: str, key: str, value: Any):
+        """Record a response read through the YahooDataHub, if recording.
+
+        Args:
+            channel (str): Channel of the response, the value of its DataKind.
+            key (str): Key identifying the request within its channel.
+            value (Any): Response returned by yfinance.
+        """
+        if self.__mode is not CassetteMode.RECORD:
+            return
+        try:
+            self.__cassette.put(channel, key, value)
+        except Exception as e:
+            logger.warning(f"Error recording {channel} response: {e}")
+
+    def store_http(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        body: Any,
+        status: int,
+        content_type: str | None,
+        content: bytes,
+    ):
+        """Record a plain HTTP response, if recording.
+
+        Args:
+            method (str): HTTP method of the request.
+            url (str): URL of the request.
+            params (dict | None): Query parameters of the request.
+            body (Any): JSON body of the request, None if it had no body.
+            status (int): Status code of the response.
+            content_type (str | None): Content type of the response.
+            content (bytes): Body of the response.
+        """
+        if self.__mode is not CassetteMode.RECORD:
+            return
+        try:
+            self.__cassette.put(
+                Cassette.HTTP_CHANNEL,
+                Cassette.http_key(method, url, params, body),
+                (status, content_type, content),
+            )
+        except Exception as e:
+            logger.warning(f"Error recording response of {method} {url}: {e}")
+
+    def fetch(self, channel: str, key: str) -> Any:
+        """Return a response recorded through the YahooDataHub from the StandInServer.
+
+        Args:
+            channel (str): Channel of the response, the value of its DataKind.
+            key (str): Key identifying the request within its channel.
+
+        Raises:
+            LookupError: If the response wasn't recorded.
+
+        Returns:
+            Any: Response as yfinance returned it when it was recorded.
+        """
+        response = requests.get(
+            f"{self.__server_url}/cassette/{channel}",
+            params={"key": key},
+            timeout=self.TIMEOUT,
+        )
+        if response.status_code == 404:
+            raise LookupError(f"No recorded {channel} response for {key}.")
+        response.raise_for_status()
+        return pickle.loads(response.content)
+
+    def __isolate_stores(self):
+        """Swap all stores for empty ones in a temporary directory, unless they were swapped already."""
+        if self.__scratch is not None:
+            return
+        self.__scratch = tempfile.TemporaryDirectory(
+            prefix="jinance-cassette-", ignore_cleanup_errors=True
+        )
+        logger.info(f"Stores of the cassette run kept in {self.__scratch.name}.")
+        for store in self.STORES:
+            self.__kept_stores[store] = getattr(store, "_instance", None)
+            store.clear()
+            store.get_instance(
+                Path(self.__scratch.name).joinpath(f"{store.__name__.lower()}.sqlite3")
+            )
+
+    def __restore_stores(self):
+        """Put back the stores that were in use before the cassette run, and remove the temporary ones."""
+        if self.__scratch is None:
+            return
+        for store, kept in self.__kept_stores.items():
+            store.clear()
+            store._instance = kept
+        self.__kept_stores = {}
+        self.__scratch.cleanup()
+        self.__scratch = None
@@ -0,0 +1,111 @@
+import logging
+import threading
+import time
+from collections import deque
+
+from utils.singleton_meta import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+class _Circuit:
+    """State of a single host, only used inside CircuitBreaker under its lock."""
+
+    def __init__(self, window_size: int, cooldown: float):
+        self.outcomes: deque[bool] = deque(maxlen=window_size)
+        self.cooldown = cooldown
+        self.opened_until = 0.0
+        self.trial_running = False
+
+
+class CircuitBreaker(metaclass=SingletonMeta):
+    """Class that stops requests to a host once a high share of its latest requests failed.
+
+    The latest WINDOW_SIZE outcomes of every host are kept. When at least MIN_CALLS of them are known
+    and FAILURE_RATIO or more failed, the circuit opens and requests fail immediately for a cooldown.
+    After it, a single trial request is let through: success closes the circuit, failure opens it again
+    for twice as long, up to MAX_COOLDOWN seconds.
+
+    Only failures of the host itself (network errors, throttling, server errors) are reported here,
+    a ticker without data is not a reason to stop asking for other tickers.
+    """
+
+    WINDOW_SIZE = 20
+    MIN_CALLS = 10
+    FAILURE_RATIO = 0.5
+    COOLDOWN = 30.0
+    MAX_COOLDOWN = 300.0
+
+    def __init__(self):
+        logger.debug("CircuitBreaker initialized.")
+        self.__lock = threading.Lock()
+        self.__circuits: dict[str, _Circuit] = {}
+
+    def allow(self, host: str) -> bool:
+        """Return whether a request to host can be sent now.
+
+        Args:
+            host (str): Upstream host the request goes to.
+
+        Returns:
+            bool: False while the circuit of host is open, or while its trial request is running.
+        """
+        with self.__lock:
+            circuit = self.__circuit(host)
+            if not circuit.opened_until:
+                return True
+            if circuit.trial_running or time.monotonic() < circuit.opened_until:
+                return False
+            circuit.trial_running = True
+            return True
+
+    def is_open(self, host: str) -> bool:
+        """Return whether requests to host are currently stopped."""
+        with self.__lock:
+            return bool(self.__circuit(host).opened_until)
+
+    def report_success(self, host: str):
+        """Record a successful request to host, closing its circuit after a trial request."""
+        with self.__lock:
+            circuit = self.__circuit(host)
+            if circuit.opened_until:
+                logger.info(f"Requests to {host} succeed again, closing its circuit.")
+                circuit.opened_until = 0.0
+                circuit.trial_running = False
+                circuit.cooldown = self.COOLDOWN
+                circuit.outcomes.clear()
+            circuit.outcomes.append(True)
+
+    def report_failure(self, host: str):
+        """Record a failed request to host, opening its circuit if too many requests failed."""
+        with self.__lock:
+            circuit = self.__circuit(host)
+            if circuit.opened_until:
+                if circuit.trial_running:
+                    circuit.trial_running = False
+                    circuit.cooldown = min(self.MAX_COOLDOWN, circuit.cooldown * 2)
+                    self.__open(host, circuit)
+                return
+            circuit.outcomes.append(False)
+            failures = circuit.outcomes.count(False)
+            if len(
+                circuit.outcomes
+            ) >= self.MIN_CALLS and failures >= self.FAILURE_RATIO * len(
+                circuit.outcomes
+            ):
+                self.__open(host, circuit)
+
+    def __open(self, host: str, circuit: _Circuit):
+        circuit.opened_until = time.monotonic() + circuit.cooldown
+        logger.warning(
+            f"Too many requests to {host} failed, stopping requests for {circuit.cooldown:.0f}s."
+        )
+
+    def __circuit(self, host: str) -> _Circuit:
+        if host not in self.__circuits:
+            self.__circuits[host] = _Circuit(self.WINDOW_SIZE, self.COOLDOWN)
+        return self.__circuits[host]
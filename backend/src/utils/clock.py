@@ -0,0 +1,63 @@
+import logging
+import threading
+from datetime import date, datetime, timezone, tzinfo
+
+from utils.singleton_meta import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+class Clock(metaclass=SingletonMeta):
+    """Class that tells the current time to everything that decides which data a report asks for.
+
+    Date windows, cutoffs and page sizes of requests all depend on the current time. A replayed cassette
+    only holds responses of requests sent on the day it was recorded, so while replaying, the CassettePlayer
+    pins the clock to the moment the cassette was recorded, and the report asks for the same data again.
+    """
+
+    def __init__(self):
+        logger.debug("Clock initialized.")
+        self.__lock = threading.Lock()
+        self.__pinned_at: datetime | None = None
+
+    @property
+    def pinned_at(self) -> datetime | None:
+        return self.__pinned_at
+
+    def now(self, tz: tzinfo | None = None) -> datetime:
+        """Return the current time, like datetime.now.
+
+        Args:
+            tz (tzinfo | None): Time zone of the result, None for naive local time.
+
+        Returns:
+            datetime: Pinned moment if the clock is pinned, real current time otherwise.
+        """
+        with self.__lock:
+            pinned_at = self.__pinned_at
+        if pinned_at is None:
+            return datetime.now(tz)
+        if tz is None:
+            return pinned_at.astimezone().replace(tzinfo=None)
+        return pinned_at.astimezone(tz)
+
+    def today(self) -> date:
+        """Return the current local date, like date.today."""
+        return self.now().date()
+
+    def pin(self, moment: datetime):
+        """Stop the clock at moment, until it is unpinned.
+
+        Args:
+            moment (datetime): Moment the clock shows, naive moments are taken as local time.
+        """
+        if moment.tzinfo is None:
+            moment = moment.astimezone()
+        logger.info(f"Clock pinned to {moment.isoformat()}.")
+        with self.__lock:
+            self.__pinned_at = moment.astimezone(timezone.utc)
+
+    def unpin(self):
+        """Let the clock show the real current time again."""
+        with self.__lock:
+            self.__pinned_at = None
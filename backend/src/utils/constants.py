@@ -388,3 +388,11 @@ MANAGEMENT_KEYWORDS = [
 IMPORTANT_KEYWORDS = (
     HARD_EVENT_KEYWORDS + FINANCIAL_KEYWORDS + PRODUCT_KEYWORDS + MANAGEMENT_KEYWORDS
 )
+
+MAX_FETCH_WORKERS = 8
+
+CACHE_DIR = ".jinance_cache"
+
+MAX_ASYNC_REQUESTS = 50
+
+MAX_GRAPH_WORKERS = 4
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class CassetteMode(Enum):
+    """Enumeration of the ways upstream responses can be recorded or replayed.
+
+    Types:
+        OFF: Requests go to the real APIs and nothing is recorded.
+        RECORD: Requests go to the real APIs and every response is stored in a cassette.
+        REPLAY: Requests go to a local StandInServer that serves responses from a cassette.
+    """
+
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class ChartEngine(Enum):
+    """Enumeration for choosing how graphs of a section are drawn.
+
+    Types:
+        PNG: PNG images drawn with matplotlib and saved into the graphs folder.
+        SVG: Vector line charts written straight into the report.
+    """
+
+    PNG = "png"
+    SVG = "svg"
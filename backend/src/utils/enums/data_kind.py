@@ -0,0 +1,27 @@
+from enum import Enum
+
+
+class DataKind(Enum):
+    """Enumeration of the kinds of data fetched from a provider API, each cached for its own time.
+
+    Types:
+        INFO: Company information (name, market cap, analyst mean...).
+        CALENDAR: Calendar of upcoming company events.
+        EARNINGS_DATES: Latest earnings reports with estimated and reported EPS.
+        HISTORY: Price history of a single ticker.
+        DOWNLOAD: Price history of multiple tickers downloaded in bulk.
+        INSIDER_TRANSACTIONS: Insider transactions of a company.
+        NEWS: Latest news articles about a company.
+        AI_RANKING: Articles the AI model picked out of a batch of news.
+        AI_SCORE: Score of a single article from the AI rankings it took part in.
+    """
+
+    INFO = "info"
+    CALENDAR = "calendar"
+    EARNINGS_DATES = "earnings_dates"
+    HISTORY = "history"
+    DOWNLOAD = "download"
+    INSIDER_TRANSACTIONS = "insider_transactions"
+    NEWS = "news"
+    AI_RANKING = "ai_ranking"
+    AI_SCORE = "ai_score"
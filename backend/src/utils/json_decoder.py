@@ -5,6 +5,7 @@ from typing import Optional
 
 from models.section_data import SectionData
 from utils import constants
+from utils.enums.chart_engine import ChartEngine
 from utils.enums.language import Language
 from utils.enums.provider_type import ProviderType
 from utils.enums.section_type import SectionType
@@ -50,6 +51,10 @@ class JsonDecoder:
                 "number_of_companies", section.get("number_of_articles")
             )
 
+            chart_engine = ChartEngine(
+                section.get("chart_engine", ChartEngine.PNG.value)
+            )
+
             sections.append(
                 SectionData(
                     type=section_type,
@@ -59,6 +64,7 @@ class JsonDecoder:
                     days_ahead=days_ahead,
                     days_behind=days_behind,
                     number_of_companies=number_of_companies,
+                    chart_engine=chart_engine,
                 )
             )
 
@@ -0,0 +1,60 @@
+from collections import deque
+from typing import Generic, Hashable, Iterable, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+class KeywordMatcher(Generic[T]):
+    """Class that finds all of many keywords in a text in a single scan, using an Aho-Corasick automaton.
+
+    Every keyword is given a label, and a scan returns labels of all keywords the text contains, including
+    overlapping ones and keywords inside longer words, just like `keyword in text` would. The automaton is
+    built once, so a scan takes time linear in the length of the text, whatever the number of keywords.
+    """
+
+    def __init__(self, keywords: Iterable[tuple[str, T]]):
+        self.__transitions: list[dict[str, int]] = [{}]
+        labels: list[set[T]] = [set()]
+        for keyword, label in keywords:
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                if char not in self.__transitions[state]:
+                    self.__transitions[state][char] = len(self.__transitions)
+                    self.__transitions.append({})
+                    labels.append(set())
+                state = self.__transitions[state][char]
+            labels[state].add(label)
+
+        self.__fallbacks = [0] * len(self.__transitions)
+        queue = deque(self.__transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.__transitions[state].items():
+                fallback = self.__fallbacks[state]
+                while fallback and char not in self.__transitions[fallback]:
+                    fallback = self.__fallbacks[fallback]
+                self.__fallbacks[child] = self.__transitions[fallback].get(char, 0)
+                labels[child] |= labels[self.__fallbacks[child]]
+                queue.append(child)
+        self.__labels = [frozenset(state_labels) for state_labels in labels]
+
+    def find(self, text: str) -> set[T]:
+        """Return labels of all keywords contained in the text.
+
+        Args:
+            text (str): Text to scan, it is matched as is, so keywords and text should have the same case.
+
+        Returns:
+            set[T]: Labels of the contained keywords, empty if there are none.
+        """
+        found: set[T] = set()
+        state = 0
+        for char in text:
+            while state and char not in self.__transitions[state]:
+                state = self.__fallbacks[state]
+            state = self.__transitions[state].get(char, 0)
+            if self.__labels[state]:
+                found |= self.__labels[state]
+        return found
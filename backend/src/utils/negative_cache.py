@@ -0,0 +1,167 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from utils import constants
+from utils.enums.data_kind import DataKind
+from utils.singleton_meta import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+class KnownFailureError(RuntimeError):
+    """Raised instead of requesting data that failed recently and is still in the NegativeCache."""
+
+
+class NegativeCache(metaclass=SingletonMeta):
+    """Class that remembers which data of which ticker failed to load, and for how long not to ask again.
+
+    Failures are kept in a local SQLite database between runs. After its n-th failure in a row, data of a
+    ticker is skipped for BASE_TTL * 2^(n-1), but never longer than MAX_TTL, so a ticker that was only
+    temporarily broken is retried soon, and a delisted ticker costs one request per week. A successful
+    request forgets the failures. A cache that can't be opened keeps failures only in memory.
+    """
+
+    BASE_TTL = timedelta(hours=6)
+    MAX_TTL = timedelta(days=7)
+
+    def __init__(self, path: Path | None = None):
+        self.__path = path or Path(
+            os.getenv("JINANCE_CACHE_DIR", constants.CACHE_DIR)
+        ).joinpath("failures.sqlite3")
+        logger.debug(f"NegativeCache initialized at {self.__path}.")
+        self.__lock = threading.Lock()
+        self.__bypass = False
+        self.__skipped = 0
+        self.__connection = self.__connect()
+        self.__failures: dict[tuple[str, str], tuple[int, float]] = self.__read_all()
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def skipped(self) -> int:
+        """Number of requests skipped since the counter was last reset."""
+        return self.__skipped
+
+    def set_bypass(self, bypass: bool):
+        """Request everything, even data that failed recently, failures are still recorded.
+
+        Args:
+            bypass (bool): True to retry all known failures in the current run.
+        """
+        self.__bypass = bypass
+
+    def reset_statistics(self):
+        """Set the counter of skipped requests back to zero."""
+        self.__skipped = 0
+
+    def is_known_failure(self, kind: DataKind, ticker: str) -> bool:
+        """Return whether data of a ticker failed recently enough to be skipped, counting it as skipped.
+
+        Args:
+            kind (DataKind): Kind of the data.
+            ticker (str): Ticker the data belongs to.
+
+        Returns:
+            bool: True if the data shouldn't be requested now.
+        """
+        if self.__bypass:
+            return False
+        with self.__lock:
+            failure = self.__failures.get((kind.value, ticker))
+            if failure is None:
+                return False
+            count, failed_at = failure
+            if time.time() >= failed_at + self.ttl(count).total_seconds():
+                return False
+            self.__skipped += 1
+            return True
+
+    def record_failure(self, kind: DataKind, ticker: str):
+        """Record that data of a ticker failed to load.
+
+        Args:
+            kind (DataKind): Kind of the data.
+            ticker (str): Ticker the data belongs to.
+        """
+        with self.__lock:
+            count, _ = self.__failures.get((kind.value, ticker), (0, 0.0))
+            failure = (count + 1, time.time())
+            self.__failures[(kind.value, ticker)] = failure
+            self.__write(
+                "INSERT OR REPLACE INTO failures (kind, ticker, count, failed_at) VALUES (?, ?, ?, ?)",
+                (kind.value, ticker, *failure),
+            )
+        logger.debug(
+            f"{kind.value} of {ticker} failed {failure[0]} times, skipping it for {self.ttl(failure[0])}."
+        )
+
+    def record_success(self, kind: DataKind, ticker: str):
+        """Forget failures of data of a ticker after it loaded successfully.
+
+        Args:
+            kind (DataKind): Kind of the data.
+            ticker (str): Ticker the data belongs to.
+        """
+        with self.__lock:
+            if self.__failures.pop((kind.value, ticker), None) is None:
+                return
+            self.__write(
+                "DELETE FROM failures WHERE kind = ? AND ticker = ?",
+                (kind.value, ticker),
+            )
+
+    @classmethod
+    def ttl(cls, count: int) -> timedelta:
+        """Return how long data is skipped after failing {count} times in a row."""
+        doublings = max(0, count - 1)
+        if doublings >= (cls.MAX_TTL // cls.BASE_TTL).bit_length():
+            return cls.MAX_TTL
+        return min(cls.MAX_TTL, cls.BASE_TTL * 2**doublings)
+
+    def __write(self, statement: str, parameters: tuple):
+        if self.__connection is None:
+            return
+        try:
+            with self.__connection:
+                self.__connection.execute(statement, parameters)
+        except Exception as e:
+            logger.warning(f"Error writing to negative cache: {e}")
+
+    def __read_all(self) -> dict[tuple[str, str], tuple[int, float]]:
+        """Read all failures that aren't older than the longest time to live."""
+        if self.__connection is None:
+            return {}
+        try:
+            rows = self.__connection.execute(
+                "SELECT kind, ticker, count, failed_at FROM failures WHERE failed_at >= ?",
+                (time.time() - self.MAX_TTL.total_seconds(),),
+            ).fetchall()
+            return {(kind, ticker): (count, at) for kind, ticker, count, at in rows}
+        except Exception as e:
+            logger.warning(f"Error reading negative cache: {e}")
+            return {}
+
+    def __connect(self) -> sqlite3.Connection | None:
+        """Open the database and create its table."""
+        try:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.__path, check_same_thread=False)
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS failures ("
+                    "kind TEXT NOT NULL, ticker TEXT NOT NULL, count INTEGER NOT NULL, failed_at REAL NOT NULL, "
+                    "PRIMARY KEY (kind, ticker))"
+                )
+            return connection
+        except Exception as e:
+            logger.warning(
+                f"Negative cache unavailable, keeping failures in memory: {e}"
+            )
+            return None
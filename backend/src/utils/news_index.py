@@ -0,0 +1,146 @@
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable
+
+from models.news_article import NewsArticle
+from utils import constants
+from utils.clock import Clock
+from utils.singleton_meta import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+class NewsIndex(metaclass=SingletonMeta):
+    """Class that remembers which news articles were already reported, so later reports don't repeat them.
+
+    An article is identified both by its URL and by its normalized title, so the same story republished
+    under another URL is recognized too. Only articles reported before the current day count, so a report
+    generated again on the same day shows the same news. Articles are kept in a local SQLite database for
+    RETENTION, older ones are deleted when the index is opened, so neither the database nor the memory of
+    a long-lived process keeps growing. An index that can't be opened falls back to an in-memory database.
+    """
+
+    RETENTION = timedelta(days=30)
+
+    def __init__(self, path: Path | None = None):
+        self.__path = path or Path(
+            os.getenv("JINANCE_CACHE_DIR", constants.CACHE_DIR)
+        ).joinpath("news.sqlite3")
+        logger.debug(f"NewsIndex initialized at {self.__path}.")
+        self.__lock = threading.Lock()
+        self.__bypass = False
+        self.__dropped = 0
+        self.__connection = self.__connect()
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def dropped(self) -> int:
+        """Number of already reported articles dropped since the counter was last reset."""
+        return self.__dropped
+
+    def set_bypass(self, bypass: bool):
+        """Treat every article as new, reported articles are still recorded.
+
+        Args:
+            bypass (bool): True to ignore previously reported articles in the current run.
+        """
+        self.__bypass = bypass
+
+    def reset_statistics(self):
+        """Set the counter of dropped articles back to zero."""
+        self.__dropped = 0
+
+    def is_reported(self, article: NewsArticle) -> bool:
+        """Return whether the article, or one with the same title, was reported before today within the retention period.
+
+        Articles found in the index are counted as dropped.
+
+        Args:
+            article (NewsArticle): Article to look up.
+
+        Returns:
+            bool: True if the article was already reported.
+        """
+        if self.__bypass:
+            return False
+        try:
+            with self.__lock:
+                row = self.__connection.execute(
+                    "SELECT 1 FROM reported WHERE key IN (?, ?) AND reported_at >= ? AND reported_at < ? LIMIT 1",
+                    (*self.keys(article), self.__oldest(), self.__start_of_today()),
+                ).fetchone()
+                if row is not None:
+                    self.__dropped += 1
+            return row is not None
+        except Exception as e:
+            logger.warning(f"Error reading news index: {e}")
+            return False
+
+    def record(self, articles: Iterable[NewsArticle]):
+        """Record articles as reported now.
+
+        Args:
+            articles (Iterable[NewsArticle]): Articles that went into a report.
+        """
+        now = Clock.get_instance().now().timestamp()
+        rows = [(key, now) for article in articles for key in self.keys(article)]
+        try:
+            with self.__lock, self.__connection:
+                self.__connection.executemany(
+                    "INSERT OR REPLACE INTO reported (key, reported_at) VALUES (?, ?)",
+                    rows,
+                )
+        except Exception as e:
+            logger.warning(f"Error writing to news index: {e}")
+
+    @classmethod
+    def keys(cls, article: NewsArticle) -> tuple[str, str]:
+        """Return the keys an article is indexed by, one for its URL and one for its normalized title."""
+        return f"url:{article.url}", f"title:{cls.normalize_title(article.title)}"
+
+    @staticmethod
+    def normalize_title(title: str) -> str:
+        """Return the title in lowercase, with punctuation removed and whitespace collapsed."""
+        return " ".join(re.sub(r"[^\w\s]", " ", title.lower()).split())
+
+    def __oldest(self) -> float:
+        """Return the time before which reported articles are forgotten."""
+        return (Clock.get_instance().now() - self.RETENTION).timestamp()
+
+    @staticmethod
+    def __start_of_today() -> float:
+        """Return the time from which articles count as reported by the current day's report."""
+        return datetime.combine(
+            Clock.get_instance().today(), datetime.min.time()
+        ).timestamp()
+
+    def __connect(self) -> sqlite3.Connection:
+        """Open the database, create its table and delete articles older than the retention period."""
+        try:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.__path, check_same_thread=False)
+            self.__prepare(connection)
+            return connection
+        except Exception as e:
+            logger.warning(f"News index unavailable, keeping it in memory: {e}")
+            connection = sqlite3.connect(":memory:", check_same_thread=False)
+            self.__prepare(connection)
+            return connection
+
+    def __prepare(self, connection: sqlite3.Connection):
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS reported ("
+                "key TEXT PRIMARY KEY, reported_at REAL NOT NULL) WITHOUT ROWID"
+            )
+            connection.execute(
+                "DELETE FROM reported WHERE reported_at < ?", (self.__oldest(),)
+            )
@@ -0,0 +1,131 @@
+import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+logger = logging.getLogger(__name__)
+
+_connect_times = threading.local()
+
+
+class _ConnectTimer:
+    """Mixin of urllib3 connections that adds the time it took to connect, TLS handshake included, to the thread that opened them."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_times.seconds = getattr(_connect_times, "seconds", 0.0) + (
+                time.perf_counter() - started
+            )
+
+
+class _TimedHTTPConnection(_ConnectTimer, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_ConnectTimer, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools open connections that measure how long connecting took."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class PooledSession:
+    """HTTP session that keeps connections alive between requests, and measures how long every request took.
+
+    Up to {pool_size} connections per host are kept open, so that many concurrent requests don't pay for a
+    new TCP and TLS handshake each. Every request is measured in three parts: connect is the time spent
+    opening new connections (zero when a kept alive one was reused), ttfb is the time until the response
+    headers arrived, connecting included, and total is the time until the whole body was read.
+    """
+
+    PARTS = ("connect", "ttfb", "total")
+
+    def __init__(self, pool_size: int, timeout: tuple[float, float]):
+        """
+        Args:
+            pool_size (int): Number of connections kept open per host.
+            timeout (tuple[float, float]): Connect and read timeout of every request, in seconds.
+        """
+        self.__timeout = timeout
+        self.__session = requests.Session()
+        adapter = _TimedAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
+        self.__lock = threading.Lock()
+        self.__latencies: list[tuple[float, float, float]] = []
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return self.__timeout
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request through the pooled connections and record its latency.
+
+        Args:
+            url (str): URL of the request.
+            **kwargs: Passed to requests.Session.post, timeout defaults to the timeout of the session.
+
+        Returns:
+            requests.Response: Response with its body already read.
+        """
+        kwargs.setdefault("timeout", self.__timeout)
+        _connect_times.seconds = 0.0
+        started = time.perf_counter()
+        response = self.__session.post(url, **kwargs)
+        total = time.perf_counter() - started
+        with self.__lock:
+            self.__latencies.append(
+                (_connect_times.seconds, response.elapsed.total_seconds(), total)
+            )
+        return response
+
+    def statistics(self) -> dict[str, tuple[float, float]]:
+        """Return mean and maximum seconds of every part of the requests sent since the statistics were last reset."""
+        with self.__lock:
+            latencies = list(self.__latencies)
+        if not latencies:
+            return {}
+        return {
+            part: (sum(values) / len(values), max(values))
+            for part, values in zip(
+                self.PARTS, zip(*latencies, strict=True), strict=True
+            )
+        }
+
+    @property
+    def sent(self) -> int:
+        """Number of requests sent since the statistics were last reset."""
+        with self.__lock:
+            return len(self.__latencies)
+
+    def reset_statistics(self):
+        """Forget latencies of all requests sent so far."""
+        with self.__lock:
+            self.__latencies.clear()
+
+    def close(self):
+        """Close all kept alive connections."""
+        self.__session.close()
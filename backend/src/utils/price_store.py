@@ -0,0 +1,277 @@
+import logging
+import os
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from models.price_matrix import PriceMatrix
+from utils import constants
+from utils.singleton_meta import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+class PriceStore(metaclass=SingletonMeta):
+    """Class that keeps daily closing prices of every ticker in a local SQLite database between runs.
+
+    Next to the prices, the store remembers which days of every ticker are covered, so providers only
+    download what is missing: days before the first covered day, and days since the last stored
+    bar. The last two stored bars are always downloaded again, the last one may have been stored
+    before the market closed, and the one before verifies the stored history. Yahoo adjusts all past
+    prices after a dividend or a split, so when the verified bar doesn't match anymore, the history of
+    the ticker is dropped and downloaded again as a whole.
+
+    A store that can't be opened falls back to an in-memory database, the run still works, but
+    nothing is kept for the next one.
+    """
+
+    TOLERANCE = 1e-4
+    QUERY_CHUNK_SIZE = 500
+
+    def __init__(self, path: Path | None = None):
+        self.__path = path or Path(
+            os.getenv("JINANCE_CACHE_DIR", constants.CACHE_DIR)
+        ).joinpath("prices.sqlite3")
+        logger.debug(f"PriceStore initialized at {self.__path}.")
+        self.__lock = threading.Lock()
+        self.__bypass = False
+        self.__connection = self.__connect()
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def bypass(self) -> bool:
+        return self.__bypass
+
+    def set_bypass(self, bypass: bool):
+        """Download whole windows and overwrite stored prices instead of downloading only missing days.
+
+        Args:
+            bypass (bool): True to force refetching all prices in the current run.
+        """
+        self.__bypass = bypass
+
+    def missing(
+        self, tickers: list[str], start: date, end: date
+    ) -> dict[tuple[date, date], list[str]]:
+        """Return which days of which tickers have to be downloaded to cover a window.
+
+        Args:
+            tickers (list[str]): Tickers whose prices are needed.
+            start (date): First day of the window.
+            end (date): Day after the last day of the window.
+
+        Returns:
+            dict[tuple[date, date], list[str]]: Keys are (start, end) ranges to download, end excluded,
+                values are tickers missing that range. Tickers stored up to the same day share a range,
+                so they can be downloaded in bulk.
+        """
+        ranges: dict[tuple[date, date], list[str]] = {}
+        for ticker in tickers:
+            for missing_range in self.__missing_ranges(ticker, start, end):
+                ranges.setdefault(missing_range, []).append(ticker)
+        return ranges
+
+    def merge(self, ticker: str, closes: pd.Series, start: date, end: date) -> bool:
+        """Store downloaded closing prices of a ticker.
+
+        Args:
+            ticker (str): Ticker the prices belong to.
+            closes (pd.Series): Closing prices indexed by day, timezone aware or not.
+            start (date): First day of the downloaded range.
+            end (date): Day after the last day of the downloaded range.
+
+        Returns:
+            bool: False if the prices don't match stored prices of the same days, then the stored history
+                of the ticker is dropped and the whole window has to be downloaded again.
+        """
+        closes = self.__by_day(closes)
+        if closes.empty:
+            return True
+        rows = [
+            (ticker, day.isoformat(), float(close))
+            for day, close in zip(closes.index.date, closes.to_numpy(), strict=True)
+        ]
+        with self.__lock, self.__connection:
+            coverage = self.__coverage(ticker)
+            if self.__bypass:
+                self.__connection.execute(
+                    "DELETE FROM prices WHERE ticker = ? AND day >= ? AND day < ?",
+                    (ticker, start.isoformat(), end.isoformat()),
+                )
+            elif coverage is not None and not self.__matches(
+                ticker, closes, coverage[1]
+            ):
+                logger.info(
+                    f"Stored prices of {ticker} were adjusted, downloading them again."
+                )
+                self.__delete(ticker)
+                return False
+
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO prices (ticker, day, close) VALUES (?, ?, ?)",
+                rows,
+            )
+            first_day, last_day = start.isoformat(), rows[-1][1]
+            # Coverage only grows over ranges that touch it, otherwise the days in between would count as stored.
+            if (
+                coverage is not None
+                and first_day <= coverage[1]
+                and end.isoformat() >= coverage[0]
+            ):
+                first_day = min(first_day, coverage[0])
+                last_day = max(last_day, coverage[1])
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO coverage (ticker, first_day, last_day) VALUES (?, ?, ?)",
+                (ticker, first_day, last_day),
+            )
+        return True
+
+    def get(self, ticker: str, start: date, end: date) -> pd.Series:
+        """Return stored closing prices of a ticker in a window.
+
+        Args:
+            ticker (str): Ticker whose prices to return.
+            start (date): First day of the window.
+            end (date): Day after the last day of the window.
+
+        Returns:
+            pd.Series: Closing prices indexed by timezone naive days, oldest first.
+        """
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT day, close FROM prices WHERE ticker = ? AND day >= ? AND day < ? ORDER BY day",
+                (ticker, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        if not rows:
+            return pd.Series(dtype=float)
+        days, closes = zip(*rows, strict=True)
+        return pd.Series(closes, index=pd.DatetimeIndex(days), dtype=float)
+
+    def matrix(self, tickers: list[str], start: date, end: date) -> PriceMatrix:
+        """Return stored closing prices of many tickers in a window as one dense matrix.
+
+        Args:
+            tickers (list[str]): Tickers in the order of the rows, tickers without prices get an empty row.
+            start (date): First day of the window.
+            end (date): Day after the last day of the window.
+
+        Returns:
+            PriceMatrix: Prices with a column for every day any of the tickers has a price.
+        """
+        rows: list[tuple[str, str, float]] = []
+        with self.__lock:
+            for i in range(0, len(tickers), self.QUERY_CHUNK_SIZE):
+                chunk = tickers[i : i + self.QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    self.__connection.execute(
+                        f"SELECT ticker, day, close FROM prices WHERE ticker IN ({placeholders}) "
+                        "AND day >= ? AND day < ?",
+                        (*chunk, start.isoformat(), end.isoformat()),
+                    ).fetchall()
+                )
+        frame = pd.DataFrame(rows, columns=["ticker", "day", "close"])
+        closes = frame.pivot(index="ticker", columns="day", values="close")
+        closes = closes.reindex(index=tickers, columns=sorted(closes.columns))
+        closes.columns = pd.DatetimeIndex(closes.columns)
+        return PriceMatrix.from_frame(closes)
+
+    def __missing_ranges(
+        self, ticker: str, start: date, end: date
+    ) -> list[tuple[date, date]]:
+        """Return ranges of days of a ticker that aren't stored yet, end excluded."""
+        if self.__bypass:
+            return [(start, end)]
+        with self.__lock:
+            coverage = self.__coverage(ticker)
+            if coverage is None:
+                return [(start, end)]
+            first_day, last_day = (date.fromisoformat(day) for day in coverage)
+            previous = self.__connection.execute(
+                "SELECT MAX(day) FROM prices WHERE ticker = ? AND day < ?",
+                (ticker, coverage[1]),
+            ).fetchone()[0]
+
+        ranges = []
+        if start < first_day:
+            ranges.append((start, first_day))
+        if end > last_day:
+            # Resumes at the stored history even when the window starts later, so no gap is left behind it.
+            resume = date.fromisoformat(previous) if previous else last_day
+            ranges.append((resume, end))
+        return ranges
+
+    def __matches(self, ticker: str, closes: pd.Series, last_day: str) -> bool:
+        """Return whether downloaded closes agree with stored closes of the same finished days."""
+        finished = closes[closes.index < pd.Timestamp(last_day)]
+        if finished.empty:
+            return True
+        days = [day.isoformat() for day in finished.index.date]
+        stored = dict(
+            self.__connection.execute(
+                "SELECT day, close FROM prices WHERE ticker = ? AND day >= ? AND day < ?",
+                (ticker, days[0], last_day),
+            ).fetchall()
+        )
+        pairs = [
+            (close, stored[day])
+            for day, close in zip(days, finished.to_numpy(), strict=True)
+            if day in stored
+        ]
+        if not pairs:
+            return True
+        downloaded, expected = np.array(pairs).T
+        return bool(np.allclose(downloaded, expected, rtol=self.TOLERANCE, atol=0))
+
+    def __coverage(self, ticker: str) -> tuple[str, str] | None:
+        return self.__connection.execute(
+            "SELECT first_day, last_day FROM coverage WHERE ticker = ?", (ticker,)
+        ).fetchone()
+
+    def __delete(self, ticker: str):
+        self.__connection.execute("DELETE FROM prices WHERE ticker = ?", (ticker,))
+        self.__connection.execute("DELETE FROM coverage WHERE ticker = ?", (ticker,))
+
+    @staticmethod
+    def __by_day(closes: pd.Series) -> pd.Series:
+        """Return closes without missing values, indexed by timezone naive days."""
+        closes = closes.dropna()
+        index = pd.DatetimeIndex(closes.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return pd.Series(
+            closes.to_numpy(dtype=float), index=index.normalize()
+        ).sort_index()
+
+    def __connect(self) -> sqlite3.Connection:
+        """Open the database and create its tables, or an in-memory database if it can't be opened."""
+        try:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.__path, check_same_thread=False)
+            self.__create_tables(connection)
+            return connection
+        except Exception as e:
+            logger.warning(f"Price store unavailable, keeping prices in memory: {e}")
+            connection = sqlite3.connect(":memory:", check_same_thread=False)
+            self.__create_tables(connection)
+            return connection
+
+    @staticmethod
+    def __create_tables(connection: sqlite3.Connection):
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS prices ("
+                "ticker TEXT NOT NULL, day TEXT NOT NULL, close REAL NOT NULL, "
+                "PRIMARY KEY (ticker, day)) WITHOUT ROWID"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS coverage ("
+                "ticker TEXT PRIMARY KEY, first_day TEXT NOT NULL, last_day TEXT NOT NULL)"
+            )
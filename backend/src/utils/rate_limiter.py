@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import re
+import threading
+import time
+
+from utils.singleton_meta import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+class _Bucket:
+    """Token bucket of a single host, only used inside RateLimiter under its lock."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.max_rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+
+
+class RateLimiter(metaclass=SingletonMeta):
+    """Class that paces outbound requests with one token bucket per upstream host.
+
+    Every request takes a token first, tokens refill at the current rate of the host. The rate adapts
+    to the host (AIMD): every successful request raises it by a small step up to the configured rate,
+    every throttled request halves it and drops any saved up burst, and a Retry-After answer blocks
+    the host until it passes.
+    """
+
+    YAHOO_HOST = "finance.yahoo.com"
+    GROQ_HOST = "api.groq.com"
+
+    HOST_LIMITS = {
+        YAHOO_HOST: (20.0, 20),
+        GROQ_HOST: (0.5, 2),
+    }
+    DEFAULT_LIMIT = (10.0, 10)
+    MIN_RATE = 0.05
+    INCREASE_FRACTION = 0.05
+    DECREASE_FACTOR = 0.5
+
+    def __init__(self):
+        logger.debug("RateLimiter initialized.")
+        self.__lock = threading.Lock()
+        self.__buckets: dict[str, _Bucket] = {}
+        self.__bypass = False
+
+    @property
+    def bypass(self) -> bool:
+        return self.__bypass
+
+    def set_bypass(self, bypass: bool):
+        """Let every request through without waiting, used when replaying against a local server.
+
+        Args:
+            bypass (bool): True to stop pacing requests.
+        """
+        self.__bypass = bypass
+
+    def acquire(self, host: str):
+        """Block the calling thread until a request to host is allowed.
+
+        Args:
+            host (str): Upstream host the request goes to.
+        """
+        wait = self.__reserve(host)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, host: str):
+        """Wait on the event loop until a request to host is allowed.
+
+        Args:
+            host (str): Upstream host the request goes to.
+        """
+        wait = self.__reserve(host)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def report_success(self, host: str):
+        """Raise the rate of host by a small step, up to its configured rate."""
+        with self.__lock:
+            bucket = self.__bucket(host)
+            bucket.rate = min(
+                bucket.max_rate, bucket.rate + bucket.max_rate * self.INCREASE_FRACTION
+            )
+
+    def report_throttled(self, host: str, retry_after: float | None = None):
+        """Halve the rate of host, and block it for retry_after seconds if the host asked for it.
+
+        Args:
+            host (str): Upstream host that throttled the request.
+            retry_after (float | None): Seconds the host asked to wait, None if it didn't say.
+        """
+        with self.__lock:
+            bucket = self.__bucket(host)
+            bucket.rate = max(self.MIN_RATE, bucket.rate * self.DECREASE_FACTOR)
+            bucket.tokens = min(bucket.tokens, 0.0)
+            if retry_after:
+                bucket.blocked_until = max(
+                    bucket.blocked_until, time.monotonic() + retry_after
+                )
+            logger.warning(
+                f"Requests to {host} are throttled, lowering rate to {bucket.rate:.2f}/s."
+            )
+
+    def report_remaining(
+        self,
+        host: str,
+        remaining: float | None,
+        reset: float | None,
+        needed: float = 1,
+    ):
+        """Block host until its limit resets, if the host said less than {needed} of it remains.
+
+        Hosts like GROQ tell in every answer how much of their limits is left and when the limits reset,
+        so requests can wait exactly as long as needed, instead of being sent and throttled.
+
+        Args:
+            host (str): Upstream host that answered.
+            remaining (float | None): Requests or tokens left until the reset, None if the host didn't say.
+            reset (float | None): Seconds until the limit resets, None if the host didn't say.
+            needed (float): Requests or tokens the next request is expected to use. Defaults to 1.
+        """
+        if remaining is None or reset is None or remaining >= needed:
+            return
+        with self.__lock:
+            bucket = self.__bucket(host)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + reset)
+        logger.info(
+            f"Limit of {host} is used up, waiting {reset:.1f}s until it resets."
+        )
+
+    def capacity(self, host: str) -> int:
+        """Return the number of requests to host that can be sent at once, without waiting."""
+        with self.__lock:
+            return max(1, int(self.__bucket(host).capacity))
+
+    def rate(self, host: str) -> float:
+        """Return the current number of allowed requests per second to host."""
+        with self.__lock:
+            return self.__bucket(host).rate
+
+    @staticmethod
+    def parse_retry_after(value: str | None) -> float | None:
+        """Return seconds from a Retry-After header, None if it is missing or not a number of seconds."""
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_duration(value: str | None) -> float | None:
+        """Return seconds from a rate limit reset header, either a number or a duration like "2m59.56s" or "120ms".
+
+        Returns None if the value is missing or not a duration.
+        """
+        if not isinstance(value, str):
+            return None
+        seconds = RateLimiter.parse_retry_after(value)
+        if seconds is not None:
+            return seconds
+        match = re.fullmatch(
+            r"(?:([\d.]+)h)?(?:([\d.]+)m(?!s))?(?:([\d.]+)s)?(?:([\d.]+)ms)?",
+            value.strip(),
+        )
+        if match is None or not any(match.groups()):
+            return None
+        try:
+            hours, minutes, secs, millis = (float(g or 0) for g in match.groups())
+        except ValueError:
+            return None
+        return hours * 3600 + minutes * 60 + secs + millis / 1000
+
+    def __reserve(self, host: str) -> float:
+        """Take a token of host and return how long the caller has to wait before using it."""
+        if self.__bypass:
+            return 0.0
+        with self.__lock:
+            bucket = self.__bucket(host)
+            now = time.monotonic()
+            bucket.tokens = min(
+                bucket.capacity,
+                bucket.tokens + (now - bucket.updated_at) * bucket.rate,
+            )
+            bucket.updated_at = now
+            bucket.tokens -= 1
+            wait = -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0
+            return max(wait, bucket.blocked_until - now)
+
+    def __bucket(self, host: str) -> _Bucket:
+        if host not in self.__buckets:
+            rate, capacity = self.HOST_LIMITS.get(host, self.DEFAULT_LIMIT)
+            self.__buckets[host] = _Bucket(rate, capacity)
+        return self.__buckets[host]
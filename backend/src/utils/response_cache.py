@@ -0,0 +1,159 @@
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from utils import constants
+from utils.enums.data_kind import DataKind
+from utils.singleton_meta import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache(metaclass=SingletonMeta):
+    """Class that keeps provider API responses in a local SQLite database between runs.
+
+    Every kind of data has its own time to live, so slowly changing data (company names, past earnings)
+    survives for days, while prices and news are refetched after a few minutes. A cache that can't be
+    opened or read never breaks a report, it only behaves like an empty cache.
+    """
+
+    TTLS = {
+        DataKind.INFO: timedelta(days=1),
+        DataKind.CALENDAR: timedelta(days=1),
+        DataKind.EARNINGS_DATES: timedelta(days=7),
+        DataKind.HISTORY: timedelta(minutes=15),
+        DataKind.DOWNLOAD: timedelta(minutes=15),
+        DataKind.INSIDER_TRANSACTIONS: timedelta(days=1),
+        DataKind.NEWS: timedelta(minutes=10),
+        DataKind.AI_RANKING: timedelta(days=1),
+        DataKind.AI_SCORE: timedelta(days=1),
+    }
+
+    def __init__(self, path: Path | None = None):
+        self.__path = path or Path(
+            os.getenv("JINANCE_CACHE_DIR", constants.CACHE_DIR)
+        ).joinpath("responses.sqlite3")
+        logger.debug(f"ResponseCache initialized at {self.__path}.")
+        self.__lock = threading.Lock()
+        self.__bypass = False
+        self.__hits: Counter[DataKind] = Counter()
+        self.__misses: Counter[DataKind] = Counter()
+        self.__connection = self.__connect()
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def bypass(self) -> bool:
+        return self.__bypass
+
+    @property
+    def hits(self) -> int:
+        return sum(self.__hits.values())
+
+    @property
+    def misses(self) -> int:
+        return sum(self.__misses.values())
+
+    def set_bypass(self, bypass: bool):
+        """Ignore stored responses when reading, fresh responses are still stored.
+
+        Args:
+            bypass (bool): True to force refetching everything in the current run.
+        """
+        self.__bypass = bypass
+
+    def get(self, kind: DataKind, key: str) -> tuple[bool, Any]:
+        """Return a stored response, if it is younger than the time to live of its kind.
+
+        Args:
+            kind (DataKind): Kind of the stored data.
+            key (str): Key identifying the request within its kind.
+
+        Returns:
+            tuple[bool, Any]: Whether the response was found, and the response itself (None when not found).
+        """
+        if self.__bypass or self.__connection is None:
+            self.__misses[kind] += 1
+            return False, None
+
+        oldest = time.time() - self.TTLS[kind].total_seconds()
+        try:
+            with self.__lock:
+                row = self.__connection.execute(
+                    "SELECT value FROM responses WHERE kind = ? AND key = ? AND stored_at >= ?",
+                    (kind.value, key, oldest),
+                ).fetchone()
+            if row is None:
+                self.__misses[kind] += 1
+                return False, None
+            value = pickle.loads(row[0])
+        except Exception as e:
+            logger.warning(f"Error reading {kind.value} response from cache: {e}")
+            self.__misses[kind] += 1
+            return False, None
+
+        self.__hits[kind] += 1
+        return True, value
+
+    def put(self, kind: DataKind, key: str, value: Any):
+        """Store a response, replacing an older response of the same request.
+
+        Args:
+            kind (DataKind): Kind of the stored data.
+            key (str): Key identifying the request within its kind.
+            value (Any): Response to store, it has to be picklable.
+        """
+        if self.__connection is None:
+            return
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with self.__lock, self.__connection:
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO responses (kind, key, stored_at, value) VALUES (?, ?, ?, ?)",
+                    (kind.value, key, time.time(), blob),
+                )
+        except Exception as e:
+            logger.warning(f"Error storing {kind.value} response in cache: {e}")
+
+    def statistics(self) -> dict[DataKind, tuple[int, int]]:
+        """Return number of cache hits and misses per data kind since the statistics were last reset."""
+        return {
+            kind: (self.__hits[kind], self.__misses[kind])
+            for kind in DataKind
+            if self.__hits[kind] or self.__misses[kind]
+        }
+
+    def reset_statistics(self):
+        """Set all hit and miss counters back to zero."""
+        self.__hits.clear()
+        self.__misses.clear()
+
+    def __connect(self) -> sqlite3.Connection | None:
+        """Open the database, create its table and drop responses older than any time to live."""
+        try:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.__path, check_same_thread=False)
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "kind TEXT NOT NULL, key TEXT NOT NULL, stored_at REAL NOT NULL, value BLOB NOT NULL, "
+                    "PRIMARY KEY (kind, key))"
+                )
+                longest = max(ttl.total_seconds() for ttl in self.TTLS.values())
+                connection.execute(
+                    "DELETE FROM responses WHERE stored_at < ?",
+                    (time.time() - longest,),
+                )
+            return connection
+        except Exception as e:
+            logger.warning(f"Response cache unavailable, continuing without it: {e}")
+            return None
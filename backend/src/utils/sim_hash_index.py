@@ -0,0 +1,69 @@
+import hashlib
+import re
+from collections import defaultdict
+
+
+class SimHashIndex:
+    """Class that recognizes texts nearly identical to texts added before, using 64-bit SimHash fingerprints.
+
+    A fingerprint is built from the words and overlapping word pairs of a text, so texts that share most
+    of their wording get fingerprints that differ in only a few bits, while unrelated texts differ in about
+    half of them. Texts whose fingerprints differ in at most MAX_DISTANCE bits are near-duplicates.
+    Fingerprints are split into MAX_DISTANCE + 1 bands, and two near-duplicates always share at least one
+    whole band, so only texts sharing a band are compared instead of all of them.
+    """
+
+    BITS = 64
+    MAX_DISTANCE = 10
+
+    def __init__(self):
+        self.__band_count = self.MAX_DISTANCE + 1
+        self.__band_width = self.BITS // self.__band_count
+        self.__bands: list[dict[int, list[int]]] = [
+            defaultdict(list) for _ in range(self.__band_count)
+        ]
+
+    def add_if_new(self, text: str) -> bool:
+        """Add the text to the index, unless a near-duplicate of it was added before.
+
+        Args:
+            text (str): Text to look up and add.
+
+        Returns:
+            bool: True if the text was new and added, False if it is a near-duplicate.
+        """
+        fingerprint = self.fingerprint(text)
+        bands = list(self.__split(fingerprint))
+        for band, value in zip(self.__bands, bands, strict=True):
+            for other in band.get(value, ()):
+                if self.distance(fingerprint, other) <= self.MAX_DISTANCE:
+                    return False
+        for band, value in zip(self.__bands, bands, strict=True):
+            band[value].append(fingerprint)
+        return True
+
+    @classmethod
+    def fingerprint(cls, text: str) -> int:
+        """Return the SimHash fingerprint of a text, computed from its lowercase words and word pairs."""
+        words = re.findall(r"\w+", text.lower())
+        shingles = words + [
+            " ".join(pair) for pair in zip(words, words[1:], strict=False)
+        ]
+        weights = [0] * cls.BITS
+        for shingle in shingles:
+            digest = hashlib.blake2b(shingle.encode(), digest_size=cls.BITS // 8)
+            value = int.from_bytes(digest.digest(), "big")
+            for bit in range(cls.BITS):
+                weights[bit] += 1 if value >> bit & 1 else -1
+        return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+    @staticmethod
+    def distance(first: int, second: int) -> int:
+        """Return the number of bits in which two fingerprints differ."""
+        return (first ^ second).bit_count()
+
+    def __split(self, fingerprint: int):
+        """Yield the bands of a fingerprint."""
+        mask = (1 << self.__band_width) - 1
+        for band in range(self.__band_count):
+            yield fingerprint >> (band * self.__band_width) & mask
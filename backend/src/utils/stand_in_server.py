@@ -0,0 +1,160 @@
+import json
+import logging
+import pickle
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from utils.cassette import Cassette
+
+logger = logging.getLogger(__name__)
+
+
+class StandInServer:
+    """Local HTTP server that stands in for yahoo finance and GROQ APIs by serving a recorded cassette.
+
+    Every answer is delayed by {latency} seconds, so a replayed report behaves like one talking to a
+    remote API, while staying offline and reproducible. Requests run on their own threads, so
+    concurrent clients overlap their waits the same way they would against the real APIs.
+
+    Routes:
+        GET /cassette/<channel>?key=<key>: Pickled response recorded through the YahooDataHub.
+        Any other request: Recorded HTTP response with the same Cassette.http_key.
+    """
+
+    CASSETTE_PATH = "/cassette/"
+    CRUMB_PATH = "/v1/test/getcrumb"
+    REPLAY_CRUMB = "replay-crumb"
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.__cassette = cassette
+        self.__latency = max(0.0, latency)
+        self.__lock = threading.Lock()
+        self.__served = 0
+        self.__missed = 0
+        self.__server = ThreadingHTTPServer((host, port), self.__handler_class())
+        self.__server.daemon_threads = True
+        self.__thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def latency(self) -> float:
+        return self.__latency
+
+    @property
+    def served(self) -> int:
+        return self.__served
+
+    @property
+    def missed(self) -> int:
+        return self.__missed
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """Start serving on a background thread."""
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever,
+            args=(self.POLL_INTERVAL,),
+            name="stand-in-server",
+            daemon=True,
+        )
+        self.__thread.start()
+        logger.info(
+            f"Stand-in server replaying {self.__cassette.path} at {self.url} with {self.__latency}s latency."
+        )
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self.__server.shutdown()
+        self.__server.server_close()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        logger.info(
+            f"Stand-in server served {self.__served} responses, {self.__missed} requests weren't recorded."
+        )
+
+    def answer(
+        self, method: str, path: str, params: dict, body: bytes
+    ) -> tuple[int, str, bytes]:
+        """Return status, content type and body answering a request, after the injected latency."""
+        if self.__latency:
+            time.sleep(self.__latency)
+
+        if path.startswith(self.CASSETTE_PATH):
+            channel = path[len(self.CASSETTE_PATH) :]
+            found, value = self.__cassette.get(channel, params.get("key", ""))
+            answer = (
+                (200, "application/octet-stream", pickle.dumps(value))
+                if found
+                else None
+            )
+        else:
+            payload = json.loads(body) if body else None
+            found, answer = self.__cassette.get(
+                Cassette.HTTP_CHANNEL, Cassette.http_key(method, path, params, payload)
+            )
+            if not found and path == self.CRUMB_PATH:
+                answer = (200, "text/plain", self.REPLAY_CRUMB.encode())
+
+        with self.__lock:
+            if answer is None:
+                self.__missed += 1
+            else:
+                self.__served += 1
+        if answer is None:
+            logger.warning(f"No recorded response for {method} {path} {params}.")
+            return 404, "text/plain", b"Not recorded"
+        return answer
+
+    def __handler_class(self) -> type[BaseHTTPRequestHandler]:
+        """Return a request handler class bound to this server."""
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.__respond()
+
+            def do_POST(self):
+                self.__respond()
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def __respond(self):
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, content_type, content = stand_in.answer(
+                    self.command,
+                    url.path,
+                    dict(parse_qsl(url.query, keep_blank_values=True)),
+                    body,
+                )
+                self.send_response(status)
+                self.send_header("Content-Type", content_type or "text/plain")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        return Handler
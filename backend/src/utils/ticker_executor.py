@@ -0,0 +1,91 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, TypeVar
+
+from utils import constants
+from utils.singleton_meta import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TickerExecutor(metaclass=SingletonMeta):
+    """Class that runs per-ticker fetch functions concurrently on a shared, bounded thread pool.
+
+    Functions submitted to the executor must not submit work to it themselves, since a full pool would then wait on itself.
+    Unless a worker count is given, it is read from the JINANCE_FETCH_WORKERS environment variable,
+    and defaults to MAX_FETCH_WORKERS.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.__max_workers = (
+            max_workers
+            if max_workers is not None and max_workers > 0
+            else self.__configured_workers()
+        )
+        logger.debug(f"TickerExecutor initialized with {self.__max_workers} workers.")
+        self.__pool = ThreadPoolExecutor(
+            max_workers=self.__max_workers, thread_name_prefix="ticker-fetch"
+        )
+
+    @staticmethod
+    def __configured_workers() -> int:
+        """Return the worker count set in the environment, or the default one if it isn't set or valid."""
+        value = os.getenv("JINANCE_FETCH_WORKERS")
+        if not value:
+            return constants.MAX_FETCH_WORKERS
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+        if workers <= 0:
+            logger.warning(
+                f"Invalid JINANCE_FETCH_WORKERS {value!r}, using {constants.MAX_FETCH_WORKERS} workers."
+            )
+            return constants.MAX_FETCH_WORKERS
+        return workers
+
+    @property
+    def max_workers(self) -> int:
+        """Getter for the maximum number of tickers fetched at the same time."""
+        return self.__max_workers
+
+    def map(self, fetch: Callable[[str], T], tickers: list[str]) -> list[T]:
+        """Call fetch for every ticker in parallel.
+
+        Args:
+            fetch (Callable[[str], T]): Function that fetches data for a single ticker.
+            tickers (list[str]): Tickers to fetch.
+
+        Returns:
+            list[T]: Results in the same order as the given tickers. Exceptions raised by fetch are re-raised.
+        """
+        return list(self.__pool.map(fetch, tickers))
+
+    def map_unordered(
+        self, fetch: Callable[[str], T], tickers: list[str]
+    ) -> Iterator[T]:
+        """Call fetch for every ticker in parallel, and yield results as soon as each of them is done.
+
+        Tickers that haven't started yet are cancelled if the caller stops iterating early.
+
+        Args:
+            fetch (Callable[[str], T]): Function that fetches data for a single ticker.
+            tickers (list[str]): Tickers to fetch.
+
+        Returns:
+            Iterator[T]: Results in order of completion. Exceptions raised by fetch are re-raised.
+        """
+        futures = [self.__pool.submit(fetch, ticker) for ticker in tickers]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once all submitted work is done."""
+        self.__pool.shutdown(wait=True)
@@ -0,0 +1,67 @@
+import heapq
+import itertools
+from typing import Any, Callable, Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Reversed:
+    """Wrapper that orders keys in reverse, so a min-heap can keep the smallest keys."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Reversed) and self.key == other.key
+
+
+class TopSelection(Generic[T]):
+    """Class that keeps the items with the largest and the smallest keys of a stream.
+
+    Only {size} items of each end are kept in bounded heaps, so memory doesn't grow with the number of
+    items pushed, and items can be pushed as soon as they are fetched. Items with equal keys are ranked
+    like a stable descending sort would rank them: largest keeps the ones pushed first, smallest the ones
+    pushed last.
+    """
+
+    def __init__(self, size: int, key: Callable[[T], Any]):
+        self.__size = max(size, 0)
+        self.__key = key
+        self.__counter = itertools.count()
+        self.__largest: list[tuple] = []
+        self.__smallest: list[tuple] = []
+
+    def push(self, item: T):
+        """Offer an item to the selection, it is kept only if it is among the largest or the smallest ones."""
+        if self.__size == 0:
+            return
+        key = self.__key(item)
+        number = next(self.__counter)
+        self.__offer(self.__largest, (key, -number, item))
+        self.__offer(self.__smallest, (_Reversed(key), number, item))
+
+    def extend(self, items: Iterable[T]):
+        """Offer every item of an iterable to the selection."""
+        for item in items:
+            self.push(item)
+
+    def largest(self) -> list[T]:
+        """Return the items with the largest keys, largest first."""
+        return [item for _, _, item in sorted(self.__largest, reverse=True)]
+
+    def smallest(self) -> list[T]:
+        """Return the items with the smallest keys, ordered like largest, so the smallest comes last."""
+        ordered = sorted(self.__smallest, key=lambda entry: (entry[0], entry[1]))
+        return [item for _, _, item in ordered]
+
+    def __offer(self, heap: list[tuple], entry: tuple):
+        """Push an entry to a heap, dropping its smallest entry once the heap is full."""
+        if len(heap) < self.__size:
+            heapq.heappush(heap, entry)
+        elif heap[0][:2] < entry[:2]:
+            heapq.heapreplace(heap, entry)
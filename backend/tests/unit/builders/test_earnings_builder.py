@@ -1,8 +1,10 @@
 from datetime import datetime
 
 from models.earnings_information import EarningsInformation
+from models.eps_information import EpsInformation
 from models.previous_earnings_information import PreviousEarningsInformation
 from report_building.earnings_builder import EarningsBuilder
+from utils.enums.chart_engine import ChartEngine
 from utils.enums.language import Language
 from utils.localization import Localization
 
@@ -96,3 +98,26 @@ class TestEarningsBuilder:
         md_string = earnings_builder.build_markdown([earn_info])
 
         assert md_string.count("|") == 30
+
+    def test__build_markdown_svg_engine__graphs_inlined(self):
+        """Check that with the SVG chart engine graphs are written into the markdown instead of linked images."""
+        loc = Localization(Language.ENGLISH)
+        earnings_data = [
+            EarningsInformation(
+                f"TCK{i}",
+                f"company{i}",
+                [1.0, 2.0, 1.5],
+                123456,
+                EpsInformation(1, 2, 3),
+                datetime.now(),
+                321,
+                [],
+            )
+            for i in range(3)
+        ]
+        earnings_builder = EarningsBuilder(loc, ChartEngine.SVG)
+        md_string = earnings_builder.build_markdown(earnings_data)
+
+        assert md_string.count('<div class="chart"><svg') == 3
+        assert md_string.count(loc.translate("earnings_price_chart")) == 3
+        assert "![Price chart]" not in md_string
@@ -1,7 +1,11 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import matplotlib.pyplot as plt
+
+from report_building import graph_builder as graph_builder_module
 from report_building.graph_builder import GraphBuilder
 from utils.enums.language import Language
 from utils.localization import Localization
@@ -35,3 +39,63 @@ class TestGraphBuilder:
 
         shutil.rmtree("graphs", ignore_errors=True)
         del graph_builder
+
+    def test__build_price_graphs__rendered_in_threads_in_order(self, tmp_path, mocker):
+        """Check that a batch of graphs is rendered into PNG files returned in the order of the charts."""
+        mocker.patch("report_building.graph_builder.os.cpu_count", return_value=4)
+        pool_of = mocker.spy(graph_builder_module, "ThreadPoolExecutor")
+        GraphBuilder.clear()
+        graph_builder = GraphBuilder(Localization(Language.ENGLISH), str(tmp_path))
+
+        paths = graph_builder.build_price_graphs(
+            [([1.0, 2.0, 1.5], "TCK1"), (list(range(30)), "TCK2"), ([5.0], "TCK3")]
+        )
+
+        assert ["TCK1" in paths[0], "TCK2" in paths[1], "TCK3" in paths[2]] == [
+            True
+        ] * 3
+        for path in paths:
+            assert Path(path).read_bytes().startswith(b"\x89PNG")
+        assert pool_of.call_args.kwargs["max_workers"] == 3
+        GraphBuilder.clear()
+
+    def test__build_price_graphs__same_ticker_gets_own_files(self, tmp_path):
+        """Check that graphs of the same ticker rendered in the same second don't overwrite each other."""
+        GraphBuilder.clear()
+        graph_builder = GraphBuilder(Localization(Language.ENGLISH), str(tmp_path))
+
+        paths = graph_builder.build_price_graphs(
+            [([1.0, 2.0], "TCK1"), ([3.0, 4.0], "TCK1")]
+        )
+
+        assert paths[0] != paths[1]
+        assert all(os.path.exists(path) for path in paths)
+        GraphBuilder.clear()
+
+    def test__build_price_graphs__failed_graph_is_none(self, tmp_path):
+        """Check that a graph that can't be rendered doesn't stop the others."""
+        GraphBuilder.clear()
+        graph_builder = GraphBuilder(Localization(Language.ENGLISH), str(tmp_path))
+
+        paths = graph_builder.build_price_graphs([([], "TCK1"), ([1.0, 2.0], "TCK2")])
+
+        assert paths[0] is None
+        assert os.path.exists(paths[1])
+        GraphBuilder.clear()
+
+    def test__build_price_graph__leaves_no_pyplot_figures(self, tmp_path):
+        """Check that graphs are drawn without the global pyplot state, so they can be drawn from many threads."""
+        GraphBuilder.clear()
+        graph_builder = GraphBuilder(Localization(Language.ENGLISH), str(tmp_path))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            paths = list(
+                pool.map(
+                    lambda i: graph_builder.build_price_graph([1.0, 2.0, i], f"T{i}"),
+                    range(8),
+                )
+            )
+
+        assert all(os.path.exists(path) for path in paths)
+        assert plt.get_fignums() == []
+        GraphBuilder.clear()
@@ -1,5 +1,6 @@
 from models.price_performance_information import PricePerformanceInformation
 from report_building.price_performance_builder import PricePerformanceBuilder
+from utils.enums.chart_engine import ChartEngine
 from utils.enums.language import Language
 from utils.localization import Localization
 
@@ -40,3 +41,21 @@ class TestPricePerformanceBuilder:
         assert loc.translate("price_perf_intro") in md_string
         assert loc.translate("price_perf_best") not in md_string
         assert loc.translate("price_perf_worst") not in md_string
+
+    def test__build_markdown_graph_builder_fails__md_string_no_graphs(
+        self,
+        mock_false_pp_graph_builder,
+        create_price_perf_dict: dict[str, list[PricePerformanceInformation]],
+    ):
+        """Check that price performances whose graphs couldn't be rendered are shown without a graph, with either engine."""
+        loc = Localization(Language.ENGLISH)
+        for chart_engine in ChartEngine:
+            md_string = PricePerformanceBuilder(loc, chart_engine).build_markdown(
+                create_price_perf_dict
+            )
+
+            for price_perf in create_price_perf_dict["winners"]:
+                assert price_perf.ticker in md_string
+            assert "None" not in md_string
+            assert "![" not in md_string
+            assert '<div class="chart">' not in md_string
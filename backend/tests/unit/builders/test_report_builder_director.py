@@ -31,3 +31,24 @@ class TestReportBuilderDirector:
         assert f"report_{today_str}.pdf" in file_path
         # assert os.path.exists(file_path)
         # os.remove(file_path)
+
+    def test__create_pdf_report__clears_yahoo_data_hub(self, mocker):
+        """Check that every report starts and ends with an empty YahooDataHub."""
+        clear = mocker.patch(
+            "report_building.report_builder_director.YahooDataHub.clear"
+        )
+        report_builder = ReportBuilderDirector(Language.ENGLISH)
+
+        report_builder.create_pdf_report([])
+
+        assert clear.call_count == 2
+
+    def test__create_pdf_report_without_cache__bypasses_response_cache(
+        self, isolated_response_cache
+    ):
+        """Check that use_cache=False makes the report bypass the ResponseCache."""
+        report_builder = ReportBuilderDirector(Language.ENGLISH)
+
+        report_builder.create_pdf_report([], use_cache=False)
+
+        assert isolated_response_cache.bypass
@@ -0,0 +1,85 @@
+import re
+import xml.etree.ElementTree as ET
+
+import markdown
+import pytest
+
+from report_building.svg_graph_builder import SvgGraphBuilder
+from utils.enums.language import Language
+from utils.localization import Localization
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+class TestSvgGraphBuilder:
+    """Test class for SvgGraphBuilder."""
+
+    @staticmethod
+    def _builder() -> SvgGraphBuilder:
+        return SvgGraphBuilder(Localization(Language.ENGLISH))
+
+    def test__build_price_graph_detailed__points_annotated_with_change(self):
+        """Check that a short price list gets a marker for every point and a colored change above all but the first."""
+        svg = self._builder().build_price_graph([100.0, 110.0, 99.0, 99.0], "TCK1")
+
+        root = ET.fromstring(svg)
+        annotations = {
+            text.text: text.get("fill")
+            for text in root.iter(f"{SVG}text")
+            if text.text.endswith("%")
+        }
+        assert len(root.findall(f"{SVG}circle")) == 4
+        assert annotations == {"+10.00%": "green", "-10.00%": "red", "+0.00%": "gray"}
+
+    def test__build_price_graph_long__no_markers_or_annotations(self):
+        """Check that more than 20 prices are drawn as a plain line."""
+        svg = self._builder().build_price_graph([float(i) for i in range(25)], "TCK1")
+
+        root = ET.fromstring(svg)
+        assert root.findall(f"{SVG}circle") == []
+        assert len(root.find(f"{SVG}polyline").get("points").split()) == 25
+        assert "%" not in svg
+
+    def test__build_price_graph__prices_fit_inside_margin(self):
+        """Check that the y axis leaves a margin of a tenth of the price range above and below the prices."""
+        builder = self._builder()
+        svg = builder.build_price_graph([10.0, 20.0], "TCK1")
+
+        ys = [
+            float(point.split(",")[1])
+            for point in ET.fromstring(svg).find(f"{SVG}polyline").get("points").split()
+        ]
+        plot_height = builder.HEIGHT - builder.TOP - builder.BOTTOM
+        # 10 and 20 with a margin of 1 on both sides, the y axis goes from 9 to 21.
+        assert ys[0] == pytest.approx(builder.TOP + plot_height * 11 / 12, abs=0.1)
+        assert ys[1] == pytest.approx(builder.TOP + plot_height / 12, abs=0.1)
+
+    def test__build_price_graph__single_line_with_translated_labels(self):
+        """Check that the markup is one line, so it can be inlined into markdown, and labels are translated."""
+        svg = SvgGraphBuilder(Localization(Language.SERBIAN)).build_price_graph(
+            [5.0], "TCK1"
+        )
+
+        assert "\n" not in svg
+        assert ">Dani<" in svg
+
+    def test__build_price_graphs__failed_graph_is_none(self):
+        """Check that a graph without prices comes back as None without stopping the others."""
+        graphs = self._builder().build_price_graphs(
+            [([], "TCK1"), ([1.0, 2.0], "TCK2")]
+        )
+
+        assert graphs[0] is None
+        assert graphs[1].startswith("<svg")
+
+    def test__build_price_graph__inlined_unchanged_by_markdown(self):
+        """Check that an SVG block in the report markdown reaches the HTML as it is."""
+        svg = self._builder().build_price_graph([1.0, 2.0, 3.0], "TCK1")
+
+        html = markdown.markdown(
+            f'text\n\n<div class="chart">{svg}</div>\n\nmore',
+            extensions=["extra", "nl2br"],
+        )
+
+        assert svg in html
+        assert not re.search(r"<p>\s*<svg", html)
@@ -2,6 +2,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -12,13 +13,24 @@ from models.eps_information import EpsInformation
 from models.insider_information import InsiderInformation
 from models.news_article import NewsArticle
 from models.previous_earnings_information import PreviousEarningsInformation
+from models.price_matrix import PriceMatrix
 from models.price_performance_information import PricePerformanceInformation
 from models.section_data import SectionData
+from providers.yahoo.yahoo_data_hub import YahooDataHub
 from report_building.report_builder_director import ReportBuilderDirector
+from utils.cassette import Cassette
+from utils.cassette_player import CassettePlayer
+from utils.circuit_breaker import CircuitBreaker
+from utils.clock import Clock
 from utils.enums.language import Language
 from utils.enums.provider_type import ProviderType
 from utils.enums.section_type import SectionType
 from utils.enums.trade_type import TradeType
+from utils.negative_cache import NegativeCache
+from utils.news_index import NewsIndex
+from utils.price_store import PriceStore
+from utils.rate_limiter import RateLimiter
+from utils.response_cache import ResponseCache
 
 # --------------------------------------------------------------------------------------
 # Fixtures for creating objects.
@@ -226,6 +238,21 @@ def fixture_create_insider_trades() -> list[InsiderInformation]:
     ]
 
 
+@pytest.fixture(name="create_insider_transactions", scope="function")
+def fixture_create_insider_transactions(create_insider_trades) -> pd.DataFrame:
+    """Create the same 15 insider trades as a provider table."""
+    return pd.DataFrame(
+        {
+            "ticker": [trade.ticker for trade in create_insider_trades],
+            "value": [float(trade.value) for trade in create_insider_trades],
+            "type": [trade.type.value for trade in create_insider_trades],
+            "date": pd.to_datetime(
+                [trade.date for trade in create_insider_trades], utc=True
+            ),
+        }
+    )
+
+
 @pytest.fixture(name="create_price_performance_info", scope="function")
 def fixture_create_price_performance_info() -> list[PricePerformanceInformation]:
     return [
@@ -257,6 +284,9 @@ def fixture_create_price_performance_info() -> list[PricePerformanceInformation]
 def fixture_mock_yahoo_earnings_provider(monkeypatch, create_earnings_info):
     mock_instance = MagicMock()
     mock_instance.fetch_earnings.return_value = create_earnings_info
+    mock_instance.fetch_earnings_dates.return_value = {
+        e.ticker: e.date for e in create_earnings_info
+    }
 
     monkeypatch.setattr(
         "managers.earnings_manager.YahooEarningsProvider",
@@ -283,6 +313,9 @@ def fixture_mock_yahoo_analyst_provider(monkeypatch, create_analyst_recommendati
     mock_instance.fetch_analyst_recommendations.return_value = (
         create_analyst_recommendations
     )
+    mock_instance.iter_analyst_recommendations.side_effect = lambda tickers: iter(
+        create_analyst_recommendations
+    )
     monkeypatch.setattr(
         "managers.analyst_manager.YahooAnalystProvider",
         lambda *args, **kwargs: mock_instance,
@@ -291,9 +324,15 @@ def fixture_mock_yahoo_analyst_provider(monkeypatch, create_analyst_recommendati
 
 
 @pytest.fixture(name="mock_yahoo_insider_provider", scope="function")
-def fixture_mock_yahoo_insider_provider(monkeypatch, create_insider_trades):
+def fixture_mock_yahoo_insider_provider(
+    monkeypatch, create_insider_trades, create_insider_transactions
+):
     mock_instance = MagicMock()
     mock_instance.fetch_insider_trades.return_value = create_insider_trades
+    mock_instance.fetch_insider_transactions.return_value = create_insider_transactions
+    mock_instance.iter_insider_transactions.side_effect = lambda tickers: iter(
+        [create_insider_transactions]
+    )
     monkeypatch.setattr(
         "managers.insider_manager.YahooInsiderProvider",
         lambda *args, **kwargs: mock_instance,
@@ -301,12 +340,33 @@ def fixture_mock_yahoo_insider_provider(monkeypatch, create_insider_trades):
     return mock_instance
 
 
+@pytest.fixture(name="make_price_matrix", scope="function")
+def fixture_make_price_matrix():
+    """Fixture that creates a PriceMatrix from lists of prices, aligned on their last price on business days up to 2.3.2026."""
+
+    def make(prices: dict[str, list[float]]) -> PriceMatrix:
+        length = max((len(p) for p in prices.values()), default=0)
+        values = np.full((len(prices), length), np.nan)
+        for row, ticker_prices in enumerate(prices.values()):
+            if len(ticker_prices):
+                values[row, length - len(ticker_prices) :] = ticker_prices
+        days = pd.bdate_range(end="2026-03-02", periods=length)
+        return PriceMatrix.from_frame(
+            pd.DataFrame(values, index=list(prices), columns=days)
+        )
+
+    return make
+
+
 @pytest.fixture(name="mock_yahoo_price_performance_provider", scope="function")
 def fixture_mock_yahoo_price_performance_provider(
-    monkeypatch, create_price_performance_info
+    monkeypatch, create_price_performance_info, make_price_matrix
 ):
     mock_instance = MagicMock()
     mock_instance.fetch_price_performance.return_value = create_price_performance_info
+    mock_instance.fetch_price_matrix.return_value = make_price_matrix(
+        {p.ticker: p.prices for p in create_price_performance_info}
+    )
 
     monkeypatch.setattr(
         "managers.price_performance_manager.YahooPricePerformanceProvider",
@@ -400,6 +460,9 @@ def fixture_mock_report_builder_director(monkeypatch):
 def fixture_mock_earn_graph_builder(monkeypatch):
     mock_instance = MagicMock()
     mock_instance.build_price_graph.return_value = "path/to/graph"
+    mock_instance.build_price_graphs.side_effect = lambda charts: [
+        "path/to/graph"
+    ] * len(charts)
 
     monkeypatch.setattr(
         "report_building.earnings_builder.GraphBuilder",
@@ -413,6 +476,7 @@ def fixture_mock_earn_graph_builder(monkeypatch):
 def fixture_mock_false_earn_graph_builder(monkeypatch):
     mock_instance = MagicMock()
     mock_instance.build_price_graph.return_value = None
+    mock_instance.build_price_graphs.side_effect = lambda charts: [None] * len(charts)
 
     monkeypatch.setattr(
         "report_building.earnings_builder.GraphBuilder",
@@ -426,6 +490,9 @@ def fixture_mock_false_earn_graph_builder(monkeypatch):
 def fixture_mock_pp_graph_builder(monkeypatch):
     mock_instance = MagicMock()
     mock_instance.build_price_graph.return_value = "path/to/graph"
+    mock_instance.build_price_graphs.side_effect = lambda charts: [
+        "path/to/graph"
+    ] * len(charts)
 
     monkeypatch.setattr(
         "report_building.price_performance_builder.GraphBuilder",
@@ -435,6 +502,21 @@ def fixture_mock_pp_graph_builder(monkeypatch):
     return mock_instance
 
 
+@pytest.fixture(name="mock_false_pp_graph_builder", scope="function")
+def fixture_mock_false_pp_graph_builder(monkeypatch):
+    mock_instance = MagicMock()
+    mock_instance.build_price_graph.return_value = None
+    mock_instance.build_price_graphs.side_effect = lambda charts: [None] * len(charts)
+
+    for name in ("GraphBuilder", "SvgGraphBuilder"):
+        monkeypatch.setattr(
+            f"report_building.price_performance_builder.{name}",
+            lambda *args, **kwargs: mock_instance,
+        )
+
+    return mock_instance
+
+
 @pytest.fixture(name="mock_analyst_builder", scope="function")
 def fixture_mock_analyst_builder(monkeypatch):
     mock_instance = MagicMock()
@@ -512,9 +594,12 @@ def fixture_mock_yahoo_news_filter(monkeypatch, create_news_info):
 
 
 @pytest.fixture(name="mock_insider_filter", scope="function", autouse=True)
-def fixture_mock_insider_filter(monkeypatch, create_insider_trades):
+def fixture_mock_insider_filter(
+    monkeypatch, create_insider_trades, create_insider_transactions
+):
     mock_instance = MagicMock()
     mock_instance.filter_insider_info.return_value = create_insider_trades
+    mock_instance.filter_insider_transactions.return_value = create_insider_transactions
     monkeypatch.setattr(
         "managers.insider_manager.InsiderInfoFilter",
         lambda *args, **kwargs: mock_instance,
@@ -642,29 +727,113 @@ def fixture_sample_insider_trades():
 # --------------------------------------------------------------------------------------
 
 
+@pytest.fixture(name="isolated_response_cache", scope="function", autouse=True)
+def fixture_isolated_response_cache(tmp_path):
+    """Give every test its own empty ResponseCache, so tests never read or write the real one."""
+    ResponseCache.clear()
+    cache = ResponseCache.get_instance(tmp_path / "responses.sqlite3")
+    yield cache
+    ResponseCache.clear()
+
+
+@pytest.fixture(name="isolated_price_store", scope="function", autouse=True)
+def fixture_isolated_price_store(tmp_path):
+    """Give every test its own empty PriceStore, so tests never read or write the real one."""
+    PriceStore.clear()
+    store = PriceStore.get_instance(tmp_path / "prices.sqlite3")
+    yield store
+    PriceStore.clear()
+
+
+@pytest.fixture(name="isolated_negative_cache", scope="function", autouse=True)
+def fixture_isolated_negative_cache(tmp_path):
+    """Give every test its own empty NegativeCache, so tests never read or write the real one."""
+    NegativeCache.clear()
+    cache = NegativeCache.get_instance(tmp_path / "failures.sqlite3")
+    yield cache
+    NegativeCache.clear()
+
+
+@pytest.fixture(name="isolated_news_index", scope="function", autouse=True)
+def fixture_isolated_news_index(tmp_path):
+    """Give every test its own empty NewsIndex, so tests never read or write the real one."""
+    NewsIndex.clear()
+    index = NewsIndex.get_instance(tmp_path / "news.sqlite3")
+    yield index
+    NewsIndex.clear()
+
+
+@pytest.fixture(name="fresh_circuit_breaker", scope="function", autouse=True)
+def fixture_fresh_circuit_breaker():
+    """Give every test a CircuitBreaker with all circuits closed."""
+    CircuitBreaker.clear()
+    yield CircuitBreaker.get_instance()
+    CircuitBreaker.clear()
+
+
+@pytest.fixture(name="fresh_rate_limiter", scope="function", autouse=True)
+def fixture_fresh_rate_limiter():
+    """Give every test a RateLimiter with full buckets and configured rates."""
+    RateLimiter.clear()
+    yield RateLimiter.get_instance()
+    RateLimiter.clear()
+
+
+@pytest.fixture(name="fresh_cassette_player", scope="function", autouse=True)
+def fixture_fresh_cassette_player():
+    """Make sure no test records or replays unless it switches the CassettePlayer itself."""
+    CassettePlayer.clear()
+    yield CassettePlayer.get_instance()
+    CassettePlayer.get_instance().stop()
+    CassettePlayer.clear()
+
+
+@pytest.fixture(name="fresh_clock", scope="function", autouse=True)
+def fixture_fresh_clock():
+    """Make sure every test starts with a clock showing the real time."""
+    Clock.clear()
+    yield Clock.get_instance()
+    Clock.clear()
+
+
+@pytest.fixture(name="cassette", scope="function")
+def fixture_cassette(tmp_path):
+    cassette = Cassette(tmp_path / "cassette.sqlite3")
+    yield cassette
+    cassette.close()
+
+
+@pytest.fixture(name="fresh_yahoo_data_hub", scope="function", autouse=True)
+def fixture_fresh_yahoo_data_hub():
+    """Give every test an empty YahooDataHub, so mocked yf objects don't leak between tests."""
+    YahooDataHub.clear()
+    yield
+    YahooDataHub.clear()
+
+
 @pytest.fixture(name="mock_yf_ticker_news", scope="function")
 def fixture_mock_yf_ticker_news(mocker):
-    return mocker.patch("providers.yahoo.yahoo_news_provider.yf.Ticker")
+    return mocker.patch("providers.yahoo.yahoo_data_hub.yf.Ticker")
 
 
-@pytest.fixture(name="mock_yf_ticker_price_performance", scope="function")
-def fixture_mock_yf_ticker_price_performance(mocker):
-    return mocker.patch("providers.yahoo.yahoo_price_performance_provider.yf.Ticker")
+@pytest.fixture(name="mock_yf_download_price_performance", scope="function")
+def fixture_mock_yf_download_price_performance(mocker):
+    return mocker.patch("providers.yahoo.yahoo_data_hub.yf.download")
 
 
 @pytest.fixture(name="mock_yf_ticker_earnings", scope="function")
 def fixture_mock_yf_ticker_earnings(mocker):
-    return mocker.patch("providers.yahoo.yahoo_earnings_provider.yf.Ticker")
+    return mocker.patch("providers.yahoo.yahoo_data_hub.yf.Ticker")
 
 
 @pytest.fixture(name="mock_yf_ticker_analyst", scope="function")
 def fixture_mock_yf_ticker_analyst(mocker):
-    return mocker.patch("providers.yahoo.yahoo_analyst_provider.yf.Ticker")
+    return mocker.patch("providers.yahoo.yahoo_data_hub.yf.Ticker")
 
 
 @pytest.fixture(name="mock_yf_ticker_insider", scope="function")
 def fixture_mock_yf_ticker_insider(mocker):
-    return mocker.patch("providers.yahoo.yahoo_insider_provider.yf.Ticker")
+    return mocker.patch("providers.yahoo.yahoo_data_hub.yf.Ticker")
 
 
 @pytest.fixture(name="yf_stock_factory", scope="function")
@@ -674,21 +843,21 @@ def fixture_yf_stock_factory():
         stock = yf_stock_factory(
             calendar={"Earnings Date": [pd.Timestamp("2026-04-01")]},
             info={"shortName": "Acme", "marketCap": 12345},
-            history_15d_df=pd.DataFrame({"Close": [1.0, 2.0, 3.0]}),
-            history_range_df=pd.DataFrame({"Close": [10.0, 12.0]}),
+            history=pd.DataFrame({"Close": [1.0, 2.0, 3.0]}),
             earnings_dates_df=pd.DataFrame(
                 {"EPS Estimate": [1.1], "Reported EPS": [1.0]},
                 index=[pd.Timestamp("2026-01-01")],
             ),
         )
+
+    History without a DatetimeIndex is placed on consecutive days ending today.
     """
 
     def _factory(
         *,
         calendar=None,
         info=None,
-        history_15d=None,
-        history_range=None,
+        history=None,
         earnings_dates=None,
     ):
         stock = MagicMock()
@@ -709,19 +878,16 @@ def fixture_yf_stock_factory():
         else:
             stock.info = info or {}
 
-        if history_15d is None:
-            hist15 = pd.DataFrame()
-        elif isinstance(history_15d, pd.DataFrame):
-            hist15 = history_15d
-        else:
-            hist15 = pd.DataFrame(history_15d)
-
-        if history_range is None:
-            histr = pd.DataFrame()
-        elif isinstance(history_range, pd.DataFrame):
-            histr = history_range
+        if history is None:
+            hist = pd.DataFrame()
+        elif isinstance(history, pd.DataFrame):
+            hist = history
         else:
-            histr = pd.DataFrame(history_range)
+            hist = pd.DataFrame(history)
+        if not hist.empty and not isinstance(hist.index, pd.DatetimeIndex):
+            hist.index = pd.date_range(
+                end=pd.Timestamp.today().normalize(), periods=len(hist), freq="D"
+            )
 
         if earnings_dates is None:
             edf = pd.DataFrame()
@@ -736,12 +902,7 @@ def fixture_yf_stock_factory():
                 ]
                 edf.index = pd.DatetimeIndex(idx)
 
-        def history_side_effect(*args, **kwargs):
-            if kwargs.get("period") == "15d":
-                return hist15
-            return histr
-
-        stock.history.side_effect = history_side_effect
+        stock.history.return_value = hist
         stock.get_earnings_dates.return_value = edf
         return stock
 
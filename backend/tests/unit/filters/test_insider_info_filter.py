@@ -1,3 +1,5 @@
+import pandas as pd
+
 from filters.insider_info_filter import InsiderInfoFilter
 
 
@@ -12,3 +14,23 @@ class TestInsiderInfoFilter:
         result = insider_info_filter.filter_insider_info(sample_insider_trades)
         assert len(result) == 3
         assert result == sample_insider_trades[:3]
+
+    def test__filter_insider_transactions__same_result_as_object_filter(
+        self, sample_insider_trades
+    ):
+        """Check that filtering the table keeps the same trades as filtering objects."""
+        transactions = pd.DataFrame(
+            {
+                "ticker": [trade.ticker for trade in sample_insider_trades],
+                "value": [float(trade.value) for trade in sample_insider_trades],
+                "type": [trade.type.value for trade in sample_insider_trades],
+                "date": pd.to_datetime(
+                    [trade.date for trade in sample_insider_trades], utc=True
+                ),
+            }
+        )
+        insider_info_filter = InsiderInfoFilter(7)
+
+        result = insider_info_filter.filter_insider_transactions(transactions)
+
+        assert result["ticker"].tolist() == ["TCK1", "TCK2", "TCK3"]
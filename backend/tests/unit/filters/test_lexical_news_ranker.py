@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from filters.lexical_news_ranker import LexicalNewsRanker
+from models.news_article import NewsArticle
+
+NOW = datetime(2026, 4, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_article(
+    title: str, ticker: str = "TCK1", hours_old: float = 0, summary: str = ""
+) -> NewsArticle:
+    return NewsArticle(
+        title=title,
+        summary=summary,
+        pub_time=NOW - timedelta(hours=hours_old),
+        url=f"https://example.com/{title}/{ticker}/{hours_old}",
+        ticker=ticker,
+    )
+
+
+class TestLexicalNewsRanker:
+    """Test class for LexicalNewsRanker."""
+
+    def test__rank__weighted_keywords_ranked_first(self):
+        """Check that articles with heavier keywords rank above lighter and plain ones."""
+        plain = make_article("Company hosts annual picnic")
+        product = make_article("Company starts product launch")
+        merger = make_article("Company agrees to merger")
+
+        result = LexicalNewsRanker().rank([plain, product, merger], top_k=3)
+
+        assert result == [merger, product, plain]
+
+    def test__rank__summary_counts_less_than_title(self):
+        """Check that a keyword in the summary adds less than the same keyword in the title."""
+        in_title = make_article("Company announces layoffs")
+        in_summary = make_article("Company announces news", summary="Layoffs ahead")
+
+        assert LexicalNewsRanker().rank([in_summary, in_title], top_k=1) == [in_title]
+
+    def test__rank__newer_and_larger_companies_ranked_first(self):
+        """Check that equal articles are ranked by recency, then by company size."""
+        older = make_article("Company announces dividend", "AAPL", hours_old=48)
+        small = make_article("Company announces dividend", "TCK1")
+        large = make_article("Company announces dividend", "AAPL")
+
+        result = LexicalNewsRanker().rank([older, small, large], top_k=3)
+
+        assert result == [large, small, older]
+
+    def test__score__independent_of_current_time(self):
+        """Check that scores only depend on the articles, so rankings are reproducible."""
+        ranker = LexicalNewsRanker()
+        news = [make_article("Merger", hours_old=5), make_article("Recall")]
+        shifted = [
+            make_article("Merger", hours_old=5 + 100),
+            make_article("Recall", hours_old=100),
+        ]
+
+        assert ranker.score(news) == pytest.approx(ranker.score(shifted))
+
+    def test__score__article_without_publish_time_scored_lowest(self):
+        """Check that an article without a publish time doesn't break scoring and is ranked last."""
+        undated = make_article("Company agrees to merger")
+        undated._NewsArticle__pub_time = None
+        dated = make_article("Company hosts picnic")
+
+        assert LexicalNewsRanker().rank([undated, dated], top_k=2) == [dated, undated]
+
+    def test__prune__keeps_best_in_original_order(self):
+        """Check that pruning keeps the best scored articles without reordering them."""
+        news = [
+            make_article("Merger talks"),
+            make_article("Weather report"),
+            make_article("Recall announced"),
+            make_article("Sports update"),
+        ]
+
+        assert LexicalNewsRanker().prune(news, keep=2) == [news[0], news[2]]
@@ -1,8 +1,10 @@
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
 import pytest
 
 from filters.news_filter import NewsFilter
+from models.news_article import NewsArticle
 
 
 class TestNewsFilter:
@@ -62,3 +64,143 @@ class TestNewsFilter:
 
         assert result == sample_news_articles[:2]
         mock_ai.filter_news.assert_called_once()
+
+    def test__filter_news__needs_keyword_and_own_ticker_in_title(self, mocker):
+        """Check that articles pass only with a hard event keyword and their own ticker or company in title."""
+        mock_ai = MagicMock()
+        mock_ai.filter_news.side_effect = lambda articles, top_k: articles
+        mocker.patch("filters.news_filter.AiService.get_instance", return_value=mock_ai)
+        titles = [
+            "Apple announces merger with a startup",
+            "AAPL acquires a startup",
+            "Microsoft announces merger with a startup",
+            "Apple shares a photo",
+        ]
+        articles = [
+            NewsArticle(
+                title=title,
+                summary="summary",
+                pub_time=datetime.now(timezone.utc),
+                url=f"https://example.com/{i}",
+                ticker="AAPL",
+            )
+            for i, title in enumerate(titles)
+        ]
+
+        result = NewsFilter().filter_news(articles, top_k=4, days_behind=1)
+
+        assert [article.title for article in result] == titles[:2]
+
+    def test__filter_news__reported_articles_dropped_in_later_runs(
+        self, mocker, isolated_news_index, fresh_clock
+    ):
+        """Check that articles returned once aren't sent to the AI again by a later filter, even under another URL."""
+        mock_ai = MagicMock()
+        mock_ai.filter_news.side_effect = lambda articles, top_k: articles[:top_k]
+        mocker.patch("filters.news_filter.AiService.get_instance", return_value=mock_ai)
+        articles = [
+            NewsArticle(
+                title=f"Apple announces merger number {i}",
+                summary="summary",
+                pub_time=datetime.now(timezone.utc),
+                url=f"https://example.com/{i}",
+                ticker="AAPL",
+            )
+            for i in range(3)
+        ]
+        fresh_clock.pin(datetime.now(timezone.utc) - timedelta(days=1))
+        first = NewsFilter().filter_news(articles, top_k=1, days_behind=1)
+        fresh_clock.unpin()
+        republished = NewsArticle(
+            title=articles[0].title,
+            summary="summary",
+            pub_time=datetime.now(timezone.utc),
+            url="https://mirror.com/0",
+            ticker="AAPL",
+        )
+
+        second = NewsFilter().filter_news(
+            [*articles, republished], top_k=3, days_behind=1
+        )
+
+        assert first == articles[:1]
+        assert second == articles[1:]
+        assert isolated_news_index.dropped == 2
+
+    def test__filter_news__same_day_rerun_returns_same_news(
+        self, mocker, isolated_news_index
+    ):
+        """Check that generating the report again on the same day shows the same news instead of dropping them."""
+        mock_ai = MagicMock()
+        mock_ai.filter_news.side_effect = lambda articles, top_k: articles[:top_k]
+        mocker.patch("filters.news_filter.AiService.get_instance", return_value=mock_ai)
+        articles = [
+            NewsArticle(
+                title=f"Apple announces merger number {i}",
+                summary="summary",
+                pub_time=datetime.now(timezone.utc),
+                url=f"https://example.com/{i}",
+                ticker="AAPL",
+            )
+            for i in range(3)
+        ]
+
+        first = NewsFilter().filter_news(articles, top_k=2, days_behind=1)
+        second = NewsFilter().filter_news(articles, top_k=2, days_behind=1)
+
+        assert first == second == articles[:2]
+        assert isolated_news_index.dropped == 0
+
+    def test__filter_news__near_duplicates_collapsed_before_ai(self, mocker):
+        """Check that a story syndicated under more tickers reaches the AI only once."""
+        mock_ai = MagicMock()
+        mock_ai.filter_news.side_effect = lambda articles, top_k: articles
+        mocker.patch("filters.news_filter.AiService.get_instance", return_value=mock_ai)
+        summary = "Google parent Alphabet said it will buy the cloud security company in an all-cash deal."
+        articles = [
+            NewsArticle(
+                title=title,
+                summary=summary,
+                pub_time=datetime.now(timezone.utc),
+                url=url,
+                ticker=ticker,
+            )
+            for title, url, ticker in [
+                ("Google to acquire Wiz for $32 billion", "https://a.com/1", "GOOGL"),
+                (
+                    "Google agrees to acquire Wiz for $32 billion",
+                    "https://b.com/2",
+                    "GOOG",
+                ),
+                ("Nvidia announces merger talks", "https://c.com/3", "NVDA"),
+            ]
+        ]
+
+        result = NewsFilter().filter_news(articles, top_k=3, days_behind=1)
+
+        assert [article.url for article in result] == [
+            "https://a.com/1",
+            "https://c.com/3",
+        ]
+
+    def test__filter_news__only_best_scored_candidates_sent_to_ai(self, mocker):
+        """Check that the AI gets at most AI_CANDIDATES_PER_PICK candidates per returned article."""
+        mock_ai = MagicMock()
+        mock_ai.filter_news.side_effect = lambda articles, top_k: articles[:top_k]
+        mocker.patch("filters.news_filter.AiService.get_instance", return_value=mock_ai)
+        events = ["merger", "acquisition", "lawsuit", "recall", "layoffs"]
+        articles = [
+            NewsArticle(
+                title=f"Apple {events[i % len(events)]} update {i} part {i * 7}",
+                summary="summary",
+                pub_time=datetime.now(timezone.utc),
+                url=f"https://example.com/{i}",
+                ticker="AAPL",
+            )
+            for i in range(40)
+        ]
+
+        NewsFilter().filter_news(articles, top_k=2, days_behind=1)
+
+        sent = mock_ai.filter_news.call_args.args[0]
+        assert len(sent) == NewsFilter.AI_CANDIDATES_PER_PICK * 2
@@ -1,4 +1,5 @@
 from managers.analyst_manager import AnalystManager
+from models.analyst_recommendation import AnalystRecommendation
 
 
 class TestAnalystManager:
@@ -37,3 +38,23 @@ class TestAnalystManager:
             "buy": create_analyst_recommendations[::-1][:3],
             "sell": create_analyst_recommendations[:3][::-1],
         }
+
+    def test__get_analyst_recommendations__equal_indexes_ranked_in_ticker_order(
+        self, mock_yahoo_analyst_provider
+    ):
+        """Check that recommendations with equal indexes are ranked by the order of tickers, not by arrival."""
+        recommendations = [
+            AnalystRecommendation("TCK3", 50),
+            AnalystRecommendation("TCK1", 50),
+            AnalystRecommendation("TCK2", 50),
+        ]
+        mock_yahoo_analyst_provider.iter_analyst_recommendations.side_effect = (
+            lambda tickers: iter(recommendations)
+        )
+
+        result = AnalystManager(
+            tickers=["TCK1", "TCK2", "TCK3"]
+        ).get_analyst_recommendations(2)
+
+        assert [r.ticker for r in result["buy"]] == ["TCK1", "TCK2"]
+        assert [r.ticker for r in result["sell"]] == ["TCK2", "TCK3"]
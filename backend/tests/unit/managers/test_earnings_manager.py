@@ -38,6 +38,10 @@ class TestEarningsManager:
         mock_yahoo_earnings_provider.fetch_earnings.return_value = (
             mock_yahoo_earnings_provider.fetch_earnings.return_value[:3]
         )
+        mock_yahoo_earnings_provider.fetch_earnings_dates.return_value = {
+            e.ticker: e.date
+            for e in mock_yahoo_earnings_provider.fetch_earnings.return_value
+        }
         earnings_manager = EarningsManager()
         result = earnings_manager.get_latest_upcoming_earnings(5)
 
@@ -77,3 +81,32 @@ class TestEarningsManager:
             )[:5]
         ]
         assert [r.ticker for r in result] == expected_tickers
+
+    def test__get_earnings__only_soonest_companies_are_enriched(
+        self, mock_yahoo_earnings_provider, create_earnings_info
+    ):
+        """Check if get_latest_upcoming_earnings fetches full information only for the soonest companies."""
+        earnings_manager = EarningsManager()
+        earnings_manager.get_latest_upcoming_earnings(2)
+
+        soonest = sorted(create_earnings_info, key=lambda x: x.date)[:2]
+        mock_yahoo_earnings_provider.fetch_earnings.assert_called_once()
+        enriched = mock_yahoo_earnings_provider.fetch_earnings.call_args.args[0]
+        assert enriched == [e.ticker for e in soonest]
+
+    def test__get_earnings_enrichment_fails__next_soonest_companies_are_enriched(
+        self, mock_yahoo_earnings_provider, create_earnings_info
+    ):
+        """Check if get_latest_upcoming_earnings replaces companies whose full information could not be fetched."""
+        by_ticker = {e.ticker: e for e in create_earnings_info}
+        soonest = sorted(create_earnings_info, key=lambda x: x.date)
+
+        def fetch_earnings(tickers, cutoff):
+            return [by_ticker[t] for t in tickers if t != soonest[0].ticker]
+
+        mock_yahoo_earnings_provider.fetch_earnings.side_effect = fetch_earnings
+        earnings_manager = EarningsManager()
+        result = earnings_manager.get_latest_upcoming_earnings(3)
+
+        assert [r.ticker for r in result] == [e.ticker for e in soonest[1:4]]
+        assert mock_yahoo_earnings_provider.fetch_earnings.call_count == 2
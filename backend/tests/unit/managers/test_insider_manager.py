@@ -1,3 +1,5 @@
+import pandas as pd
+
 from managers.insider_manager import InsiderManager
 
 
@@ -84,3 +86,54 @@ class TestInsiderManager:
         assert result["sellers"][2].ticker == "TCK6"
         assert result["sellers"][2].bought == 0.0
         assert result["sellers"][2].sold == 1000.0
+
+    def test__get_insider_trades__objects_created_only_for_top_companies(
+        self, mock_yahoo_insider_provider, mock_insider_filter, mocker
+    ):
+        """Check that AggregatedInsiderInfo objects are created only for returned buyers and sellers."""
+        aggregated = mocker.patch("managers.insider_manager.AggregatedInsiderInfo")
+
+        InsiderManager().get_insider_trades(2)
+
+        assert aggregated.call_count == 4
+
+    def test__get_insider_trades_no_trades__returns_empty_lists(
+        self, mock_yahoo_insider_provider, mock_insider_filter
+    ):
+        """Check that no trades result in no buyers and no sellers."""
+        mock_insider_filter.filter_insider_transactions.return_value = pd.DataFrame(
+            columns=["ticker", "value", "type", "date"]
+        )
+
+        result = InsiderManager().get_insider_trades(3)
+
+        assert result == {"buyers": [], "sellers": []}
+
+    def test__get_insider_trades__tickers_streamed_in_separate_tables(
+        self,
+        mock_yahoo_insider_provider,
+        mock_insider_filter,
+        create_insider_transactions,
+    ):
+        """Check that tables of separate tickers are filtered one by one and ranked together."""
+        tables = [frame for _, frame in create_insider_transactions.groupby("ticker")][
+            ::-1
+        ]
+        mock_yahoo_insider_provider.iter_insider_transactions.side_effect = (
+            lambda tickers: iter(tables)
+        )
+        mock_insider_filter.filter_insider_transactions.side_effect = lambda t: t
+
+        result = InsiderManager(
+            tickers=[f"TCK{i}" for i in range(1, 8)]
+        ).get_insider_trades(2)
+
+        assert mock_insider_filter.filter_insider_transactions.call_count == 7
+        assert [(a.ticker, a.bought) for a in result["buyers"]] == [
+            ("TCK1", 3000.0),
+            ("TCK3", 2000.0),
+        ]
+        assert [(a.ticker, a.sold) for a in result["sellers"]] == [
+            ("TCK2", 6000.0),
+            ("TCK4", 3000.0),
+        ]
@@ -21,10 +21,12 @@ class TestPricePerformanceManager:
         assert result["losers"][2].ticker == "TCK7"
 
     def test__get_price_performance_empty_list__returns_empty_list(
-        self, mock_yahoo_price_performance_provider
+        self, mock_yahoo_price_performance_provider, make_price_matrix
     ):
         """Check if get_worst_best_price_performance returns an empty list if no data is provided to it."""
-        mock_yahoo_price_performance_provider.fetch_price_performance.return_value = []
+        mock_yahoo_price_performance_provider.fetch_price_matrix.return_value = (
+            make_price_matrix({})
+        )
         pp_manager = PricePerformanceManager()
         result = pp_manager.get_best_worst_price_performance(3)
         assert result == {"winners": [], "losers": []}
@@ -39,11 +41,16 @@ class TestPricePerformanceManager:
         assert len(result["losers"]) == 3
 
     def test__get_price_performance_small_data__returns_lesser_winners_losers(
-        self, mock_yahoo_price_performance_provider, create_price_performance_info
+        self,
+        mock_yahoo_price_performance_provider,
+        create_price_performance_info,
+        make_price_matrix,
     ):
         """Check if get_worst_best_price_performance returns same for winners and losers when there are less tickers then companies."""
-        mock_yahoo_price_performance_provider.fetch_price_performance.return_value = (
-            create_price_performance_info[:2]
+        mock_yahoo_price_performance_provider.fetch_price_matrix.return_value = (
+            make_price_matrix(
+                {p.ticker: p.prices for p in create_price_performance_info[:2]}
+            )
         )
         pp_manager = PricePerformanceManager()
         result = pp_manager.get_best_worst_price_performance(3)
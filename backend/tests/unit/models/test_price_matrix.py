@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+from models.price_matrix import PriceMatrix
+from models.price_performance_information import PricePerformanceInformation
+
+
+class TestPriceMatrix:
+    """Test class for PriceMatrix model."""
+
+    def test__percent_changes__same_as_single_ticker_calculation(
+        self,
+        create_price_performance_info: list[PricePerformanceInformation],
+        make_price_matrix,
+    ):
+        """Check that the vectorized percent changes equal those of PricePerformanceInformation."""
+        matrix = make_price_matrix(
+            {p.ticker: p.prices for p in create_price_performance_info}
+        )
+
+        assert matrix.percent_changes().tolist() == [
+            p.percent_change for p in create_price_performance_info
+        ]
+
+    def test__percent_changes__shorter_and_empty_histories(self, make_price_matrix):
+        """Check that shorter histories start at their first price, and too short ones have no change."""
+        matrix = make_price_matrix(
+            {"TCK1": [10.0, 11.0, 12.0], "TCK2": [5.0, 10.0], "TCK3": [7.0], "TCK4": []}
+        )
+
+        assert matrix.percent_changes().tolist() == [20.0, 100.0, 0.0, 0.0]
+        assert matrix.has_prices().tolist() == [True, True, True, False]
+        assert [p.ticker for p in matrix.rows()] == ["TCK1", "TCK2", "TCK3"]
+
+    def test__row__prices_are_a_view_into_the_matrix(self, make_price_matrix):
+        """Check that a row doesn't copy prices, and starts at the first price of the ticker."""
+        matrix = make_price_matrix({"TCK1": [1.0, 2.0, 3.0], "TCK2": [4.0, 6.0]})
+
+        row = matrix.row(1)
+
+        assert row.prices == [4.0, 6.0]
+        assert row.percent_change == 50.0
+        assert np.shares_memory(row.values, matrix.values)
+
+    def test__best_worst__ranked_like_a_stable_descending_sort(
+        self,
+        create_price_performance_info: list[PricePerformanceInformation],
+        make_price_matrix,
+    ):
+        """Check that winners and losers are the same as sorting all tickers by percent change."""
+        matrix = make_price_matrix(
+            {p.ticker: p.prices for p in create_price_performance_info}
+        )
+        ranked = sorted(
+            create_price_performance_info, key=lambda p: p.percent_change, reverse=True
+        )
+
+        winners, losers = matrix.best_worst(4)
+
+        assert [p.ticker for p in winners] == [p.ticker for p in ranked[:4]]
+        assert [p.ticker for p in losers] == [p.ticker for p in ranked[-4:]]
+
+    def test__best_worst__tickers_without_prices_are_not_ranked(
+        self, make_price_matrix
+    ):
+        """Check that empty rows never become winners or losers."""
+        matrix = make_price_matrix({"TCK1": [], "TCK2": [1.0, 2.0]})
+
+        winners, losers = matrix.best_worst(3)
+
+        assert [p.ticker for p in winners] == ["TCK2"]
+        assert [p.ticker for p in losers] == ["TCK2"]
+
+    def test__from_frame__gaps_keep_previous_price(self):
+        """Check that a missing day between prices keeps the previous price, and leading days stay empty."""
+        days = pd.date_range("2026-01-01", periods=4)
+        closes = pd.DataFrame(
+            [[1.0, np.nan, 3.0, 4.0], [np.nan, np.nan, 5.0, 6.0]],
+            index=["TCK1", "TCK2"],
+            columns=days,
+        )
+
+        matrix = PriceMatrix.from_frame(closes)
+
+        assert matrix.row(0).prices == [1.0, 1.0, 3.0, 4.0]
+        assert matrix.row(1).prices == [5.0, 6.0]
+        assert matrix.days.equals(days)
@@ -33,4 +33,5 @@ class TestSectionData:
             "days_ahead": 1,
             "days_behind": 1,
             "number_of_companies": 1,
+            "chart_engine": "png",
         }
@@ -84,3 +84,23 @@ class TestYahooAnalystProvider:
         result = provider.fetch_analyst_recommendations(["TCK1", "TCK2"])
 
         assert len(result) == 1
+
+    def test__iter_analyst_recommendations__yields_valid_recommendations(
+        self, mock_yf_ticker_analyst
+    ):
+        """Check that iter_analyst_recommendations yields a recommendation for every ticker with a valid mean."""
+        means = {"TCK1": 1.0, "TCK2": 6.0, "TCK3": 5.0}
+
+        def ticker_side_effect(ticker):
+            stock = MagicMock()
+            stock.info.get.return_value = means[ticker]
+            return stock
+
+        mock_yf_ticker_analyst.side_effect = ticker_side_effect
+
+        result = YahooAnalystProvider().iter_analyst_recommendations(list(means))
+
+        assert sorted((r.ticker, r.index) for r in result) == [
+            ("TCK1", 100.0),
+            ("TCK3", -100.0),
+        ]
@@ -0,0 +1,24 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from providers.yahoo.async_yahoo_analyst_provider import AsyncYahooAnalystProvider
+
+
+class TestAsyncYahooAnalystProvider:
+    """Test class for AsyncYahooAnalystProvider."""
+
+    def test__fetch_analyst_recommendations__invalid_and_failing_tickers_skipped(self):
+        """Check that tickers with invalid means or failing requests are left out."""
+        means = {"TCK1": {"recommendationMean": 1.0}, "TCK2": {}}
+        client = MagicMock()
+        client.get_info = AsyncMock(side_effect=lambda ticker: means[ticker])
+
+        result = asyncio.run(
+            AsyncYahooAnalystProvider(client).fetch_analyst_recommendations(
+                ["TCK1", "TCK2", "TCK3"]
+            )
+        )
+
+        assert len(result) == 1
+        assert result[0].ticker == "TCK1"
+        assert result[0].index == 100.0
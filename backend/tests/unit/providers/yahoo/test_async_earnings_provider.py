@@ -0,0 +1,71 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+
+from providers.yahoo.async_yahoo_earnings_provider import AsyncYahooEarningsProvider
+
+
+def make_client(calendars: dict) -> MagicMock:
+    client = MagicMock()
+    client.get_calendar = AsyncMock(side_effect=lambda ticker: calendars[ticker])
+    client.get_info = AsyncMock(return_value={"shortName": "Acme", "marketCap": 10})
+    client.get_earnings_dates = AsyncMock(return_value=None)
+    client.get_history = AsyncMock(
+        return_value=pd.DataFrame(
+            {"Close": [1.0, 2.0]},
+            index=pd.date_range(end=pd.Timestamp.today().normalize(), periods=2),
+        )
+    )
+    return client
+
+
+class TestAsyncYahooEarningsProvider:
+    """Test class for AsyncYahooEarningsProvider."""
+
+    def test__fetch_earnings__returns_only_reports_inside_window(self):
+        """Check that only companies with a report before cutoff are returned, with their data."""
+        soon = (datetime.now() + timedelta(days=3)).date()
+        late = (datetime.now() + timedelta(days=60)).date()
+        client = make_client(
+            {"TCK1": {"Earnings Date": [soon]}, "TCK2": {"Earnings Date": [late]}}
+        )
+        cutoff = (datetime.now() + timedelta(days=30)).date()
+
+        result = asyncio.run(
+            AsyncYahooEarningsProvider(client).fetch_earnings(["TCK1", "TCK2"], cutoff)
+        )
+
+        assert len(result) == 1
+        assert result[0].ticker == "TCK1"
+        assert result[0].name == "Acme"
+        assert result[0].value_last_15_days == [1.0, 2.0]
+
+    def test__fetch_earnings_dates__failing_ticker_is_skipped(self):
+        """Check that a ticker whose calendar fails is left out, others are still returned."""
+        soon = (datetime.now() + timedelta(days=3)).date()
+        client = make_client({"TCK1": {"Earnings Date": [soon]}})
+        cutoff = (datetime.now() + timedelta(days=30)).date()
+
+        result = asyncio.run(
+            AsyncYahooEarningsProvider(client).fetch_earnings_dates(
+                ["TCK1", "MISSING"], cutoff
+            )
+        )
+
+        assert result == {"TCK1": soon}
+
+    def test__fetch_earnings__info_failure_keeps_company(self):
+        """Check that a company without info is still returned with empty name and market cap."""
+        soon = (datetime.now() + timedelta(days=3)).date()
+        client = make_client({"TCK1": {"Earnings Date": [soon]}})
+        client.get_info.side_effect = Exception("API Error")
+        cutoff = (datetime.now() + timedelta(days=30)).date()
+
+        result = asyncio.run(
+            AsyncYahooEarningsProvider(client).fetch_earnings(["TCK1"], cutoff)
+        )
+
+        assert result[0].name == ""
+        assert result[0].market_cap == 0
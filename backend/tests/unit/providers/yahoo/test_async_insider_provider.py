@@ -0,0 +1,32 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+
+from providers.yahoo.async_yahoo_insider_provider import AsyncYahooInsiderProvider
+from utils.enums.trade_type import TradeType
+
+
+class TestAsyncYahooInsiderProvider:
+    """Test class for AsyncYahooInsiderProvider."""
+
+    def test__fetch_insider_trades__classifies_rows_and_skips_failing_ticker(self):
+        """Check that transactions are converted like in the synchronous provider."""
+        transactions = pd.DataFrame(
+            {
+                "Text": ["Purchase at price 10", "Sale at price 12", ""],
+                "Value": [100, 200, 300],
+                "Start Date": [datetime(2026, 10, 1)] * 3,
+            }
+        )
+        client = MagicMock()
+        client.get_insider_transactions = AsyncMock(
+            side_effect=lambda ticker: {"TCK1": transactions}[ticker]
+        )
+
+        result = asyncio.run(
+            AsyncYahooInsiderProvider(client).fetch_insider_trades(["TCK1", "TCK2"])
+        )
+
+        assert [trade.type for trade in result] == [TradeType.BUY, TradeType.SELL]
@@ -0,0 +1,59 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from providers.yahoo.async_yahoo_news_provider import AsyncYahooNewsProvider
+from providers.yahoo.yahoo_news_provider import YahooNewsProvider
+from utils.circuit_breaker import CircuitOpenError
+
+
+class TestAsyncYahooNewsProvider:
+    """Test class for AsyncYahooNewsProvider."""
+
+    def test__fetch_news__articles_of_all_tickers_returned(self):
+        """Check that articles of every ticker are converted to NewsArticle objects."""
+        client = MagicMock()
+        client.get_news = AsyncMock(
+            side_effect=lambda ticker, count, tab: [
+                {
+                    "content": {
+                        "title": f"{ticker} news",
+                        "summary": "Summary",
+                        "pubDate": "2026-10-17T10:00:00Z",
+                        "canonicalUrl": {"url": f"https://news/{ticker}"},
+                    }
+                },
+                {"content": {}},
+            ]
+        )
+
+        result = asyncio.run(
+            AsyncYahooNewsProvider(client).fetch_news(["TCK1", "TCK2"], 1)
+        )
+
+        assert [article.title for article in result] == ["TCK1 news", "TCK2 news"]
+        assert client.get_news.call_args.args[1] == YahooNewsProvider.PAGE_SIZE
+
+    def test__fetch_news__failing_ticker_has_no_articles(self):
+        """Check that a ticker whose news can't be fetched doesn't fail the other tickers."""
+        client = MagicMock()
+
+        async def get_news(ticker, count, tab):
+            if ticker == "TCK1":
+                raise CircuitOpenError("circuit open")
+            return [
+                {
+                    "content": {
+                        "title": f"{ticker} news",
+                        "pubDate": "2026-10-17T10:00:00Z",
+                        "canonicalUrl": {"url": f"https://news/{ticker}"},
+                    }
+                }
+            ]
+
+        client.get_news = get_news
+
+        result = asyncio.run(
+            AsyncYahooNewsProvider(client).fetch_news(["TCK1", "TCK2"], 1)
+        )
+
+        assert [article.title for article in result] == ["TCK2 news"]
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+
+from providers.yahoo.async_yahoo_price_performance_provider import (
+    AsyncYahooPricePerformanceProvider,
+)
+
+
+class TestAsyncYahooPricePerformanceProvider:
+    """Test class for AsyncYahooPricePerformanceProvider."""
+
+    def test__fetch_price_performance__empty_and_failing_tickers_skipped(self):
+        """Check that only tickers with prices are returned, with rounded prices."""
+        histories = {
+            "TCK1": pd.DataFrame(
+                {"Close": [1.234, 2.345]},
+                index=pd.date_range(end=pd.Timestamp.today().normalize(), periods=2),
+            ),
+            "TCK2": pd.DataFrame({"Close": []}, index=pd.DatetimeIndex([])),
+        }
+        client = MagicMock()
+        client.get_history = AsyncMock(
+            side_effect=lambda ticker, start, end: histories[ticker]
+        )
+
+        result = asyncio.run(
+            AsyncYahooPricePerformanceProvider(client).fetch_price_performance(
+                ["TCK1", "TCK2", "TCK3"], 30
+            )
+        )
+
+        assert len(result) == 1
+        assert result[0].ticker == "TCK1"
+        assert result[0].prices == [1.23, 2.35]
+
+    def test__fetch_price_performance__second_run_requests_only_last_days(self):
+        """Check that stored prices are reused and only the last stored days are requested again."""
+        today = pd.Timestamp.today().normalize()
+        history = pd.DataFrame(
+            {"Close": [1.0, 2.0, 3.0]}, index=pd.date_range(end=today, periods=3)
+        )
+        client = MagicMock()
+        client.get_history = AsyncMock(return_value=history)
+        provider = AsyncYahooPricePerformanceProvider(client)
+
+        asyncio.run(provider.fetch_price_performance(["TCK1"], 30))
+        result = asyncio.run(provider.fetch_price_performance(["TCK1"], 30))
+
+        assert result[0].prices == [1.0, 2.0, 3.0]
+        second_start = client.get_history.call_args_list[1].args[1]
+        assert second_start == (today - pd.Timedelta(days=1)).date()
+
+    def test__fetch_price_matrix__store_error_returns_empty_matrix(
+        self, isolated_price_store, mocker
+    ):
+        """Check that a failing PriceStore read gives empty rows instead of failing the whole call."""
+        client = MagicMock()
+        client.get_history = AsyncMock(return_value=pd.DataFrame({"Close": []}))
+        mocker.patch.object(
+            isolated_price_store, "matrix", side_effect=RuntimeError("locked")
+        )
+
+        matrix = asyncio.run(
+            AsyncYahooPricePerformanceProvider(client).fetch_price_matrix(
+                ["TCK1", "TCK2"], 30
+            )
+        )
+
+        assert matrix.tickers == ["TCK1", "TCK2"]
+        assert matrix.has_prices().tolist() == [False, False]
+
+    def test__fetch_price_matrix__store_used_off_event_loop_thread(
+        self, isolated_price_store, mocker
+    ):
+        """Check that blocking PriceStore calls run on worker threads, not on the event loop."""
+        threads = {}
+        for name in ("missing", "merge", "matrix"):
+            original = getattr(isolated_price_store, name)
+
+            def record(*args, _name=name, _original=original, **kwargs):
+                threads.setdefault(_name, threading.get_ident())
+                return _original(*args, **kwargs)
+
+            mocker.patch.object(isolated_price_store, name, side_effect=record)
+        client = MagicMock()
+        client.get_history = AsyncMock(
+            return_value=pd.DataFrame(
+                {"Close": [1.0]}, index=[pd.Timestamp.today().normalize()]
+            )
+        )
+
+        async def fetch():
+            loop_thread = threading.get_ident()
+            await AsyncYahooPricePerformanceProvider(client).fetch_price_matrix(
+                ["TCK1"], 5
+            )
+            return loop_thread
+
+        loop_thread = asyncio.run(fetch())
+
+        assert set(threads) == {"missing", "merge", "matrix"}
+        assert loop_thread not in threads.values()
@@ -0,0 +1,277 @@
+import asyncio
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from providers.yahoo.async_yahoo_client import AsyncYahooClient
+from utils.cassette import Cassette
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.rate_limiter import RateLimiter
+from utils.stand_in_server import StandInServer
+
+
+def make_response(json_data=None, text="", status_code=200):
+    response = MagicMock()
+    response.json.return_value = json_data
+    response.text = text
+    response.status_code = status_code
+    if status_code >= 400:
+        response.raise_for_status.side_effect = Exception(f"HTTP {status_code}")
+    return response
+
+
+def make_session(*responses):
+    session = MagicMock()
+    session.get = AsyncMock(return_value=make_response(text="crumb123"))
+    session.request = AsyncMock(side_effect=list(responses))
+    session.close = AsyncMock()
+    return session
+
+
+class TestAsyncYahooClient:
+    """Test class for AsyncYahooClient."""
+
+    def test__get_info__merges_modules_with_raw_values(self):
+        """Check that info contains fields from all modules, with raw values unwrapped."""
+        session = make_session(
+            make_response(
+                {
+                    "quoteSummary": {
+                        "result": [
+                            {
+                                "price": {"shortName": "Acme", "marketCap": 123},
+                                "financialData": {
+                                    "recommendationMean": {"raw": 2.1, "fmt": "2.10"}
+                                },
+                            }
+                        ]
+                    }
+                }
+            )
+        )
+        client = AsyncYahooClient(session=session)
+
+        info = asyncio.run(client.get_info("TCK1"))
+
+        assert info["shortName"] == "Acme"
+        assert info["marketCap"] == 123
+        assert info["recommendationMean"] == 2.1
+        assert session.request.call_args.kwargs["params"]["crumb"] == "crumb123"
+
+    def test__get_calendar__shaped_like_yfinance(self):
+        """Check that calendar uses the same keys and types as yfinance calendar."""
+        timestamp = int(datetime(2026, 11, 1, 12).timestamp())
+        session = make_session(
+            make_response(
+                {
+                    "quoteSummary": {
+                        "result": [
+                            {
+                                "calendarEvents": {
+                                    "earnings": {
+                                        "earningsDate": [timestamp],
+                                        "earningsAverage": 1.2,
+                                        "earningsLow": 1.0,
+                                        "earningsHigh": 1.4,
+                                        "revenueAverage": 1000,
+                                    }
+                                }
+                            }
+                        ]
+                    }
+                }
+            )
+        )
+        client = AsyncYahooClient(session=session)
+
+        calendar = asyncio.run(client.get_calendar("TCK1"))
+
+        assert calendar["Earnings Date"] == [date(2026, 11, 1)]
+        assert calendar["Earnings Average"] == 1.2
+        assert calendar["Revenue Average"] == 1000
+
+    def test__get_history__close_column_without_missing_days(self):
+        """Check that chart data is returned as a Close column indexed by exchange time."""
+        session = make_session(
+            make_response(
+                {
+                    "chart": {
+                        "result": [
+                            {
+                                "meta": {"exchangeTimezoneName": "America/New_York"},
+                                "timestamp": [1760000000, 1760086400, 1760172800],
+                                "indicators": {"quote": [{"close": [1.0, None, 3.0]}]},
+                            }
+                        ]
+                    }
+                }
+            )
+        )
+        client = AsyncYahooClient(session=session)
+
+        history = asyncio.run(
+            client.get_history("TCK1", date(2025, 10, 1), date(2025, 10, 20))
+        )
+
+        assert history["Close"].tolist() == [1.0, 3.0]
+        assert str(history.index.tz) == "America/New_York"
+
+    def test__get_insider_transactions__columns_renamed_like_yfinance(self):
+        """Check that insider transactions use yfinance column names."""
+        session = make_session(
+            make_response(
+                {
+                    "quoteSummary": {
+                        "result": [
+                            {
+                                "insiderTransactions": {
+                                    "transactions": [
+                                        {
+                                            "maxAge": 1,
+                                            "transactionText": "Sale at price 10",
+                                            "value": {"raw": 1000},
+                                            "startDate": {"raw": 1760000000},
+                                        }
+                                    ]
+                                }
+                            }
+                        ]
+                    }
+                }
+            )
+        )
+        client = AsyncYahooClient(session=session)
+
+        df = asyncio.run(client.get_insider_transactions("TCK1"))
+
+        assert list(df.columns) == ["Text", "Value", "Start Date"]
+        assert df.iloc[0]["Value"] == 1000
+
+    def test__get_news__ads_are_skipped(self):
+        """Check that only articles that aren't ads are returned."""
+        session = make_session(
+            make_response(
+                {
+                    "data": {
+                        "tickerStream": {
+                            "stream": [{"id": 1}, {"id": 2, "ad": ["x"]}, {"id": 3}]
+                        }
+                    }
+                }
+            )
+        )
+        client = AsyncYahooClient(session=session)
+
+        news = asyncio.run(client.get_news("TCK1", 10, "all"))
+
+        assert news == [{"id": 1}, {"id": 3}]
+        assert session.request.call_args.args[0] == "POST"
+
+    def test__request__crumb_is_requested_once(self):
+        """Check that concurrent requests share one cookie and crumb request."""
+        session = make_session(
+            *[make_response({"quoteSummary": {"result": [{}]}}) for _ in range(5)]
+        )
+        client = AsyncYahooClient(session=session)
+
+        async def fetch_all():
+            return await asyncio.gather(*(client.get_info(f"TCK{i}") for i in range(5)))
+
+        asyncio.run(fetch_all())
+
+        assert session.get.call_count == 2
+        assert session.request.call_count == 5
+
+    def test__request__error_status_raises(self):
+        """Check that an error response raises instead of returning garbage."""
+        session = make_session(make_response(status_code=404))
+        client = AsyncYahooClient(session=session)
+
+        with pytest.raises(Exception, match="HTTP 404"):
+            asyncio.run(client.get_info("TCK1"))
+
+    def test__request__base_url_is_configurable(self):
+        """Check that requests go to the configured base url."""
+        session = make_session(make_response({"quoteSummary": {"result": [{}]}}))
+        client = AsyncYahooClient(session=session, base_url="http://localhost:8000/")
+
+        asyncio.run(client.get_info("TCK1"))
+
+        assert session.request.call_args.args[1].startswith("http://localhost:8000/v10")
+
+    def test__close__session_is_closed(self):
+        """Check that leaving the client context closes the session."""
+        session = make_session()
+
+        async def use_client():
+            async with AsyncYahooClient(session=session):
+                pass
+
+        asyncio.run(use_client())
+
+        session.close.assert_awaited_once()
+
+    def test__request__too_many_requests_lowers_yahoo_rate(self, fresh_rate_limiter):
+        """Check that a 429 answer raises and slows down later yahoo requests."""
+        throttled = make_response(status_code=429)
+        throttled.headers = {"Retry-After": "3"}
+        session = make_session(throttled)
+        client = AsyncYahooClient(session=session)
+        rate = fresh_rate_limiter.rate(RateLimiter.YAHOO_HOST)
+
+        with pytest.raises(Exception, match="HTTP 429"):
+            asyncio.run(client.get_info("TCK1"))
+
+        assert fresh_rate_limiter.rate(RateLimiter.YAHOO_HOST) == rate / 2
+
+    def test__get_info__replayed_from_stand_in_server(self, cassette):
+        """Check that a real session gets recorded responses from the stand-in server."""
+        cassette.put(
+            Cassette.HTTP_CHANNEL,
+            Cassette.http_key(
+                "GET",
+                "/v10/finance/quoteSummary/TCK1",
+                {
+                    "modules": "price,summaryDetail,financialData",
+                    "corsDomain": "finance.yahoo.com",
+                    "formatted": "false",
+                    "symbol": "TCK1",
+                },
+            ),
+            (
+                200,
+                "application/json",
+                b'{"quoteSummary": {"result": [{"price": {"shortName": "Acme"}}]}}',
+            ),
+        )
+
+        async def replay(url):
+            async with AsyncYahooClient(
+                base_url=url, root_url=url, cookie_url=url
+            ) as client:
+                return await client.get_info("TCK1")
+
+        with StandInServer(cassette) as server:
+            info = asyncio.run(replay(server.url))
+
+        assert info == {"shortName": "Acme"}
+
+    def test__request__open_circuit_fails_without_request(self, fresh_circuit_breaker):
+        """Check that server errors open the circuit, and later requests aren't sent at all."""
+        failing = [
+            make_response(status_code=503) for _ in range(CircuitBreaker.MIN_CALLS)
+        ]
+        session = make_session(*failing)
+        client = AsyncYahooClient(session=session)
+
+        async def run():
+            for _ in range(CircuitBreaker.MIN_CALLS):
+                with pytest.raises(Exception, match="HTTP 503"):
+                    await client.get_info("TCK1")
+            with pytest.raises(CircuitOpenError):
+                await client.get_info("TCK1")
+
+        asyncio.run(run())
+
+        assert session.request.call_count == CircuitBreaker.MIN_CALLS
@@ -1,6 +1,9 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock, PropertyMock
 
+import pandas as pd
+
+from providers.yahoo.yahoo_data_hub import YahooDataHub
 from providers.yahoo.yahoo_earnings_provider import YahooEarningsProvider
 
 
@@ -20,8 +23,7 @@ class TestEarningsProvider:
                 "Revenue Average": 123456,
             },
             info={"shortName": "company 1", "marketCap": 10000000},
-            history_15d={"Close": [100.0, 101.5, 102.3]},
-            history_range={"Close": [95.0, 105.0]},
+            history={"Close": [100.0, 101.5, 102.3]},
             earnings_dates={"EPS Estimate": [1.1], "Reported EPS": [1.05]},
         )
         stock_2 = yf_stock_factory(
@@ -33,8 +35,7 @@ class TestEarningsProvider:
                 "Revenue Average": 654321,
             },
             info={"shortName": "company 2", "marketCap": 20000000},
-            history_15d={"Close": [200.0, 202.5, 205.3]},
-            history_range={"Close": [190.0, 210.0]},
+            history={"Close": [200.0, 202.5, 205.3]},
             earnings_dates={"EPS Estimate": [2.3], "Reported EPS": [2.5]},
         )
         stock_3 = yf_stock_factory(
@@ -46,8 +47,7 @@ class TestEarningsProvider:
                 "Revenue Average": 987654,
             },
             info={"shortName": "company 3", "marketCap": 30000000},
-            history_15d={"Close": [300.0, 303.5, 305.3]},
-            history_range={"Close": [290.0, 310.0]},
+            history={"Close": [300.0, 303.5, 305.3]},
             earnings_dates={"EPS Estimate": [3.4], "Reported EPS": [3.6]},
         )
 
@@ -142,8 +142,7 @@ class TestEarningsProvider:
             info=MagicMock(
                 get=MagicMock(side_effect=Exception("stock info unavailable"))
             ),
-            history_15d={"Close": [100.0, 101.5, 102.3]},
-            history_range={"Close": [95.0, 105.0]},
+            history={"Close": [100.0, 101.5, 102.3]},
             earnings_dates={"EPS Estimate": [1.1], "Reported EPS": [1.05]},
         )
 
@@ -161,3 +160,119 @@ class TestEarningsProvider:
         assert result[0].name == ""
         assert result[0].market_cap == 0
         assert result[0].value_last_15_days == [100.0, 101.5, 102.3]
+
+    def test__fetch_earnings_previous_earnings__reactions_from_single_history_request(
+        self, mock_yf_ticker_earnings, yf_stock_factory
+    ):
+        cutoff = (datetime.now() + timedelta(days=30)).date()
+        today = pd.Timestamp.today().normalize()
+        report_1 = today - pd.Timedelta(days=100)
+        report_2 = today - pd.Timedelta(days=40)
+        days = pd.date_range(end=today, periods=120, freq="D")
+        closes = [100.0] * len(days)
+        for i, day in enumerate(days):
+            if report_1 - pd.Timedelta(days=5) <= day < report_1 + pd.Timedelta(days=6):
+                closes[i] = 100.0 if day < report_1 else 110.0
+            if report_2 - pd.Timedelta(days=5) <= day < report_2 + pd.Timedelta(days=6):
+                closes[i] = 200.0 if day < report_2 else 150.0
+        stock = yf_stock_factory(
+            calendar={"Earnings Date": [(datetime.now() + timedelta(days=5)).date()]},
+            info={"shortName": "company 1", "marketCap": 10000000},
+            history=pd.DataFrame({"Close": closes}, index=days),
+            earnings_dates=pd.DataFrame(
+                {"EPS Estimate": [1.0, 2.0, 3.0], "Reported EPS": [1.5, 2.5, 3.5]},
+                index=pd.DatetimeIndex(
+                    [today + pd.Timedelta(days=5), report_2, report_1]
+                ),
+            ),
+        )
+        mock_yf_ticker_earnings.return_value = stock
+
+        provider = YahooEarningsProvider()
+        result = provider.fetch_earnings(["TCK1"], cutoff)
+
+        assert len(result) == 1
+        assert [p.expected_eps for p in result[0].previous_earnings] == [2.0, 3.0]
+        assert [p.price_diff for p in result[0].previous_earnings] == [-25.0, 10.0]
+        assert result[0].value_last_15_days == [100.0] * 15
+        stock.history.assert_called_once()
+
+    def test__fetch_earnings_no_history__empty_prices_and_zero_reactions(
+        self, mock_yf_ticker_earnings, yf_stock_factory
+    ):
+        cutoff = (datetime.now() + timedelta(days=30)).date()
+        stock = yf_stock_factory(
+            calendar={"Earnings Date": [(datetime.now() + timedelta(days=5)).date()]},
+            info={"shortName": "company 1", "marketCap": 10000000},
+            earnings_dates={"EPS Estimate": [1.1], "Reported EPS": [1.05]},
+        )
+        mock_yf_ticker_earnings.return_value = stock
+
+        provider = YahooEarningsProvider()
+        result = provider.fetch_earnings(["TCK1"], cutoff)
+
+        assert result[0].value_last_15_days == []
+        assert result[0].previous_earnings[0].price_diff == 0.0
+
+    def test__fetch_earnings_dates__only_tickers_inside_window_returned(
+        self, mock_yf_ticker_earnings, yf_stock_factory
+    ):
+        cutoff = (datetime.now() + timedelta(days=30)).date()
+        soon = (datetime.now() + timedelta(days=5)).date()
+        stock_1 = yf_stock_factory(calendar={"Earnings Date": [soon]})
+        stock_2 = yf_stock_factory(
+            calendar={"Earnings Date": [cutoff + timedelta(days=1)]}
+        )
+        stock_3 = MagicMock()
+        type(stock_3).calendar = PropertyMock(side_effect=Exception("unavailable"))
+
+        def ticker_side_effect(ticker):
+            mapping = {"TCK1": stock_1, "TCK2": stock_2, "TCK3": stock_3}
+            return mapping[ticker]
+
+        mock_yf_ticker_earnings.side_effect = ticker_side_effect
+        provider = YahooEarningsProvider()
+        result = provider.fetch_earnings_dates(["TCK1", "TCK2", "TCK3"], cutoff)
+
+        assert result == {"TCK1": soon}
+        stock_1.history.assert_not_called()
+        stock_1.get_earnings_dates.assert_not_called()
+
+    def test__fetch_earnings_after_dates__calendar_not_requested_again(
+        self, mock_yf_ticker_earnings, yf_stock_factory
+    ):
+        cutoff = (datetime.now() + timedelta(days=30)).date()
+        soon = (datetime.now() + timedelta(days=5)).date()
+        calendar = PropertyMock(
+            return_value={"Earnings Date": [soon], "Revenue Average": 123}
+        )
+        stock = yf_stock_factory(info={"shortName": "company 1"})
+        type(stock).calendar = calendar
+        mock_yf_ticker_earnings.return_value = stock
+
+        provider = YahooEarningsProvider()
+        provider.fetch_earnings_dates(["TCK1"], cutoff)
+        result = provider.fetch_earnings(["TCK1"], cutoff)
+
+        assert result[0].revenue == 123
+        assert calendar.call_count == 1
+
+    def test__fetch_earnings_second_report__history_resumes_from_stored_prices(
+        self, mock_yf_ticker_earnings, yf_stock_factory
+    ):
+        cutoff = (datetime.now() + timedelta(days=30)).date()
+        stock = yf_stock_factory(
+            calendar={"Earnings Date": [(datetime.now() + timedelta(days=5)).date()]},
+            history={"Close": [100.0, 101.5, 102.3]},
+        )
+        mock_yf_ticker_earnings.return_value = stock
+        YahooEarningsProvider().fetch_earnings(["TCK1"], cutoff)
+        YahooDataHub.clear()
+
+        result = YahooEarningsProvider().fetch_earnings(["TCK1"], cutoff)
+
+        assert result[0].value_last_15_days == [100.0, 101.5, 102.3]
+        assert stock.history.call_count == 2
+        assert stock.history.call_args.kwargs["start"] == date.today() - timedelta(
+            days=1
+        )
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock
 
+import pandas as pd
+
 from providers.yahoo.yahoo_insider_provider import YahooInsiderProvider
 
 
@@ -13,14 +15,18 @@ class TestYahooInsiderProvider:
         mock_stock_1 = MagicMock()
         mock_stock_2 = MagicMock()
         mock_stock_3 = MagicMock()
-        mock_stock_1.get_insider_transactions.return_value.to_dict.return_value = [
-            {"Value": 1000, "Text": "Purchase", "Start Date": "2023-01-01"},
-            {"Value": 0, "Text": "Gift", "Start Date": "2023-02-01"},
-        ]
-        mock_stock_2.get_insider_transactions.return_value.to_dict.return_value = [
-            {"Value": 500, "Text": "Sale", "Start Date": "2023-03-01"},
-        ]
-        mock_stock_3.get_insider_transactions.return_value.to_dict.return_value = []
+        mock_stock_1.get_insider_transactions.return_value = pd.DataFrame(
+            [
+                {"Value": 1000, "Text": "Purchase", "Start Date": "2023-01-01"},
+                {"Value": 0, "Text": "Gift", "Start Date": "2023-02-01"},
+            ]
+        )
+        mock_stock_2.get_insider_transactions.return_value = pd.DataFrame(
+            [
+                {"Value": 500, "Text": "Sale", "Start Date": "2023-03-01"},
+            ]
+        )
+        mock_stock_3.get_insider_transactions.return_value = pd.DataFrame()
 
         def ticker_side_effect(ticker):
             mapping = {
@@ -42,10 +48,12 @@ class TestYahooInsiderProvider:
     ):
         """Check if calling fetch_insider_trades skips insider trades with empty text field."""
         mock_stock = MagicMock()
-        mock_stock.get_insider_transactions.return_value.to_dict.return_value = [
-            {"Value": 1000, "Text": "", "Start Date": "2023-01-01"},
-            {"Value": 500, "Text": "Sale", "Start Date": "2023-03-01"},
-        ]
+        mock_stock.get_insider_transactions.return_value = pd.DataFrame(
+            [
+                {"Value": 1000, "Text": "", "Start Date": "2023-01-01"},
+                {"Value": 500, "Text": "Sale", "Start Date": "2023-03-01"},
+            ]
+        )
 
         mock_yf_ticker_insider.return_value = mock_stock
 
@@ -64,3 +72,73 @@ class TestYahooInsiderProvider:
         result = provider.fetch_insider_trades(["TCK1"])
 
         assert len(result) == 0
+
+    def test__fetch_insider_transactions__classified_in_one_table(
+        self, mock_yf_ticker_insider
+    ):
+        """Check that trades of all tickers are classified into one table with UTC dates."""
+        mock_yf_ticker_insider.return_value.get_insider_transactions.return_value = (
+            pd.DataFrame(
+                [
+                    {
+                        "Value": 1000,
+                        "Text": "Purchase at 10",
+                        "Start Date": "2023-01-01",
+                    },
+                    {"Value": 0, "Text": "Gift", "Start Date": "2023-02-01"},
+                    {"Value": 500, "Text": "Sale at 12", "Start Date": "2023-03-01"},
+                    {"Value": 700, "Text": None, "Start Date": "2023-03-01"},
+                ]
+            )
+        )
+
+        provider = YahooInsiderProvider()
+        result = provider.fetch_insider_transactions(["TCK1", "TCK2"])
+
+        assert list(result.columns) == ["ticker", "value", "type", "date"]
+        assert result["ticker"].tolist() == ["TCK1"] * 3 + ["TCK2"] * 3
+        assert result["type"].tolist()[:3] == ["buy", "gift", "sell"]
+        assert str(result["date"].dt.tz) == "UTC"
+
+    def test__fetch_insider_transactions__no_data_returns_empty_table(
+        self, mock_yf_ticker_insider
+    ):
+        """Check that an empty table with the provider columns is returned when no ticker has data."""
+        mock_yf_ticker_insider.side_effect = Exception("Yahoo API error")
+
+        provider = YahooInsiderProvider()
+        result = provider.fetch_insider_transactions(["TCK1"])
+
+        assert result.empty
+        assert list(result.columns) == ["ticker", "value", "type", "date"]
+
+    def test__iter_insider_transactions__one_table_per_ticker_with_trades(
+        self, mock_yf_ticker_insider
+    ):
+        """Check that iter_insider_transactions yields one table per ticker, and nothing for tickers without trades."""
+        trades = {
+            "TCK1": pd.DataFrame(
+                [{"Value": 1000, "Text": "Purchase", "Start Date": "2023-01-01"}]
+            ),
+            "TCK2": pd.DataFrame(
+                [
+                    {"Value": 500, "Text": "Sale", "Start Date": "2023-03-01"},
+                    {"Value": 700, "Text": "Sale", "Start Date": "2023-03-02"},
+                ]
+            ),
+            "TCK3": pd.DataFrame(),
+        }
+
+        def ticker_side_effect(ticker):
+            stock = MagicMock()
+            stock.get_insider_transactions.return_value = trades[ticker]
+            return stock
+
+        mock_yf_ticker_insider.side_effect = ticker_side_effect
+
+        tables = list(YahooInsiderProvider().iter_insider_transactions(list(trades)))
+
+        assert sorted((t["ticker"].iloc[0], len(t)) for t in tables) == [
+            ("TCK1", 1),
+            ("TCK2", 2),
+        ]
@@ -1,7 +1,22 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
+from models.news_article import NewsArticle
+from providers.yahoo.yahoo_data_hub import YahooDataHub
 from providers.yahoo.yahoo_news_provider import YahooNewsProvider
+from utils.circuit_breaker import CircuitBreaker
+from utils.rate_limiter import RateLimiter
+
+
+def make_article(title: str, pub_time: datetime) -> dict:
+    return {
+        "content": {
+            "title": title,
+            "summary": "this is summary",
+            "pubDate": pub_time.isoformat().replace("+00:00", "Z"),
+            "canonicalUrl": {"url": f"http://{title}.com"},
+        }
+    }
 
 
 class TestYahooNewsProvider:
@@ -154,3 +169,95 @@ class TestYahooNewsProvider:
         assert result[0].summary == ""
         assert result[0].pub_time == datetime(1970, 1, 1, 0, 0, tzinfo=timezone.utc)
         assert result[0].url == ""
+
+    def test__fetch_news_full_recent_page__requests_bigger_page(
+        self, mock_yf_ticker_news
+    ):
+        """Check that a full page of articles inside the window is followed by a bigger request."""
+        page_size = YahooNewsProvider.PAGE_SIZE
+        now = datetime.now(timezone.utc)
+
+        def get_news(count, tab):
+            return [
+                make_article(f"News {i}", now - timedelta(minutes=10 * i))
+                for i in range(count)
+            ]
+
+        mock_yf_ticker_news.return_value.get_news.side_effect = get_news
+
+        provider = YahooNewsProvider()
+        result = provider.fetch_news(["TCK1"], days_behind=1)
+
+        counts = [
+            c.args[0] for c in mock_yf_ticker_news.return_value.get_news.call_args_list
+        ]
+        assert counts[0] == page_size
+        assert all(
+            later > earlier for earlier, later in zip(counts, counts[1:], strict=False)
+        )
+        assert min(a.pub_time for a in result) < now - timedelta(days=1)
+
+    def test__fetch_news_page_past_cutoff__single_request(self, mock_yf_ticker_news):
+        """Check that no more articles are requested once a page reaches past the cutoff."""
+        now = datetime.now(timezone.utc)
+        mock_yf_ticker_news.return_value.get_news.return_value = [
+            make_article(f"News {i}", now - timedelta(hours=2 * i))
+            for i in range(YahooNewsProvider.PAGE_SIZE)
+        ]
+
+        provider = YahooNewsProvider()
+        provider.fetch_news(["TCK1"], days_behind=1)
+
+        mock_yf_ticker_news.return_value.get_news.assert_called_once()
+
+    def test__next_page_size__never_above_max_articles(self):
+        """Check that the next page is capped, and that a capped page stops pagination."""
+        now = datetime.now(timezone.utc)
+        articles = [NewsArticle("t", "s", now, "u", "TCK1")]
+        cutoff = now - timedelta(days=365)
+
+        assert YahooNewsProvider.next_page_size(articles, 500, 500, cutoff) == (
+            YahooNewsProvider.MAX_ARTICLES
+        )
+        assert (
+            YahooNewsProvider.next_page_size(
+                articles,
+                YahooNewsProvider.MAX_ARTICLES,
+                YahooNewsProvider.MAX_ARTICLES,
+                cutoff,
+            )
+            is None
+        )
+
+    def test__fetch_news_circuit_open__tickers_without_news(
+        self, mock_yf_ticker_news, fresh_circuit_breaker
+    ):
+        """Check that an open yahoo circuit leaves tickers without news instead of failing the section."""
+        for _ in range(CircuitBreaker.MIN_CALLS):
+            fresh_circuit_breaker.report_failure(RateLimiter.YAHOO_HOST)
+
+        result = YahooNewsProvider().fetch_news(["AAPL", "MSFT"], 1)
+
+        assert result == []
+        mock_yf_ticker_news.return_value.get_news.assert_not_called()
+
+    def test__fetch_news_known_failure__skipped_in_next_run(self, mock_yf_ticker_news):
+        """Check that news failing once are skipped in the next report, without raising."""
+        now = datetime.now(timezone.utc)
+        mock_yf_ticker_news.side_effect = lambda ticker: MagicMock(
+            get_news=MagicMock(
+                side_effect=(
+                    ValueError("no news")
+                    if ticker == "ZZZZ"
+                    else lambda count, tab: [make_article("AAPL news", now)]
+                )
+            )
+        )
+        YahooNewsProvider().fetch_news(["ZZZZ"], 1)
+        YahooDataHub.clear()
+        mock_yf_ticker_news.reset_mock()
+
+        result = YahooNewsProvider().fetch_news(["ZZZZ", "AAPL"], 1)
+
+        assert [article.ticker for article in result] == ["AAPL"]
+        assert [c.args[0] for c in mock_yf_ticker_news.call_args_list] == ["AAPL"]
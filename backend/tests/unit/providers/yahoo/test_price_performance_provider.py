@@ -1,33 +1,41 @@
-from unittest.mock import MagicMock
+from datetime import date, datetime, timedelta, timezone
 
+import pandas as pd
+
+from providers.yahoo.yahoo_data_hub import YahooDataHub
 from providers.yahoo.yahoo_price_performance_provider import (
     YahooPricePerformanceProvider,
 )
+from utils.clock import Clock
+from utils.stand_in_server import StandInServer
+
+
+def make_bulk_frame(closes: dict[str, list[float]]) -> pd.DataFrame:
+    """Build a frame shaped like yf.download(group_by="ticker") output, on days ending today."""
+    length = max(len(prices) for prices in closes.values())
+    index = pd.date_range(
+        end=pd.Timestamp.today().normalize(), periods=length, freq="D"
+    )
+    columns = pd.MultiIndex.from_product([list(closes), ["Open", "Close"]])
+    data = {}
+    for ticker, prices in closes.items():
+        padded = [None] * (length - len(prices)) + prices
+        data[(ticker, "Open")] = padded
+        data[(ticker, "Close")] = padded
+    return pd.DataFrame(data, index=index, columns=columns, dtype=float)
 
 
 class TestPricePerformanceProvider:
     def test_fetch_price_performance__multiple_tickers(
-        self, mock_yf_ticker_price_performance
+        self, mock_yf_download_price_performance
     ):
-        mock_stock_1 = MagicMock()
-        mock_stock_2 = MagicMock()
-        mock_stock_3 = MagicMock()
-
-        def make_mock_hist(prices):
-            m = MagicMock()
-            m.empty = False
-            m.__getitem__.return_value.round.return_value.tolist.return_value = prices
-            return m
-
-        mock_stock_1.history.return_value = make_mock_hist([31.123, 54.321, 67.899])
-        mock_stock_2.history.return_value = make_mock_hist([200.00, 198.13, 205.321])
-        mock_stock_3.history.return_value = make_mock_hist([50.321, 52.517, 54.037])
-
-        def ticker_side_effect(ticker):
-            mapping = {"TCK1": mock_stock_1, "TCK2": mock_stock_2, "TCK3": mock_stock_3}
-            return mapping[ticker]
-
-        mock_yf_ticker_price_performance.side_effect = ticker_side_effect
+        mock_yf_download_price_performance.return_value = make_bulk_frame(
+            {
+                "TCK1": [31.123, 54.321, 67.899],
+                "TCK2": [200.00, 198.13, 205.321],
+                "TCK3": [50.321, 52.517, 54.037],
+            }
+        )
 
         provider = YahooPricePerformanceProvider()
         result = provider.fetch_price_performance(
@@ -36,22 +44,61 @@ class TestPricePerformanceProvider:
 
         assert len(result) == 3
         assert result[0].ticker == "TCK1"
-        assert result[0].prices == [31.123, 54.321, 67.899]
+        assert result[0].prices == [31.12, 54.32, 67.9]
         assert result[1].ticker == "TCK2"
-        assert result[1].prices == [200.00, 198.13, 205.321]
+        assert result[1].prices == [200.00, 198.13, 205.32]
         assert result[2].ticker == "TCK3"
-        assert result[2].prices == [50.321, 52.517, 54.037]
+        assert result[2].prices == [50.32, 52.52, 54.04]
+        mock_yf_download_price_performance.assert_called_once()
 
-    def test_fetch_price_performance__empty_history_returns_empty_list(
-        self, mock_yf_ticker_price_performance
+    def test_fetch_price_performance__shorter_history_drops_missing_days(
+        self, mock_yf_download_price_performance
+    ):
+        mock_yf_download_price_performance.return_value = make_bulk_frame(
+            {"TCK1": [1.0, 2.0, 3.0], "TCK2": [5.0, 6.0]}
+        )
+
+        provider = YahooPricePerformanceProvider()
+        result = provider.fetch_price_performance(["TCK1", "TCK2"], days_behind=3)
+
+        assert result[1].prices == [5.0, 6.0]
+
+    def test_fetch_price_performance__tickers_are_downloaded_in_chunks(
+        self, mock_yf_download_price_performance, monkeypatch
+    ):
+        monkeypatch.setattr(YahooPricePerformanceProvider, "CHUNK_SIZE", 2)
+
+        def download_side_effect(tickers, **kwargs):
+            return make_bulk_frame({ticker: [1.0, 2.0] for ticker in tickers})
+
+        mock_yf_download_price_performance.side_effect = download_side_effect
+
+        provider = YahooPricePerformanceProvider()
+        result = provider.fetch_price_performance(
+            ["TCK1", "TCK2", "TCK3"], days_behind=10
+        )
+
+        assert [r.ticker for r in result] == ["TCK1", "TCK2", "TCK3"]
+        assert mock_yf_download_price_performance.call_count == 2
+
+    def test_fetch_price_performance__ticker_missing_from_response_is_skipped(
+        self, mock_yf_download_price_performance
     ):
-        mock_stock = MagicMock()
+        frame = make_bulk_frame({"TCK1": [1.0, 2.0], "TCK2": [3.0, 4.0]})
+        frame[("TCK2", "Close")] = None
+        mock_yf_download_price_performance.return_value = frame
+
+        provider = YahooPricePerformanceProvider()
+        result = provider.fetch_price_performance(
+            ["TCK1", "TCK2", "TCK3"], days_behind=10
+        )
 
-        mock_hist = MagicMock()
-        mock_hist.empty = True
-        mock_stock.history.return_value = mock_hist
+        assert [r.ticker for r in result] == ["TCK1"]
 
-        mock_yf_ticker_price_performance.return_value = mock_stock
+    def test_fetch_price_performance__empty_history_returns_empty_list(
+        self, mock_yf_download_price_performance
+    ):
+        mock_yf_download_price_performance.return_value = pd.DataFrame()
 
         provider = YahooPricePerformanceProvider()
         result = provider.fetch_price_performance(["TCK1"], days_behind=10)
@@ -59,11 +106,87 @@ class TestPricePerformanceProvider:
         assert result == []
 
     def test_fetch_price_performance__yahoo_exception_skips_ticker(
-        self, mock_yf_ticker_price_performance
+        self, mock_yf_download_price_performance
     ):
-        mock_yf_ticker_price_performance.side_effect = Exception("Yahoo API error")
+        mock_yf_download_price_performance.side_effect = Exception("Yahoo API error")
 
         provider = YahooPricePerformanceProvider()
         result = provider.fetch_price_performance(["TCK1"], days_behind=10)
 
         assert result == []
+
+    def test_fetch_price_performance__stored_days_are_not_downloaded_again(
+        self, mock_yf_download_price_performance
+    ):
+        """Check that a second run downloads only from the last stored days, all tickers in one request."""
+        mock_yf_download_price_performance.return_value = make_bulk_frame(
+            {"TCK1": [1.0, 2.0, 3.0], "TCK2": [4.0, 5.0, 6.0]}
+        )
+        YahooPricePerformanceProvider().fetch_price_performance(
+            ["TCK1", "TCK2"], days_behind=180
+        )
+        YahooDataHub.clear()
+
+        result = YahooPricePerformanceProvider().fetch_price_performance(
+            ["TCK1", "TCK2"], days_behind=180
+        )
+
+        yesterday = date.today() - timedelta(days=1)
+        assert mock_yf_download_price_performance.call_count == 2
+        second = mock_yf_download_price_performance.call_args_list[1]
+        assert second.args[0] == ["TCK1", "TCK2"]
+        assert second.kwargs["start"] == yesterday
+        assert [r.prices for r in result] == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+
+    def test_fetch_price_performance__adjusted_history_is_downloaded_again(
+        self, mock_yf_download_price_performance, isolated_response_cache
+    ):
+        """Check that a ticker whose past prices changed since they were stored is downloaded as a whole."""
+        isolated_response_cache.set_bypass(True)
+        mock_yf_download_price_performance.side_effect = [
+            make_bulk_frame({"TCK1": [10.0, 20.0, 30.0]}),
+            make_bulk_frame({"TCK1": [19.0, 29.0]}),
+            make_bulk_frame({"TCK1": [9.5, 19.0, 29.0]}),
+        ]
+        YahooPricePerformanceProvider().fetch_price_performance(
+            ["TCK1"], days_behind=30
+        )
+        YahooDataHub.clear()
+
+        result = YahooPricePerformanceProvider().fetch_price_performance(
+            ["TCK1"], days_behind=30
+        )
+
+        assert mock_yf_download_price_performance.call_count == 3
+        third = mock_yf_download_price_performance.call_args_list[2]
+        assert third.kwargs["start"] == date.today() + timedelta(days=1) - timedelta(
+            days=30
+        )
+        assert result[0].prices == [9.5, 19.0, 29.0]
+
+    def test_fetch_price_matrix__recording_replayed_on_later_day(
+        self,
+        mock_yf_download_price_performance,
+        fresh_cassette_player,
+        cassette,
+        isolated_price_store,
+    ):
+        """Check that a cassette replayed days after recording asks for the same date window it recorded."""
+        mock_yf_download_price_performance.return_value = make_bulk_frame(
+            {"TCK1": [10.0, 11.0, 12.0]}
+        )
+        isolated_price_store.set_bypass(True)
+        fresh_cassette_player.record(cassette)
+        recorded = YahooPricePerformanceProvider().fetch_price_matrix(["TCK1"], 5)
+        fresh_cassette_player.stop()
+        YahooDataHub.clear()
+        mock_yf_download_price_performance.reset_mock()
+        Clock.get_instance().pin(datetime.now(timezone.utc) + timedelta(days=3))
+
+        with StandInServer(cassette) as server:
+            fresh_cassette_player.replay(server.url, cassette.recorded_at)
+            replayed = YahooPricePerformanceProvider().fetch_price_matrix(["TCK1"], 5)
+
+        assert replayed.rows()[0].prices == recorded.rows()[0].prices == [10, 11, 12]
+        assert server.missed == 0
+        mock_yf_download_price_performance.assert_not_called()
@@ -0,0 +1,251 @@
+import threading
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from yfinance.exceptions import YFRateLimitError
+
+from providers.yahoo.yahoo_data_hub import YahooDataHub
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.enums.data_kind import DataKind
+from utils.negative_cache import KnownFailureError
+from utils.rate_limiter import RateLimiter
+from utils.stand_in_server import StandInServer
+
+
+class TestYahooDataHub:
+    """Test class for YahooDataHub."""
+
+    def test__get_info__ticker_is_requested_once(self, mock_yf_ticker_analyst):
+        """Check that repeated requests for the same ticker reuse the first response."""
+        mock_yf_ticker_analyst.return_value.info = {"shortName": "Acme"}
+        hub = YahooDataHub.get_instance()
+
+        first = hub.get_info("TCK1")
+        second = hub.get_info("TCK1")
+
+        assert first == second == {"shortName": "Acme"}
+        mock_yf_ticker_analyst.assert_called_once_with("TCK1")
+
+    def test__get_info__different_tickers_are_requested_separately(
+        self, mock_yf_ticker_analyst
+    ):
+        """Check that every ticker gets its own yf.Ticker object."""
+        hub = YahooDataHub.get_instance()
+
+        hub.get_info("TCK1")
+        hub.get_info("TCK2")
+
+        assert mock_yf_ticker_analyst.call_count == 2
+
+    def test__get_calendar__failure_is_not_memoized(self, mock_yf_ticker_earnings):
+        """Check that a request failed by a network error is repeated on the next call instead of being stored."""
+        stock = MagicMock()
+        type(stock).calendar = property(
+            MagicMock(
+                side_effect=[ConnectionError("API Error"), {"Revenue Average": 1}]
+            )
+        )
+        mock_yf_ticker_earnings.return_value = stock
+        hub = YahooDataHub.get_instance()
+
+        with pytest.raises(Exception, match="API Error"):
+            hub.get_calendar("TCK1")
+
+        assert hub.get_calendar("TCK1") == {"Revenue Average": 1}
+
+    def test__get_history__keyed_by_arguments(self, mock_yf_ticker_earnings):
+        """Check that history with different arguments is requested again, and same arguments aren't."""
+        stock = mock_yf_ticker_earnings.return_value
+        stock.history.return_value = pd.DataFrame({"Close": [1.0]})
+        hub = YahooDataHub.get_instance()
+
+        hub.get_history("TCK1", period="5d")
+        hub.get_history("TCK1", period="5d")
+        hub.get_history("TCK1", period="1mo")
+
+        assert stock.history.call_count == 2
+
+    def test__download__same_tickers_are_downloaded_once(
+        self, mock_yf_download_price_performance
+    ):
+        """Check that a bulk download is memoized for the same tickers and arguments."""
+        mock_yf_download_price_performance.return_value = pd.DataFrame()
+        hub = YahooDataHub.get_instance()
+
+        hub.download(["TCK1", "TCK2"], period="5d")
+        hub.download(["TCK1", "TCK2"], period="5d")
+
+        mock_yf_download_price_performance.assert_called_once()
+
+    def test__get_info__concurrent_callers_share_one_request(
+        self, mock_yf_ticker_analyst
+    ):
+        """Check that callers asking for the same data at the same time wait for a single request."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_info():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return {"shortName": "Acme"}
+
+        type(mock_yf_ticker_analyst.return_value).info = property(lambda _: slow_info())
+        hub = YahooDataHub.get_instance()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(hub.get_info("TCK1")))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        started.wait(timeout=5)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == [{"shortName": "Acme"}] * 3
+
+    def test__clear__new_instance_requests_again(self, mock_yf_ticker_analyst):
+        """Check that clearing the hub drops everything it has stored."""
+        YahooDataHub.get_instance().get_info("TCK1")
+        YahooDataHub.clear()
+        YahooDataHub.get_instance().get_info("TCK1")
+
+        assert mock_yf_ticker_analyst.call_count == 2
+
+    def test__get_info__later_report_reads_response_cache(self, mock_yf_ticker_analyst):
+        """Check that a new hub finds responses stored by an earlier report without calling the API."""
+        mock_yf_ticker_analyst.return_value.info = {"shortName": "Acme"}
+        YahooDataHub.get_instance().get_info("TCK1")
+        YahooDataHub.clear()
+
+        result = YahooDataHub.get_instance().get_info("TCK1")
+
+        assert result == {"shortName": "Acme"}
+        mock_yf_ticker_analyst.assert_called_once_with("TCK1")
+
+    def test__get_info__bypassed_cache_calls_api_again(
+        self, mock_yf_ticker_analyst, isolated_response_cache
+    ):
+        """Check that a bypassed ResponseCache makes a new hub request the data again."""
+        mock_yf_ticker_analyst.return_value.info = {"shortName": "Acme"}
+        YahooDataHub.get_instance().get_info("TCK1")
+        YahooDataHub.clear()
+        isolated_response_cache.set_bypass(True)
+
+        YahooDataHub.get_instance().get_info("TCK1")
+
+        assert mock_yf_ticker_analyst.call_count == 2
+
+    def test__get_news__every_count_uses_new_ticker_object(self, mock_yf_ticker_news):
+        """Check that a bigger news page isn't answered from news kept on an earlier yf.Ticker."""
+        hub = YahooDataHub.get_instance()
+
+        hub.get_news("TCK1", 25, "all")
+        hub.get_news("TCK1", 50, "all")
+        hub.get_news("TCK1", 50, "all")
+
+        assert mock_yf_ticker_news.call_count == 2
+
+    def test__get_info__rate_limit_error_lowers_yahoo_rate(
+        self, mock_yf_ticker_analyst, fresh_rate_limiter
+    ):
+        """Check that a rate limit error from yfinance slows down later yahoo requests."""
+        type(mock_yf_ticker_analyst.return_value).info = property(
+            MagicMock(side_effect=YFRateLimitError())
+        )
+        rate = fresh_rate_limiter.rate(RateLimiter.YAHOO_HOST)
+
+        with pytest.raises(YFRateLimitError):
+            YahooDataHub.get_instance().get_info("TCK1")
+
+        assert fresh_rate_limiter.rate(RateLimiter.YAHOO_HOST) == rate / 2
+
+    def test__get_info__recorded_response_is_replayed_without_yahoo(
+        self, mock_yf_ticker_analyst, fresh_cassette_player, cassette
+    ):
+        """Check that a recorded report can be replayed from the stand-in server, offline."""
+        mock_yf_ticker_analyst.return_value.info = {"shortName": "Acme"}
+        fresh_cassette_player.record(cassette)
+        YahooDataHub.get_instance().get_info("TCK1")
+        fresh_cassette_player.stop()
+        YahooDataHub.clear()
+        mock_yf_ticker_analyst.reset_mock()
+
+        with StandInServer(cassette) as server:
+            fresh_cassette_player.replay(server.url)
+            info = YahooDataHub.get_instance().get_info("TCK1")
+
+        assert info == {"shortName": "Acme"}
+        mock_yf_ticker_analyst.assert_not_called()
+
+    def test__get_calendar__data_failure_is_skipped_in_later_reports(
+        self, mock_yf_ticker_earnings, isolated_negative_cache
+    ):
+        """Check that a ticker whose data failed isn't requested again while it is in the NegativeCache."""
+        calendar = MagicMock(side_effect=KeyError("no calendar"))
+        type(mock_yf_ticker_earnings.return_value).calendar = property(calendar)
+        with pytest.raises(KeyError):
+            YahooDataHub.get_instance().get_calendar("TCK1")
+        YahooDataHub.clear()
+
+        with pytest.raises(KnownFailureError):
+            YahooDataHub.get_instance().get_calendar("TCK1")
+
+        assert calendar.call_count == 1
+        assert isolated_negative_cache.skipped == 1
+
+    def test__get_insider_transactions__empty_response_is_a_failure(
+        self, mock_yf_ticker_earnings, isolated_negative_cache, isolated_response_cache
+    ):
+        """Check that an empty response yfinance returned instead of an error goes to the NegativeCache, not the ResponseCache."""
+        stock = mock_yf_ticker_earnings.return_value
+        stock.get_insider_transactions.return_value = pd.DataFrame()
+        stock.calendar = {}
+
+        assert YahooDataHub.get_instance().get_insider_transactions("TCK1").empty
+        assert YahooDataHub.get_instance().get_calendar("TCK1") == {}
+
+        assert isolated_negative_cache.is_known_failure(
+            DataKind.INSIDER_TRANSACTIONS, "TCK1"
+        )
+        assert isolated_negative_cache.is_known_failure(DataKind.CALENDAR, "TCK1")
+        assert isolated_response_cache.get(DataKind.CALENDAR, "('TCK1',)") == (
+            False,
+            None,
+        )
+
+    def test__get_calendar__success_forgets_failure(
+        self, mock_yf_ticker_earnings, isolated_negative_cache
+    ):
+        """Check that data loading again after its negative cache time is no longer skipped."""
+        isolated_negative_cache.record_failure(DataKind.CALENDAR, "TCK1")
+        isolated_negative_cache.set_bypass(True)
+        mock_yf_ticker_earnings.return_value.calendar = {"Revenue Average": 1}
+        YahooDataHub.get_instance().get_calendar("TCK1")
+        isolated_negative_cache.set_bypass(False)
+
+        assert not isolated_negative_cache.is_known_failure(DataKind.CALENDAR, "TCK1")
+
+    def test__get_info__open_circuit_stops_requests(
+        self, mock_yf_ticker_analyst, fresh_circuit_breaker
+    ):
+        """Check that after many network errors the hub stops calling yahoo and fails right away."""
+        info = MagicMock(side_effect=ConnectionError("down"))
+        type(mock_yf_ticker_analyst.return_value).info = property(info)
+        hub = YahooDataHub.get_instance()
+
+        errors = []
+        for i in range(CircuitBreaker.MIN_CALLS + 5):
+            try:
+                hub.get_info(f"TCK{i}")
+            except Exception as e:
+                errors.append(type(e))
+
+        assert info.call_count == CircuitBreaker.MIN_CALLS
+        assert errors[-1] is CircuitOpenError
+        assert fresh_circuit_breaker.is_open(RateLimiter.YAHOO_HOST)
@@ -1,3 +1,6 @@
+import json
+import threading
+import time
 from datetime import datetime, timezone
 
 import pytest
@@ -5,15 +8,20 @@ import requests
 
 from api.ai_service import AiService
 from models.news_article import NewsArticle
+from utils.cassette import Cassette
+from utils.pooled_session import PooledSession
+from utils.rate_limiter import RateLimiter
+from utils.stand_in_server import StandInServer
 
 
 class TestAiService:
     """Test class for AiService."""
 
     @staticmethod
-    def _create_service(mocker) -> AiService:
+    def _create_service(mocker, **environment) -> AiService:
         AiService.clear()
-        mocker.patch("api.ai_service.os.getenv", return_value="test-api-key")
+        environment.setdefault("GROQ_API_KEY", "test-api-key")
+        mocker.patch("api.ai_service.os.getenv", side_effect=environment.get)
         return AiService()
 
     def test__init__without_api_key__raises_runtime_error(self, mocker):
@@ -24,6 +32,36 @@ class TestAiService:
         with pytest.raises(RuntimeError, match="GROQ_API_KEY"):
             AiService()
 
+    def test__init__base_url_points_requests_at_other_server(self, mocker):
+        """Check that GROQ_BASE_URL replaces GROQ, without needing an API key for it."""
+        service = self._create_service(
+            mocker, GROQ_API_KEY=None, GROQ_BASE_URL="http://127.0.0.1:8000/v1/"
+        )
+        post_mock = mocker.patch(
+            "utils.pooled_session.PooledSession.post",
+            return_value=self._groq_response(mocker, "[]"),
+        )
+
+        service._AiService__call_groq("prompt")
+
+        assert service.api_url == "http://127.0.0.1:8000/v1/chat/completions"
+        assert post_mock.call_args.args[0] == service.api_url
+
+    def test__init__timeouts_read_from_environment(self, mocker):
+        """Check that connect and read timeouts can be configured, and invalid values fall back to defaults."""
+        service = self._create_service(
+            mocker, GROQ_CONNECT_TIMEOUT="1.5", GROQ_READ_TIMEOUT="soon"
+        )
+
+        assert service.timeout == (1.5, AiService.READ_TIMEOUT)
+
+    @staticmethod
+    def _groq_response(mocker, content: str):
+        response = mocker.MagicMock()
+        response.json.return_value = {"choices": [{"message": {"content": content}}]}
+        response.headers = {}
+        return response
+
     def test__filter_news__small_input_returns_same_list(self, mocker):
         """Check that filter_news returns input unchanged when news count is <= top_k."""
         service = self._create_service(mocker)
@@ -107,8 +145,176 @@ class TestAiService:
         assert len(result) == 1
         assert result[0].url == "https://new.com"
 
-    def test__call_groq__request_fails_once_then_succeeds(self, mocker):
-        """Check that call_groq retries after request error and returns content on next success."""
+    @staticmethod
+    def _prompt_articles(prompt: str) -> list[tuple[int, str]]:
+        """Return IDs and titles of the articles listed in a prompt."""
+        lines = prompt.split("Articles:\n", 1)[1].splitlines()
+        return [(int(line.split("|")[0]), line.split("|", 3)[3]) for line in lines]
+
+    @staticmethod
+    def _numbered_news(numbers) -> list[NewsArticle]:
+        return [
+            NewsArticle(
+                f"Title {i}",
+                f"Summary {i}",
+                datetime(2026, 4, 1, 10, 0, tzinfo=timezone.utc),
+                f"https://news{i}.com",
+                f"TCK{i}",
+            )
+            for i in numbers
+        ]
+
+    @classmethod
+    def _rank_by_number(cls, prompt: str) -> str:
+        """Fake model that rates lower numbered articles higher, and picks the 10 highest rated ones."""
+        rated = [
+            {"id": article_id, "impact": 100 - int(title.split()[1]) / 10}
+            for article_id, title in cls._prompt_articles(prompt)
+        ]
+        rated.sort(key=lambda item: item["impact"], reverse=True)
+        return json.dumps(rated[:10])
+
+    def test__filter_news__many_batches_reduced_in_parallel_rounds(self, mocker):
+        """Check that batches fit the token budget, are ranked concurrently, and finalists are reduced in rounds."""
+        service = self._create_service(mocker)
+        mocker.patch.object(AiService, "TOKEN_BUDGET", 600)
+        lock = threading.Lock()
+        state = {"running": 0, "most_running": 0, "prompts": []}
+
+        def rank(prompt):
+            with lock:
+                state["running"] += 1
+                state["most_running"] = max(state["most_running"], state["running"])
+                state["prompts"].append(prompt)
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+            return self._rank_by_number(prompt)
+
+        mocker.patch.object(service, "_AiService__call_groq", side_effect=rank)
+
+        result = service.filter_news(self._numbered_news(range(260)), top_k=10)
+
+        assert all(len(prompt) / 4 <= 600 for prompt in state["prompts"])
+        assert len(state["prompts"]) > 2
+        assert state["most_running"] > 1
+        assert [article.url for article in result] == [
+            f"https://news{i}.com" for i in range(10)
+        ]
+
+    def test__filter_news__long_titles_packed_into_more_batches(self, mocker):
+        """Check that batches are packed by prompt size, not by a fixed number of articles."""
+        service = self._create_service(mocker)
+        call_mock = mocker.patch.object(
+            service, "_AiService__call_groq", side_effect=self._rank_by_number
+        )
+        short = self._numbered_news(range(100))
+        long = [
+            NewsArticle(
+                article.title + " with a much longer headline" * 8,
+                article.summary,
+                article.pub_time,
+                article.url + "/long",
+                article.ticker,
+            )
+            for article in short
+        ]
+
+        service.filter_news(short, top_k=10)
+        short_calls = call_mock.call_count
+        AiService.clear()
+        service = self._create_service(mocker)
+        call_mock = mocker.patch.object(
+            service, "_AiService__call_groq", side_effect=self._rank_by_number
+        )
+        service.filter_news(long, top_k=10)
+
+        assert short_calls == 1
+        assert call_mock.call_count > 1
+
+    def test__filter_news__same_news_ranked_again_without_ai_calls(self, mocker):
+        """Check that ranking the same news again is answered from the cache."""
+        service = self._create_service(mocker)
+        call_mock = mocker.patch.object(
+            service, "_AiService__call_groq", side_effect=self._rank_by_number
+        )
+
+        first = service.filter_news(self._numbered_news(range(30)), top_k=10)
+        second = service.filter_news(self._numbered_news(range(29, -1, -1)), top_k=10)
+
+        assert call_mock.call_count == 1
+        assert [a.url for a in second] == [a.url for a in first]
+
+    def test__filter_news__overlapping_batches_reuse_article_scores(self, mocker):
+        """Check that first round batches of already scored articles aren't sent to the model again."""
+        service = self._create_service(mocker)
+        mocker.patch.object(AiService, "TOKEN_BUDGET", 600)
+        call_mock = mocker.patch.object(
+            service, "_AiService__call_groq", side_effect=self._rank_by_number
+        )
+        service.filter_news(self._numbered_news(range(260)), top_k=10)
+        first_run_calls = call_mock.call_count
+        call_mock.reset_mock()
+
+        result = service.filter_news(self._numbered_news([999, *range(260)]), top_k=10)
+
+        first_round = [
+            call for call in call_mock.call_args_list if "Title 999" in call.args[0]
+        ]
+        assert len(first_round) == 1
+        assert call_mock.call_count < first_run_calls
+        assert [a.url for a in result] == [f"https://news{i}.com" for i in range(10)]
+
+    def test__call_groq__used_up_tokens_delay_next_request(self, mocker):
+        """Check that after GROQ says its tokens are used up, the next request waits for their reset."""
+        service = self._create_service(mocker)
+        response = mocker.MagicMock()
+        response.json.return_value = {"choices": [{"message": {"content": "[]"}}]}
+        response.headers = {
+            "x-ratelimit-remaining-requests": "1000",
+            "x-ratelimit-reset-requests": "1m26.4s",
+            "x-ratelimit-remaining-tokens": "12",
+            "x-ratelimit-reset-tokens": "9.5s",
+        }
+        mocker.patch("utils.pooled_session.PooledSession.post", return_value=response)
+        sleep_mock = mocker.patch("utils.rate_limiter.time.sleep")
+
+        service._AiService__call_groq("a long prompt" * 10)
+        service._AiService__call_groq("a long prompt" * 10)
+
+        assert sleep_mock.call_args.args[0] == pytest.approx(9.5, abs=0.5)
+
+    def test__filter_news__call_failure_ranks_by_keywords(self, mocker):
+        """Check that the fallback prefers an article with important keywords over a newer plain one."""
+        service = self._create_service(mocker)
+        news = [
+            NewsArticle(
+                "Newer picnic photos",
+                "Summary",
+                datetime(2026, 4, 1, 11, 0, tzinfo=timezone.utc),
+                "https://new.com",
+                "TCK1",
+            ),
+            NewsArticle(
+                "Company agrees to merger",
+                "Summary",
+                datetime(2026, 4, 1, 9, 0, tzinfo=timezone.utc),
+                "https://merger.com",
+                "TCK2",
+            ),
+        ]
+        mocker.patch.object(
+            service, "_AiService__call_groq", side_effect=Exception("GROQ unavailable")
+        )
+
+        result = service.filter_news(news, top_k=1)
+
+        assert [article.url for article in result] == ["https://merger.com"]
+
+    def test__call_groq__request_fails_once_then_succeeds(
+        self, mocker, fresh_rate_limiter
+    ):
+        """Check that call_groq retries after request error, waiting for the lowered rate limit."""
         service = self._create_service(mocker)
 
         successful_response = mocker.MagicMock()
@@ -118,51 +324,78 @@ class TestAiService:
         }
 
         post_mock = mocker.patch(
-            "api.ai_service.requests.post",
+            "utils.pooled_session.PooledSession.post",
             side_effect=[requests.RequestException("timeout"), successful_response],
         )
-        sleep_mock = mocker.patch("api.ai_service.time.sleep")
+        sleep_mock = mocker.patch("utils.rate_limiter.time.sleep")
 
         result = service._AiService__call_groq("prompt")
 
         assert result == "[]"
         assert post_mock.call_count == 2
-        sleep_mock.assert_called_once_with(2)
+        sleep_mock.assert_called_once()
+        assert fresh_rate_limiter.rate(RateLimiter.GROQ_HOST) < 0.5
 
     def test__call_groq__all_retries_fail_raises(self, mocker):
         """Check that call_groq raises after all retry attempts fail."""
         service = self._create_service(mocker)
 
-        mocker.patch(
-            "api.ai_service.requests.post",
+        post_mock = mocker.patch(
+            "utils.pooled_session.PooledSession.post",
             side_effect=requests.RequestException("still failing"),
         )
-        sleep_mock = mocker.patch("api.ai_service.time.sleep")
+        sleep_mock = mocker.patch("utils.rate_limiter.time.sleep")
 
         with pytest.raises(requests.RequestException):
             service._AiService__call_groq("prompt")
 
+        assert post_mock.call_count == AiService.MAX_RETRIES
         assert sleep_mock.call_count == 2
 
-    def test__parse_response__skips_invalid_items_and_restores_summary(self, mocker):
-        """Check that parse_response keeps valid known URLs and restores summary from map."""
+    def test__call_groq__too_many_requests_waits_for_retry_after(self, mocker):
+        """Check that a 429 answer makes the retry wait at least as long as Retry-After says."""
         service = self._create_service(mocker)
-        response = """
-[
-  {"pubTime":"2026-04-01T10:00:00Z","title":"Valid","url":"https://ok.com","ticker":"TCK1"},
-  {"pubTime":"2026-04-01T11:00:00Z","title":"Unknown","url":"https://missing.com","ticker":"TCK2"},
-  "not-a-dict"
-]
-"""
-        summary_map = {"https://ok.com": "Restored summary"}
 
-        result = service._AiService__parse_response(response, summary_map)
+        throttled = mocker.MagicMock()
+        throttled.status_code = 429
+        throttled.headers = {"retry-after": "7"}
+        throttled.raise_for_status.side_effect = requests.HTTPError(
+            "429", response=throttled
+        )
+        successful_response = mocker.MagicMock()
+        successful_response.json.return_value = {
+            "choices": [{"message": {"content": "[]"}}]
+        }
+        mocker.patch(
+            "utils.pooled_session.PooledSession.post",
+            side_effect=[throttled, successful_response],
+        )
+        sleep_mock = mocker.patch("utils.rate_limiter.time.sleep")
 
-        assert len(result) == 1
-        assert result[0].url == "https://ok.com"
-        assert result[0].summary == "Restored summary"
-        assert result[0].title == "Valid"
-        assert result[0].ticker == "TCK1"
+        assert service._AiService__call_groq("prompt") == "[]"
+        assert sleep_mock.call_args.args[0] == pytest.approx(7, abs=0.5)
+
+    def test__parse_response__maps_ids_back_to_articles(self, mocker):
+        """Check that parse_response returns the original articles of picked IDs, skipping unknown and repeated ones."""
+        service = self._create_service(mocker)
+        news = self._numbered_news(range(3))
+        response = '[{"id": 2, "impact": 90}, {"id": 7}, "not-an-id", 0, {"id": "2"}]'
+
+        result = service._AiService__parse_response(response, news)
+
+        assert result == [news[2], news[0]]
+
+    def test__build_prompt__lists_articles_compactly_by_id(self, mocker):
+        """Check that the prompt lists every article on its own line, without URLs or full timestamps."""
+        service = self._create_service(mocker)
+        news = self._numbered_news(range(2))
+
+        prompt = service._AiService__build_prompt(news, top_k=1)
+
+        assert prompt.endswith(
+            "Articles:\n0|TCK0|2026-04-01|Title 0\n1|TCK1|2026-04-01|Title 1"
+        )
+        assert "https://" not in prompt
 
     def test__extract_json__extracts_array_from_wrapped_text(self, mocker):
         """Check that extract_json can recover JSON array from non-JSON wrapper text."""
@@ -173,3 +406,43 @@ class TestAiService:
 
         assert isinstance(result, list)
         assert result[0]["url"] == "https://ok.com"
+
+    def test__call_groq__replays_recorded_response_without_api_key(
+        self, mocker, fresh_cassette_player, cassette
+    ):
+        """Check that a replayed GROQ call goes to the stand-in server and needs no API key."""
+        AiService.clear()
+        mocker.patch("api.ai_service.os.getenv", return_value=None)
+        payload_of = mocker.spy(PooledSession, "post")
+        with StandInServer(cassette) as server:
+            fresh_cassette_player.replay(server.url)
+            service = AiService()
+            cassette.put(
+                Cassette.HTTP_CHANNEL,
+                Cassette.http_key(
+                    "POST",
+                    AiService.GROQ_API_URL,
+                    None,
+                    {
+                        "model": AiService.MODEL,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": "You are a financial news ranking AI. Output only valid JSON.",
+                            },
+                            {"role": "user", "content": "prompt"},
+                        ],
+                        "temperature": 0,
+                    },
+                ),
+                (
+                    200,
+                    "application/json",
+                    b'{"choices": [{"message": {"content": "[]"}}]}',
+                ),
+            )
+
+            result = service._AiService__call_groq("prompt")
+
+        assert result == "[]"
+        assert payload_of.call_args.args[1].startswith(server.url)
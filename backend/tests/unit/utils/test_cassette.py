@@ -0,0 +1,62 @@
+import pandas as pd
+
+from utils.cassette import Cassette
+
+
+class TestCassette:
+    """Test class for Cassette."""
+
+    def test__get__recorded_response_is_returned(self, cassette):
+        """Check that a recorded response is found and equal to what was recorded."""
+        frame = pd.DataFrame({"Close": [1.0, 2.0]})
+
+        cassette.put("history", "('TCK1',)", frame)
+        found, value = cassette.get("history", "('TCK1',)")
+
+        assert found
+        pd.testing.assert_frame_equal(value, frame)
+        assert len(cassette) == 1
+
+    def test__get__channels_are_separate(self, cassette):
+        """Check that the same key in another channel isn't found."""
+        cassette.put("info", "('TCK1',)", {"shortName": "Acme"})
+
+        assert cassette.get("calendar", "('TCK1',)") == (False, None)
+
+    def test__get__recording_survives_reopening(self, tmp_path):
+        """Check that responses are kept on disk, so a later run can replay them."""
+        path = tmp_path / "cassette.sqlite3"
+        first = Cassette(path)
+        first.put("info", "('TCK1',)", {"shortName": "Acme"})
+        first.close()
+
+        second = Cassette(path)
+        found, value = second.get("info", "('TCK1',)")
+        second.close()
+
+        assert found
+        assert value == {"shortName": "Acme"}
+
+    def test__http_key__ignores_host_order_and_crumb(self):
+        """Check that a request to the real API and to the stand-in server share one key."""
+        recorded = Cassette.http_key(
+            "get",
+            "https://query2.finance.yahoo.com/v8/finance/chart/TCK1",
+            {"period1": 1, "interval": "1d", "crumb": "abc"},
+        )
+        replayed = Cassette.http_key(
+            "GET",
+            "/v8/finance/chart/TCK1",
+            {"interval": "1d", "period1": "1"},
+        )
+
+        assert recorded == replayed
+
+    def test__http_key__body_is_part_of_the_key(self):
+        """Check that requests differing only in their JSON body get different keys."""
+        first = Cassette.http_key("POST", "/chat", None, {"prompt": "a", "n": 1})
+        same = Cassette.http_key("POST", "/chat", None, {"n": 1, "prompt": "a"})
+        other = Cassette.http_key("POST", "/chat", None, {"prompt": "b", "n": 1})
+
+        assert first == same
+        assert first != other
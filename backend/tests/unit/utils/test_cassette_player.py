@@ -0,0 +1,128 @@
+from datetime import date, datetime, timezone
+
+import pandas as pd
+import pytest
+
+from utils.cassette import Cassette
+from utils.enums.cassette_mode import CassetteMode
+from utils.enums.data_kind import DataKind
+from utils.negative_cache import NegativeCache
+from utils.news_index import NewsIndex
+from utils.price_store import PriceStore
+from utils.rate_limiter import RateLimiter
+from utils.response_cache import ResponseCache
+from utils.stand_in_server import StandInServer
+
+
+class TestCassettePlayer:
+    """Test class for CassettePlayer."""
+
+    def test__store__only_records_when_recording(self, fresh_cassette_player, cassette):
+        """Check that responses are stored in the cassette only in record mode."""
+        fresh_cassette_player.store("info", "('TCK1',)", {"a": 1})
+        assert len(cassette) == 0
+
+        fresh_cassette_player.record(cassette)
+        fresh_cassette_player.store("info", "('TCK1',)", {"a": 1})
+        fresh_cassette_player.store_http(
+            "GET", "https://x.com/path", {"q": 1}, None, 200, "text/plain", b"body"
+        )
+
+        assert cassette.get("info", "('TCK1',)") == (True, {"a": 1})
+        assert cassette.get(
+            Cassette.HTTP_CHANNEL, Cassette.http_key("GET", "/path", {"q": 1})
+        ) == (True, (200, "text/plain", b"body"))
+
+    def test__replay_url__points_to_server_only_when_replaying(
+        self, fresh_cassette_player
+    ):
+        """Check that URLs keep their path and query, but get the stand-in server as host."""
+        url = "https://api.groq.com/openai/v1/chat/completions?x=1"
+        assert fresh_cassette_player.replay_url(url) == url
+
+        fresh_cassette_player.replay("http://127.0.0.1:8000/")
+
+        assert (
+            fresh_cassette_player.replay_url(url)
+            == "http://127.0.0.1:8000/openai/v1/chat/completions?x=1"
+        )
+
+    def test__replay__bypasses_rate_limiter_until_stopped(
+        self, fresh_cassette_player, fresh_rate_limiter
+    ):
+        """Check that replayed requests aren't paced, and pacing comes back after stop."""
+        fresh_cassette_player.replay("http://127.0.0.1:8000")
+        assert fresh_cassette_player.mode is CassetteMode.REPLAY
+        assert fresh_rate_limiter.bypass
+
+        fresh_cassette_player.stop()
+
+        assert fresh_cassette_player.mode is CassetteMode.OFF
+        assert not RateLimiter.get_instance().bypass
+
+    def test__fetch__recorded_and_missing_responses(
+        self, fresh_cassette_player, cassette
+    ):
+        """Check that a recorded response is fetched from the server, and a missing one raises."""
+        cassette.put("calendar", "('TCK1',)", {"Earnings Date": []})
+
+        with StandInServer(cassette) as server:
+            fresh_cassette_player.replay(server.url)
+            value = fresh_cassette_player.fetch("calendar", "('TCK1',)")
+            with pytest.raises(LookupError):
+                fresh_cassette_player.fetch("calendar", "('TCK2',)")
+
+        assert value == {"Earnings Date": []}
+
+    def test__replay__clock_pinned_to_recording_until_stopped(
+        self, fresh_cassette_player, fresh_clock, cassette
+    ):
+        """Check that recording stores its moment, and replaying it pins the clock there until replay stops."""
+        recorded_at = datetime(2026, 3, 2, 15, 30, tzinfo=timezone.utc)
+        fresh_clock.pin(recorded_at)
+        fresh_cassette_player.record(cassette)
+        fresh_cassette_player.stop()
+        fresh_clock.unpin()
+
+        fresh_cassette_player.replay("http://127.0.0.1:8000", cassette.recorded_at)
+        during = fresh_clock.now(timezone.utc)
+        fresh_cassette_player.stop()
+
+        assert cassette.recorded_at == recorded_at
+        assert during == recorded_at
+        assert fresh_clock.pinned_at is None
+
+    def test__replay__real_stores_unchanged(
+        self,
+        fresh_cassette_player,
+        isolated_response_cache,
+        isolated_price_store,
+        isolated_negative_cache,
+        isolated_news_index,
+        create_news_article,
+    ):
+        """Check that a replayed run writes to temporary stores, and the real ones are back untouched after stop."""
+        fresh_cassette_player.replay("http://127.0.0.1:8000")
+        ResponseCache.get_instance().put(DataKind.AI_RANKING, "key", "ranking")
+        NegativeCache.get_instance().record_failure(DataKind.INFO, "TCK1")
+        NewsIndex.get_instance().record([create_news_article])
+        PriceStore.get_instance().merge(
+            "TCK1",
+            pd.Series([1.0, 2.0], index=pd.to_datetime(["2026-03-02", "2026-03-03"])),
+            date(2026, 3, 2),
+            date(2026, 3, 4),
+        )
+        temporary_path = ResponseCache.get_instance().path
+        fresh_cassette_player.stop()
+
+        assert ResponseCache.get_instance() is isolated_response_cache
+        assert PriceStore.get_instance() is isolated_price_store
+        assert NegativeCache.get_instance() is isolated_negative_cache
+        assert NewsIndex.get_instance() is isolated_news_index
+        assert isolated_response_cache.get(DataKind.AI_RANKING, "key") == (False, None)
+        assert not isolated_negative_cache.is_known_failure(DataKind.INFO, "TCK1")
+        assert not isolated_news_index.is_reported(create_news_article)
+        assert isolated_price_store.missing(
+            ["TCK1"], date(2026, 3, 2), date(2026, 3, 4)
+        ) == {(date(2026, 3, 2), date(2026, 3, 4)): ["TCK1"]}
+        assert not temporary_path.exists()
@@ -0,0 +1,73 @@
+import pytest
+
+from utils.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Test class for CircuitBreaker."""
+
+    @pytest.fixture(autouse=True)
+    def fake_clock(self, monkeypatch):
+        """Replace monotonic time, so cooldowns pass without waiting."""
+        clock = {"now": 1000.0}
+        monkeypatch.setattr(
+            "utils.circuit_breaker.time.monotonic", lambda: clock["now"]
+        )
+        return clock
+
+    def test__report_failure__few_calls_never_open(self):
+        """Check that failures below the minimum number of calls don't open the circuit."""
+        breaker = CircuitBreaker()
+        for _ in range(CircuitBreaker.MIN_CALLS - 1):
+            breaker.report_failure("example.com")
+
+        assert breaker.allow("example.com")
+
+    def test__report_failure__low_failure_share_stays_closed(self):
+        """Check that occasional failures among successes don't open the circuit."""
+        breaker = CircuitBreaker()
+        for i in range(CircuitBreaker.WINDOW_SIZE):
+            if i % 4 == 0:
+                breaker.report_failure("example.com")
+            else:
+                breaker.report_success("example.com")
+
+        assert not breaker.is_open("example.com")
+
+    def test__report_failure__high_failure_share_opens_only_that_host(self):
+        """Check that a host with mostly failures is stopped, while other hosts are not."""
+        breaker = CircuitBreaker()
+        for _ in range(CircuitBreaker.MIN_CALLS):
+            breaker.report_failure("example.com")
+
+        assert not breaker.allow("example.com")
+        assert breaker.allow("other.com")
+
+    def test__allow__single_trial_after_cooldown_closes_on_success(self, fake_clock):
+        """Check that after the cooldown one trial is let through, and its success closes the circuit."""
+        breaker = CircuitBreaker()
+        for _ in range(CircuitBreaker.MIN_CALLS):
+            breaker.report_failure("example.com")
+        fake_clock["now"] += CircuitBreaker.COOLDOWN
+
+        assert breaker.allow("example.com")
+        assert not breaker.allow("example.com")
+        breaker.report_success("example.com")
+
+        assert not breaker.is_open("example.com")
+        assert breaker.allow("example.com")
+
+    def test__allow__failed_trial_doubles_cooldown(self, fake_clock):
+        """Check that a failed trial opens the circuit again for twice as long."""
+        breaker = CircuitBreaker()
+        for _ in range(CircuitBreaker.MIN_CALLS):
+            breaker.report_failure("example.com")
+        fake_clock["now"] += CircuitBreaker.COOLDOWN
+        breaker.allow("example.com")
+
+        breaker.report_failure("example.com")
+        fake_clock["now"] += CircuitBreaker.COOLDOWN
+
+        assert not breaker.allow("example.com")
+        fake_clock["now"] += CircuitBreaker.COOLDOWN
+        assert breaker.allow("example.com")
@@ -0,0 +1,33 @@
+from datetime import date, datetime, timedelta, timezone
+
+
+class TestClock:
+    """Test class for Clock."""
+
+    def test__now__real_time_when_not_pinned(self, fresh_clock):
+        """Check that an unpinned clock shows the real current time."""
+        before = datetime.now(timezone.utc)
+
+        now = fresh_clock.now(timezone.utc)
+
+        assert before <= now <= datetime.now(timezone.utc)
+        assert fresh_clock.today() == date.today()
+
+    def test__now__pinned_moment_in_any_time_zone(self, fresh_clock):
+        """Check that a pinned clock keeps showing the pinned moment, aware or as naive local time."""
+        moment = datetime(2026, 3, 2, 23, 30, tzinfo=timezone.utc)
+        fresh_clock.pin(moment)
+
+        assert fresh_clock.now(timezone.utc) == moment
+        assert fresh_clock.now(timezone(timedelta(hours=2))) == moment
+        assert fresh_clock.now() == moment.astimezone().replace(tzinfo=None)
+        assert fresh_clock.today() == moment.astimezone().date()
+
+    def test__unpin__back_to_real_time(self, fresh_clock):
+        """Check that unpinning lets the clock run again."""
+        fresh_clock.pin(datetime(2020, 1, 1, tzinfo=timezone.utc))
+
+        fresh_clock.unpin()
+
+        assert fresh_clock.today() == date.today()
+        assert fresh_clock.pinned_at is None
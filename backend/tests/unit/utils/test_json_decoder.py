@@ -21,6 +21,7 @@ class TestJsonDecoder:
             "days_ahead": 30,
             "days_behind": None,
             "number_of_companies": 5,
+            "chart_engine": "png",
         }
         assert result[1].to_dict() == {
             "type": "news",
@@ -30,6 +31,7 @@ class TestJsonDecoder:
             "days_ahead": None,
             "days_behind": 1,
             "number_of_companies": 10,
+            "chart_engine": "png",
         }
         assert result[2].to_dict() == {
             "type": "price_performance",
@@ -39,6 +41,7 @@ class TestJsonDecoder:
             "days_ahead": None,
             "days_behind": 180,
             "number_of_companies": 3,
+            "chart_engine": "svg",
         }
         assert result[3].to_dict() == {
             "type": "insider_trades",
@@ -59,6 +62,7 @@ class TestJsonDecoder:
             "days_ahead": None,
             "days_behind": 30,
             "number_of_companies": 3,
+            "chart_engine": "png",
         }
         assert result[4].to_dict() == {
             "type": "analyst_ratings",
@@ -79,4 +83,5 @@ class TestJsonDecoder:
             "days_ahead": None,
             "days_behind": None,
             "number_of_companies": 3,
+            "chart_engine": "png",
         }
@@ -0,0 +1,35 @@
+from utils.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test class for KeywordMatcher."""
+
+    def test__find__returns_labels_of_contained_keywords(self):
+        """Check that find returns labels of every keyword contained in the text, and no others."""
+        matcher = KeywordMatcher(
+            [("merger", "event"), ("apple", "AAPL"), ("nvidia", "NVDA")]
+        )
+
+        assert matcher.find("apple announces merger") == {"event", "AAPL"}
+        assert matcher.find("nothing to see") == set()
+
+    def test__find__overlapping_and_nested_keywords_found(self):
+        """Check that keywords inside or overlapping other keywords are found, like substring checks would."""
+        keywords = ["acquire", "acquires", "quire", "t", "tsla", "she", "he", "hers"]
+        matcher = KeywordMatcher((keyword, keyword) for keyword in keywords)
+
+        assert matcher.find("tsla acquires ushers") == {
+            keyword for keyword in keywords if keyword in "tsla acquires ushers"
+        }
+
+    def test__find__same_label_for_many_keywords(self):
+        """Check that a label shared by more keywords is returned once when any of them is found."""
+        matcher = KeywordMatcher([("google", "GOOGL"), ("googl", "GOOGL")])
+
+        assert matcher.find("google search") == {"GOOGL"}
+
+    def test__find__empty_keyword_ignored(self):
+        """Check that an empty keyword doesn't match every text."""
+        matcher = KeywordMatcher([("", "empty")])
+
+        assert matcher.find("anything") == set()
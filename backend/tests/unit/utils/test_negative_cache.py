@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+import pytest
+
+from utils.enums.data_kind import DataKind
+from utils.negative_cache import NegativeCache
+
+
+class TestNegativeCache:
+    """Test class for NegativeCache."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        NegativeCache.clear()
+        yield
+        NegativeCache.clear()
+
+    @pytest.fixture
+    def fake_clock(self, monkeypatch):
+        clock = {"now": 1_000_000.0}
+        monkeypatch.setattr("utils.negative_cache.time.time", lambda: clock["now"])
+        return clock
+
+    def test__is_known_failure__failed_data_is_skipped_only_for_its_kind(
+        self, tmp_path, fake_clock
+    ):
+        """Check that a failure skips the same data of the same ticker, and nothing else."""
+        cache = NegativeCache(tmp_path / "failures.sqlite3")
+
+        cache.record_failure(DataKind.INFO, "TCK1")
+
+        assert cache.is_known_failure(DataKind.INFO, "TCK1")
+        assert not cache.is_known_failure(DataKind.CALENDAR, "TCK1")
+        assert not cache.is_known_failure(DataKind.INFO, "TCK2")
+        assert cache.skipped == 1
+
+    def test__is_known_failure__skip_time_grows_and_is_bounded(
+        self, tmp_path, fake_clock
+    ):
+        """Check that every repeated failure doubles the skip time, up to the maximum."""
+        cache = NegativeCache(tmp_path / "failures.sqlite3")
+        cache.record_failure(DataKind.INFO, "TCK1")
+        cache.record_failure(DataKind.INFO, "TCK1")
+
+        fake_clock["now"] += (NegativeCache.BASE_TTL * 2).total_seconds() - 1
+        assert cache.is_known_failure(DataKind.INFO, "TCK1")
+        fake_clock["now"] += 1
+        assert not cache.is_known_failure(DataKind.INFO, "TCK1")
+        assert NegativeCache.ttl(100) == NegativeCache.MAX_TTL
+        assert NegativeCache.ttl(1) == timedelta(hours=6)
+
+    def test__is_known_failure__failures_survive_a_new_instance(
+        self, tmp_path, fake_clock
+    ):
+        """Check that failures are kept on disk, so a later run skips them too."""
+        path = tmp_path / "failures.sqlite3"
+        NegativeCache(path).record_failure(DataKind.NEWS, "TCK1")
+        NegativeCache.clear()
+
+        assert NegativeCache(path).is_known_failure(DataKind.NEWS, "TCK1")
+
+    def test__record_success__forgets_failures(self, tmp_path, fake_clock):
+        """Check that successful data is not skipped anymore, also in a later run."""
+        path = tmp_path / "failures.sqlite3"
+        cache = NegativeCache(path)
+        cache.record_failure(DataKind.INFO, "TCK1")
+
+        cache.record_success(DataKind.INFO, "TCK1")
+        NegativeCache.clear()
+
+        assert not NegativeCache(path).is_known_failure(DataKind.INFO, "TCK1")
+
+    def test__set_bypass__nothing_is_skipped(self, tmp_path, fake_clock):
+        """Check that a bypassed cache lets every request through."""
+        cache = NegativeCache(tmp_path / "failures.sqlite3")
+        cache.record_failure(DataKind.INFO, "TCK1")
+
+        cache.set_bypass(True)
+
+        assert not cache.is_known_failure(DataKind.INFO, "TCK1")
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.news_article import NewsArticle
+from utils.news_index import NewsIndex
+
+
+def make_article(title: str, url: str) -> NewsArticle:
+    return NewsArticle(
+        title=title,
+        summary="summary",
+        pub_time=datetime.now(timezone.utc),
+        url=url,
+        ticker="AAPL",
+    )
+
+
+class TestNewsIndex:
+    """Test class for NewsIndex."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_index(self):
+        NewsIndex.clear()
+        yield
+        NewsIndex.clear()
+
+    @pytest.fixture
+    def next_day(self, fresh_clock):
+        """Pin the clock to a day, return a function that moves it to the next day."""
+        moment = datetime(2026, 3, 2, 15, 30, tzinfo=timezone.utc)
+        fresh_clock.pin(moment)
+        return lambda: fresh_clock.pin(moment + timedelta(days=1))
+
+    def test__is_reported__recorded_article_found_by_url_or_title(
+        self, tmp_path, next_day
+    ):
+        """Check that a recorded article is recognized by its URL, and by its title under another URL."""
+        index = NewsIndex(tmp_path / "news.sqlite3")
+        index.record([make_article("Apple acquires a startup", "https://a.com/1")])
+        next_day()
+
+        assert index.is_reported(make_article("Other title", "https://a.com/1"))
+        assert index.is_reported(
+            make_article("APPLE acquires a startup!", "https://b.com/2")
+        )
+        assert not index.is_reported(make_article("Other title", "https://b.com/3"))
+        assert index.dropped == 2
+
+    def test__is_reported__kept_between_runs(self, tmp_path, next_day):
+        """Check that reported articles are kept on disk, so a later run drops them too."""
+        path = tmp_path / "news.sqlite3"
+        NewsIndex(path).record([make_article("Apple merger", "https://a.com/1")])
+        NewsIndex.clear()
+        next_day()
+
+        assert NewsIndex(path).is_reported(
+            make_article("Apple merger", "https://a.com/1")
+        )
+
+    def test__is_reported__forgotten_after_retention(self, tmp_path, fresh_clock):
+        """Check that articles older than the retention period are forgotten, and deleted on the next start."""
+        path = tmp_path / "news.sqlite3"
+        article = make_article("Apple merger", "https://a.com/1")
+        moment = datetime(2026, 3, 2, 15, 30, tzinfo=timezone.utc)
+        fresh_clock.pin(moment)
+        NewsIndex(path).record([article])
+        NewsIndex.clear()
+        fresh_clock.pin(moment + NewsIndex.RETENTION + timedelta(seconds=1))
+
+        index = NewsIndex(path)
+
+        assert not index.is_reported(article)
+        with index._NewsIndex__connection as connection:
+            assert connection.execute("SELECT COUNT(*) FROM reported").fetchone() == (
+                0,
+            )
+
+    def test__set_bypass__every_article_is_new(self, tmp_path, next_day):
+        """Check that a bypassed index reports nothing as seen, but still records articles."""
+        index = NewsIndex(tmp_path / "news.sqlite3")
+        article = make_article("Apple merger", "https://a.com/1")
+        index.set_bypass(True)
+        index.record([article])
+        next_day()
+
+        assert not index.is_reported(article)
+        index.set_bypass(False)
+        assert index.is_reported(article)
+
+    def test__init__unwritable_path_falls_back_to_memory(self, tmp_path, next_day):
+        """Check that an index that can't be opened still works for the current process."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        index = NewsIndex(blocker / "news.sqlite3")
+        article = make_article("Apple merger", "https://a.com/1")
+
+        index.record([article])
+        next_day()
+
+        assert index.is_reported(article)
+
+    def test__is_reported__articles_of_the_same_day_are_kept(self, tmp_path, next_day):
+        """Check that articles reported today aren't dropped by a report generated again today, only the next day."""
+        index = NewsIndex(tmp_path / "news.sqlite3")
+        article = make_article("Apple merger", "https://a.com/1")
+        index.record([article])
+
+        assert not index.is_reported(article)
+        next_day()
+        assert index.is_reported(article)
@@ -0,0 +1,69 @@
+import pytest
+
+from utils.cassette import Cassette
+from utils.pooled_session import PooledSession
+from utils.stand_in_server import StandInServer
+
+URL = "https://api.groq.com/openai/v1/chat/completions"
+
+
+class TestPooledSession:
+    """Test class for PooledSession."""
+
+    @pytest.fixture
+    def recorded(self, cassette):
+        cassette.put(
+            Cassette.HTTP_CHANNEL,
+            Cassette.http_key("POST", URL, None, {"model": "m"}),
+            (200, "application/json", b'{"ok": true}'),
+        )
+        return cassette
+
+    def test__post__reuses_kept_alive_connection(self, recorded):
+        """Check that only the first request connects, later ones reuse its connection."""
+        session = PooledSession(pool_size=2, timeout=(5, 5))
+        with StandInServer(recorded) as server:
+            responses = [
+                session.post(
+                    f"{server.url}/openai/v1/chat/completions", json={"model": "m"}
+                )
+                for _ in range(3)
+            ]
+            session.close()
+
+        assert [response.json() for response in responses] == [{"ok": True}] * 3
+        assert session.sent == 3
+        mean_connect, max_connect = session.statistics()["connect"]
+        assert max_connect > 0
+        assert mean_connect == pytest.approx(max_connect / 3)
+
+    def test__statistics__split_latency_into_parts(self, recorded):
+        """Check that time to first byte includes server latency, and total time includes time to first byte."""
+        session = PooledSession(pool_size=1, timeout=(5, 5))
+        with StandInServer(recorded, latency=0.05) as server:
+            session.post(
+                f"{server.url}/openai/v1/chat/completions", json={"model": "m"}
+            )
+            session.close()
+
+        statistics = session.statistics()
+
+        assert set(statistics) == {"connect", "ttfb", "total"}
+        assert statistics["ttfb"][0] >= 0.05
+        assert (
+            statistics["total"][0] >= statistics["ttfb"][0] >= statistics["connect"][0]
+        )
+
+    def test__reset_statistics__forgets_latencies(self, recorded):
+        """Check that statistics are empty after a reset."""
+        session = PooledSession(pool_size=1, timeout=(5, 5))
+        with StandInServer(recorded) as server:
+            session.post(
+                f"{server.url}/openai/v1/chat/completions", json={"model": "m"}
+            )
+            session.close()
+
+        session.reset_statistics()
+
+        assert session.statistics() == {}
+        assert session.sent == 0
@@ -0,0 +1,190 @@
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from utils.price_store import PriceStore
+
+
+def make_closes(end: date, closes: list[float], tz: str | None = None) -> pd.Series:
+    index = pd.date_range(end=pd.Timestamp(end), periods=len(closes), freq="D", tz=tz)
+    return pd.Series(closes, index=index, dtype=float)
+
+
+class TestPriceStore:
+    """Test class for PriceStore."""
+
+    START = date(2026, 1, 1)
+    END = date(2026, 1, 11)
+
+    @pytest.fixture(autouse=True)
+    def store(self, tmp_path):
+        PriceStore.clear()
+        yield PriceStore(tmp_path / "prices.sqlite3")
+        PriceStore.clear()
+
+    def test__missing__unknown_ticker_needs_whole_window(self, store):
+        """Check that a ticker without stored prices misses the whole window."""
+        assert store.missing(["TCK1", "TCK2"], self.START, self.END) == {
+            (self.START, self.END): ["TCK1", "TCK2"]
+        }
+
+    def test__missing__only_days_since_previous_bar(self, store):
+        """Check that a stored ticker misses only days from its second to last bar on."""
+        store.merge(
+            "TCK1",
+            make_closes(date(2026, 1, 10), [1.0, 2.0, 3.0]),
+            self.START,
+            self.END,
+        )
+
+        assert store.missing(["TCK1"], self.START, date(2026, 1, 13)) == {
+            (date(2026, 1, 9), date(2026, 1, 13)): ["TCK1"]
+        }
+
+    def test__missing__longer_lookback_adds_older_range(self, store):
+        """Check that asking for days before the first covered day misses only those days."""
+        store.merge(
+            "TCK1", make_closes(date(2026, 1, 10), [1.0, 2.0]), self.START, self.END
+        )
+        older = self.START - timedelta(days=365)
+
+        missing = store.missing(["TCK1"], older, self.END)
+
+        assert (older, self.START) in missing
+        assert (date(2026, 1, 9), self.END) in missing
+
+    def test__missing__later_window_resumes_at_stored_history(self, store):
+        """Check that a window starting after the last stored day is downloaded from the stored history on."""
+        store.merge(
+            "TCK1", make_closes(date(2026, 1, 10), [1.0, 2.0]), self.START, self.END
+        )
+
+        assert store.missing(["TCK1"], date(2026, 3, 1), date(2026, 3, 11)) == {
+            (date(2026, 1, 9), date(2026, 3, 11)): ["TCK1"]
+        }
+
+    def test__merge__disjoint_range_leaves_gap_missing(self, store):
+        """Check that merging a range apart from the stored one doesn't mark the days in between as covered."""
+        store.merge(
+            "TCK1",
+            make_closes(date(2026, 1, 20), [1.0] * 20),
+            self.START,
+            date(2026, 1, 21),
+        )
+        store.merge(
+            "TCK1",
+            make_closes(date(2026, 3, 10), [2.0] * 10),
+            date(2026, 3, 1),
+            date(2026, 3, 11),
+        )
+
+        assert store.missing(["TCK1"], date(2026, 1, 10), date(2026, 3, 5)) != {}
+
+    def test__get__merged_prices_are_returned_by_day(self, store):
+        """Check that timezone aware prices are stored by day and returned in the window."""
+        store.merge(
+            "TCK1",
+            make_closes(date(2026, 1, 10), [1.0, 2.0, 3.0], tz="America/New_York"),
+            self.START,
+            self.END,
+        )
+
+        closes = store.get("TCK1", date(2026, 1, 9), self.END)
+
+        assert closes.tolist() == [2.0, 3.0]
+        assert closes.index[0] == pd.Timestamp("2026-01-09")
+
+    def test__merge__last_bar_is_replaced(self, store):
+        """Check that a bar stored before the market closed is replaced by the later download."""
+        store.merge(
+            "TCK1", make_closes(date(2026, 1, 10), [1.0, 2.0]), self.START, self.END
+        )
+        store.merge(
+            "TCK1",
+            make_closes(date(2026, 1, 11), [1.0, 2.5, 4.0]),
+            date(2026, 1, 9),
+            date(2026, 1, 12),
+        )
+
+        assert store.get("TCK1", self.START, date(2026, 1, 12)).tolist() == [
+            1.0,
+            2.5,
+            4.0,
+        ]
+
+    def test__merge__adjusted_prices_drop_stored_history(self, store):
+        """Check that a finished day that changed since it was stored drops the whole ticker."""
+        store.merge(
+            "TCK1",
+            make_closes(date(2026, 1, 10), [1.0, 2.0, 3.0]),
+            self.START,
+            self.END,
+        )
+
+        fresh = store.merge(
+            "TCK1",
+            make_closes(date(2026, 1, 11), [1.9, 2.9, 4.0]),
+            date(2026, 1, 9),
+            self.END,
+        )
+
+        assert not fresh
+        assert store.get("TCK1", self.START, self.END).empty
+        assert store.missing(["TCK1"], self.START, self.END) == {
+            (self.START, self.END): ["TCK1"]
+        }
+
+    def test__merge__empty_download_keeps_coverage(self, store):
+        """Check that a download without prices doesn't mark any days as covered."""
+        assert store.merge("TCK1", pd.Series(dtype=float), self.START, self.END)
+
+        assert store.missing(["TCK1"], self.START, self.END) == {
+            (self.START, self.END): ["TCK1"]
+        }
+
+    def test__set_bypass__whole_window_is_missing_and_overwritten(self, store):
+        """Check that a bypassed store asks for whole windows and overwrites changed prices."""
+        store.merge(
+            "TCK1", make_closes(date(2026, 1, 10), [1.0, 2.0]), self.START, self.END
+        )
+        store.set_bypass(True)
+
+        assert store.missing(["TCK1"], self.START, self.END) == {
+            (self.START, self.END): ["TCK1"]
+        }
+        assert store.merge(
+            "TCK1", make_closes(date(2026, 1, 10), [5.0, 6.0]), self.START, self.END
+        )
+        assert store.get("TCK1", self.START, self.END).tolist() == [5.0, 6.0]
+
+    def test__get__prices_survive_a_new_instance(self, tmp_path):
+        """Check that prices are kept on disk, so a later run can read them."""
+        path = tmp_path / "kept.sqlite3"
+        PriceStore.clear()
+        PriceStore(path).merge(
+            "TCK1", make_closes(date(2026, 1, 10), [1.0]), self.START, self.END
+        )
+        PriceStore.clear()
+
+        assert PriceStore(path).get("TCK1", self.START, self.END).tolist() == [1.0]
+
+    def test__matrix__tickers_aligned_by_day(self, store):
+        """Check that the matrix has a column for every stored day and a row for every ticker asked for."""
+        store.merge(
+            "TCK1",
+            make_closes(date(2026, 1, 10), [1.0, 2.0, 3.0]),
+            self.START,
+            self.END,
+        )
+        store.merge(
+            "TCK2", make_closes(date(2026, 1, 10), [5.0, 6.0]), self.START, self.END
+        )
+
+        matrix = store.matrix(["TCK2", "TCK3", "TCK1"], self.START, self.END)
+
+        assert matrix.tickers == ["TCK2", "TCK3", "TCK1"]
+        assert len(matrix.days) == 3
+        assert matrix.has_prices().tolist() == [True, False, True]
+        assert matrix.row(0).prices == [5.0, 6.0]
+        assert matrix.row(2).prices == [1.0, 2.0, 3.0]
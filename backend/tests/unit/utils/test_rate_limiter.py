@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from utils.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Test class for RateLimiter."""
+
+    @pytest.fixture(autouse=True)
+    def fake_clock(self, monkeypatch):
+        """Replace time, so waits are computed but never slept."""
+        clock = {"now": 1000.0, "slept": []}
+
+        def sleep(seconds):
+            clock["slept"].append(seconds)
+            clock["now"] += seconds
+
+        monkeypatch.setattr("utils.rate_limiter.time.monotonic", lambda: clock["now"])
+        monkeypatch.setattr("utils.rate_limiter.time.sleep", sleep)
+        RateLimiter.clear()
+        yield clock
+        RateLimiter.clear()
+
+    def test__acquire__burst_is_not_delayed(self, fake_clock):
+        """Check that requests up to the bucket capacity go out without waiting."""
+        limiter = RateLimiter()
+        rate, capacity = RateLimiter.DEFAULT_LIMIT
+
+        for _ in range(capacity):
+            limiter.acquire("example.com")
+
+        assert fake_clock["slept"] == []
+
+    def test__acquire__requests_after_burst_are_paced(self, fake_clock):
+        """Check that once the burst is used, every request waits for one token at the host rate."""
+        limiter = RateLimiter()
+        rate, capacity = RateLimiter.DEFAULT_LIMIT
+
+        for _ in range(capacity + 3):
+            limiter.acquire("example.com")
+
+        assert fake_clock["slept"] == pytest.approx([1 / rate] * 3)
+
+    def test__acquire__hosts_have_separate_buckets(self, fake_clock):
+        """Check that using up the tokens of one host doesn't delay another host."""
+        limiter = RateLimiter()
+        _, capacity = RateLimiter.DEFAULT_LIMIT
+        for _ in range(capacity):
+            limiter.acquire("example.com")
+
+        limiter.acquire("other.com")
+
+        assert fake_clock["slept"] == []
+
+    def test__report_throttled__halves_rate_and_success_raises_it(self, fake_clock):
+        """Check that the rate decreases multiplicatively and recovers additively."""
+        limiter = RateLimiter()
+        rate, _ = RateLimiter.DEFAULT_LIMIT
+
+        limiter.report_throttled("example.com")
+        assert limiter.rate("example.com") == pytest.approx(rate / 2)
+
+        limiter.report_success("example.com")
+        assert limiter.rate("example.com") == pytest.approx(
+            rate / 2 + rate * RateLimiter.INCREASE_FRACTION
+        )
+
+        for _ in range(100):
+            limiter.report_success("example.com")
+        assert limiter.rate("example.com") == pytest.approx(rate)
+
+    def test__report_throttled__retry_after_blocks_host(self, fake_clock):
+        """Check that the next request waits at least as long as the host asked."""
+        limiter = RateLimiter()
+
+        limiter.report_throttled("example.com", retry_after=30)
+        limiter.acquire("example.com")
+
+        assert fake_clock["slept"][0] >= 30
+
+    def test__acquire_async__waits_on_event_loop(self, fake_clock, monkeypatch):
+        """Check that the async variant waits with asyncio.sleep instead of blocking."""
+        waits = []
+
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+
+        monkeypatch.setattr("utils.rate_limiter.asyncio.sleep", fake_sleep)
+        limiter = RateLimiter()
+        limiter.report_throttled("example.com", retry_after=5)
+
+        asyncio.run(limiter.acquire_async("example.com"))
+
+        assert waits and waits[0] >= 5
+        assert fake_clock["slept"] == []
+
+    def test__parse_retry_after__only_seconds_are_understood(self):
+        """Check that Retry-After in seconds is parsed and other values are ignored."""
+        assert RateLimiter.parse_retry_after("12") == 12.0
+        assert RateLimiter.parse_retry_after(None) is None
+        assert RateLimiter.parse_retry_after("Wed, 21 Oct 2026 07:28:00 GMT") is None
+
+    def test__report_remaining__used_up_limit_blocks_until_reset(self, fake_clock):
+        """Check that a host saying its limit is used up blocks requests until the limit resets."""
+        limiter = RateLimiter()
+
+        limiter.report_remaining("example.com", remaining=0, reset=12.5)
+        limiter.acquire("example.com")
+
+        assert fake_clock["slept"] == pytest.approx([12.5])
+
+    def test__report_remaining__enough_left_does_not_block(self, fake_clock):
+        """Check that requests aren't delayed while more than needed remains."""
+        limiter = RateLimiter()
+
+        limiter.report_remaining("example.com", remaining=5000, reset=30, needed=1000)
+        limiter.report_remaining("example.com", remaining=None, reset=30)
+        limiter.acquire("example.com")
+
+        assert fake_clock["slept"] == []
+
+    def test__parse_duration__numbers_and_durations_are_understood(self):
+        """Check that reset headers are parsed both as plain seconds and as durations."""
+        assert RateLimiter.parse_duration("7") == 7.0
+        assert RateLimiter.parse_duration("7.66s") == pytest.approx(7.66)
+        assert RateLimiter.parse_duration("2m59.56s") == pytest.approx(179.56)
+        assert RateLimiter.parse_duration("1h2m") == 3720.0
+        assert RateLimiter.parse_duration("120ms") == pytest.approx(0.12)
+        assert RateLimiter.parse_duration("soon") is None
+        assert RateLimiter.parse_duration(None) is None
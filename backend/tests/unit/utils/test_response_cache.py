@@ -0,0 +1,111 @@
+import time
+
+import pandas as pd
+import pytest
+
+from utils.enums.data_kind import DataKind
+from utils.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test class for ResponseCache."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        ResponseCache.clear()
+        yield
+        ResponseCache.clear()
+
+    def test__get__stored_response_is_returned(self, tmp_path):
+        """Check that a stored response is found and equal to what was stored."""
+        cache = ResponseCache(tmp_path / "responses.sqlite3")
+        frame = pd.DataFrame({"Close": [1.0, 2.0]})
+
+        cache.put(DataKind.HISTORY, "('TCK1',)", frame)
+        found, value = cache.get(DataKind.HISTORY, "('TCK1',)")
+
+        assert found
+        pd.testing.assert_frame_equal(value, frame)
+
+    def test__get__missing_response_is_a_miss(self, tmp_path):
+        """Check that an unknown key returns not found and counts a miss."""
+        cache = ResponseCache(tmp_path / "responses.sqlite3")
+
+        assert cache.get(DataKind.INFO, "('TCK1',)") == (False, None)
+        assert cache.hits == 0
+        assert cache.misses == 1
+
+    def test__get__responses_survive_a_new_instance(self, tmp_path):
+        """Check that responses are kept on disk, so a later run can read them."""
+        path = tmp_path / "responses.sqlite3"
+        ResponseCache(path).put(DataKind.INFO, "('TCK1',)", {"shortName": "Acme"})
+        ResponseCache.clear()
+
+        found, value = ResponseCache(path).get(DataKind.INFO, "('TCK1',)")
+
+        assert found
+        assert value == {"shortName": "Acme"}
+
+    def test__get__expired_response_is_a_miss(self, tmp_path, monkeypatch):
+        """Check that a response older than the time to live of its kind isn't returned."""
+        cache = ResponseCache(tmp_path / "responses.sqlite3")
+        cache.put(DataKind.NEWS, "('TCK1',)", [{"id": 1}])
+        ttl = ResponseCache.TTLS[DataKind.NEWS].total_seconds()
+        now = time.time()
+        monkeypatch.setattr("utils.response_cache.time.time", lambda: now + ttl + 1)
+
+        assert cache.get(DataKind.NEWS, "('TCK1',)") == (False, None)
+
+    def test__get__ttl_depends_on_data_kind(self, tmp_path, monkeypatch):
+        """Check that after an hour prices are expired while company information isn't."""
+        cache = ResponseCache(tmp_path / "responses.sqlite3")
+        cache.put(DataKind.INFO, "('TCK1',)", {"shortName": "Acme"})
+        cache.put(DataKind.HISTORY, "('TCK1',)", pd.DataFrame())
+        now = time.time()
+        monkeypatch.setattr("utils.response_cache.time.time", lambda: now + 3600)
+
+        assert cache.get(DataKind.INFO, "('TCK1',)")[0]
+        assert not cache.get(DataKind.HISTORY, "('TCK1',)")[0]
+
+    def test__set_bypass__reads_miss_but_writes_are_kept(self, tmp_path):
+        """Check that bypassing the cache ignores stored responses but still refreshes them."""
+        cache = ResponseCache(tmp_path / "responses.sqlite3")
+        cache.put(DataKind.INFO, "('TCK1',)", {"shortName": "Old"})
+
+        cache.set_bypass(True)
+        assert cache.get(DataKind.INFO, "('TCK1',)") == (False, None)
+        cache.put(DataKind.INFO, "('TCK1',)", {"shortName": "New"})
+
+        cache.set_bypass(False)
+        assert cache.get(DataKind.INFO, "('TCK1',)") == (True, {"shortName": "New"})
+
+    def test__statistics__counts_hits_and_misses_per_kind(self, tmp_path):
+        """Check that statistics are kept per data kind, and can be reset."""
+        cache = ResponseCache(tmp_path / "responses.sqlite3")
+        cache.put(DataKind.INFO, "('TCK1',)", {})
+        cache.get(DataKind.INFO, "('TCK1',)")
+        cache.get(DataKind.INFO, "('TCK2',)")
+        cache.get(DataKind.NEWS, "('TCK1',)")
+
+        assert cache.statistics() == {DataKind.INFO: (1, 1), DataKind.NEWS: (0, 1)}
+
+        cache.reset_statistics()
+        assert cache.statistics() == {}
+
+    def test__put__unpicklable_response_is_skipped(self, tmp_path):
+        """Check that a response which can't be stored is skipped instead of raising."""
+        cache = ResponseCache(tmp_path / "responses.sqlite3")
+
+        cache.put(DataKind.INFO, "('TCK1',)", lambda: None)
+
+        assert cache.get(DataKind.INFO, "('TCK1',)") == (False, None)
+
+    def test__init__unusable_path_behaves_like_empty_cache(self, tmp_path):
+        """Check that a cache that can't be opened doesn't raise, and never finds anything."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = ResponseCache(blocker / "responses.sqlite3")
+
+        cache.put(DataKind.INFO, "('TCK1',)", {})
+
+        assert cache.get(DataKind.INFO, "('TCK1',)") == (False, None)
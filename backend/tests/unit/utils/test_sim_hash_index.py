@@ -0,0 +1,44 @@
+from utils.sim_hash_index import SimHashIndex
+
+STORY = (
+    "Alphabet agrees to acquire cybersecurity firm Wiz for $32 billion. Google parent Alphabet said "
+    "on Tuesday it will buy the cloud security company Wiz in an all-cash deal, its largest "
+    "acquisition ever, as it doubles down on cloud computing."
+)
+
+
+class TestSimHashIndex:
+    """Test class for SimHashIndex."""
+
+    def test__add_if_new__identical_text_is_duplicate(self):
+        """Check that the same text added twice is recognized the second time."""
+        index = SimHashIndex()
+
+        assert index.add_if_new(STORY)
+        assert not index.add_if_new(STORY)
+
+    def test__add_if_new__slightly_edited_text_is_duplicate(self):
+        """Check that a syndicated copy with a few changed words is a near-duplicate."""
+        index = SimHashIndex()
+        edited = STORY.replace("it will buy the", "it would buy").upper()
+
+        index.add_if_new(STORY)
+
+        assert not index.add_if_new(edited)
+
+    def test__add_if_new__different_stories_are_new(self):
+        """Check that unrelated stories are all added."""
+        index = SimHashIndex()
+        stories = [
+            STORY,
+            "Nvidia unveils new AI chips at its annual developer conference, shares rise.",
+            "Apple to acquire AI startup for $2 billion",
+            "Microsoft names new chief financial officer after surprise departure",
+        ]
+
+        assert all(index.add_if_new(story) for story in stories)
+
+    def test__distance__counts_differing_bits(self):
+        """Check that distance is the number of differing bits."""
+        assert SimHashIndex.distance(0b1011, 0b0001) == 2
+        assert SimHashIndex.distance(5, 5) == 0
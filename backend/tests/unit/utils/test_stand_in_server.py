@@ -0,0 +1,74 @@
+import pickle
+import time
+
+import pytest
+import requests
+
+from utils.cassette import Cassette
+from utils.stand_in_server import StandInServer
+
+
+class TestStandInServer:
+    """Test class for StandInServer."""
+
+    def test__answer__serves_recorded_hub_response(self, cassette):
+        """Check that a response recorded through the data hub is served pickled."""
+        cassette.put("info", "('TCK1',)", {"shortName": "Acme"})
+
+        with StandInServer(cassette) as server:
+            response = requests.get(
+                f"{server.url}/cassette/info", params={"key": "('TCK1',)"}, timeout=5
+            )
+
+        assert response.status_code == 200
+        assert pickle.loads(response.content) == {"shortName": "Acme"}
+        assert server.served == 1
+
+    def test__answer__serves_recorded_http_response(self, cassette):
+        """Check that a recorded HTTP response is served for the same request, whatever the host."""
+        cassette.put(
+            Cassette.HTTP_CHANNEL,
+            Cassette.http_key(
+                "POST",
+                "https://api.groq.com/openai/v1/chat/completions",
+                None,
+                {"model": "m"},
+            ),
+            (200, "application/json", b'{"ok": true}'),
+        )
+
+        with StandInServer(cassette) as server:
+            response = requests.post(
+                f"{server.url}/openai/v1/chat/completions",
+                json={"model": "m"},
+                timeout=5,
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+        assert response.headers["Content-Type"] == "application/json"
+
+    def test__answer__unrecorded_request_is_not_found(self, cassette):
+        """Check that a request that wasn't recorded gets 404 and is counted as missed."""
+        with StandInServer(cassette) as server:
+            response = requests.get(f"{server.url}/v8/finance/chart/TCK1", timeout=5)
+
+        assert response.status_code == 404
+        assert server.missed == 1
+
+    def test__answer__crumb_is_always_available(self, cassette):
+        """Check that yahoo crumb is answered even though it is never recorded."""
+        with StandInServer(cassette) as server:
+            response = requests.get(f"{server.url}/v1/test/getcrumb", timeout=5)
+
+        assert response.text == StandInServer.REPLAY_CRUMB
+
+    @pytest.mark.parametrize("latency", [0.2])
+    def test__answer__latency_is_injected(self, cassette, latency):
+        """Check that every answer is delayed by the configured latency."""
+        with StandInServer(cassette, latency=latency) as server:
+            started = time.perf_counter()
+            requests.get(f"{server.url}/v1/test/getcrumb", timeout=5)
+            elapsed = time.perf_counter() - started
+
+        assert elapsed >= latency
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from utils import constants
+from utils.ticker_executor import TickerExecutor
+
+
+class TestTickerExecutor:
+    """Test class for TickerExecutor."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_executor(self):
+        TickerExecutor.clear()
+        yield
+        TickerExecutor.clear()
+
+    def test__map__results_keep_ticker_order(self):
+        """Check that map returns results in the order of the given tickers, not in order of completion."""
+        executor = TickerExecutor(4)
+
+        def fetch(ticker):
+            time.sleep(0.01 * (5 - int(ticker[-1])))
+            return ticker.lower()
+
+        result = executor.map(fetch, ["TCK1", "TCK2", "TCK3", "TCK4"])
+
+        assert result == ["tck1", "tck2", "tck3", "tck4"]
+
+    def test__map__tickers_are_fetched_in_parallel(self):
+        """Check that map runs multiple fetches at the same time."""
+        executor = TickerExecutor(4)
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fetch(ticker):
+            barrier.wait()
+            return ticker
+
+        assert executor.map(fetch, ["A", "B", "C", "D"]) == ["A", "B", "C", "D"]
+
+    def test__map__exception_is_reraised(self):
+        """Check that an exception raised while fetching a ticker reaches the caller."""
+        executor = TickerExecutor(2)
+
+        def fetch(ticker):
+            raise ValueError(ticker)
+
+        with pytest.raises(ValueError, match="TCK1"):
+            executor.map(fetch, ["TCK1"])
+
+    def test__map_unordered__results_yielded_in_order_of_completion(self):
+        """Check that map_unordered yields a result as soon as its ticker is done."""
+        executor = TickerExecutor(4)
+        slow_started = threading.Event()
+        release = threading.Event()
+
+        def fetch(ticker):
+            if ticker == "SLOW":
+                slow_started.set()
+                release.wait(5)
+            return ticker
+
+        results = executor.map_unordered(fetch, ["SLOW", "FAST"])
+
+        assert next(results) == "FAST"
+        assert slow_started.is_set()
+        release.set()
+        assert list(results) == ["SLOW"]
+
+    def test__map_unordered__exception_is_reraised(self):
+        """Check that an exception raised while fetching a ticker reaches the iterating caller."""
+        executor = TickerExecutor(2)
+
+        def fetch(ticker):
+            raise ValueError(ticker)
+
+        with pytest.raises(ValueError, match="TCK1"):
+            list(executor.map_unordered(fetch, ["TCK1"]))
+
+    def test__init__invalid_worker_count__uses_default(self):
+        """Check that a non positive worker count falls back to the default one."""
+        executor = TickerExecutor(0)
+
+        assert executor.max_workers == constants.MAX_FETCH_WORKERS
+
+    def test__init__worker_count_read_from_environment(self, monkeypatch):
+        """Check that without a given worker count, JINANCE_FETCH_WORKERS sets it, and an invalid one is ignored."""
+        monkeypatch.setenv("JINANCE_FETCH_WORKERS", "3")
+        configured = TickerExecutor().max_workers
+        TickerExecutor.clear()
+        monkeypatch.setenv("JINANCE_FETCH_WORKERS", "many")
+        invalid = TickerExecutor().max_workers
+
+        assert configured == 3
+        assert invalid == constants.MAX_FETCH_WORKERS
+
+    def test__shutdown__no_new_work_accepted(self):
+        """Check that the executor refuses work after it is shut down."""
+        executor = TickerExecutor(1)
+        executor.shutdown()
+
+        with pytest.raises(RuntimeError):
+            executor.map(str, ["TCK1"])
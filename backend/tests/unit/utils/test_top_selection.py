@@ -0,0 +1,43 @@
+from utils.top_selection import TopSelection
+
+
+class TestTopSelection:
+    """Test class for TopSelection."""
+
+    def test__largest_smallest__same_as_ends_of_stable_descending_sort(self):
+        """Check that the selection matches the first and last items of a stable descending sort, ties included."""
+        items = [("A", 3), ("B", 1), ("C", 3), ("D", 2), ("E", 1), ("F", 3), ("G", 1)]
+        selection = TopSelection(2, key=lambda item: item[1])
+
+        selection.extend(items)
+
+        ranking = sorted(items, key=lambda item: item[1], reverse=True)
+        assert selection.largest() == ranking[:2]
+        assert selection.smallest() == ranking[-2:]
+
+    def test__push__keeps_only_size_items_per_end(self):
+        """Check that the heaps stay bounded, whatever the number of pushed items."""
+        selection = TopSelection(3, key=lambda item: item)
+
+        selection.extend(range(10_000))
+
+        assert selection.largest() == [9999, 9998, 9997]
+        assert selection.smallest() == [2, 1, 0]
+
+    def test__push__fewer_items_than_size_returns_all(self):
+        """Check that all items are returned when fewer than size were pushed."""
+        selection = TopSelection(5, key=lambda item: item)
+
+        selection.extend([2, 7, 4])
+
+        assert selection.largest() == [7, 4, 2]
+        assert selection.smallest() == [7, 4, 2]
+
+    def test__push__zero_size_keeps_nothing(self):
+        """Check that a selection of size 0 returns no items."""
+        selection = TopSelection(0, key=lambda item: item)
+
+        selection.extend([1, 2])
+
+        assert selection.largest() == []
+        assert selection.smallest() == []